@@ -17,6 +17,7 @@ between the API and document processing logic.
 Key Components:
     - main: FastAPI application and HTTP endpoint definitions
     - job_manager: Job lifecycle and pipeline execution coordinator
+    - middleware: Rate limiting and API key enforcement
     - models: Pydantic models for request/response validation
     - configuration: Config loading and merging logic
     - utils: Filesystem and string utilities
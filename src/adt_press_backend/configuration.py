@@ -19,37 +19,74 @@ Configuration Strategy:
 
 from __future__ import annotations
 
+import copy
+import importlib.util
+import re
+from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, cast
 
-from omegaconf import DictConfig, OmegaConf
+import orjson
+from omegaconf import DictConfig, ListConfig, OmegaConf
 
 from .models import ConfigMetadata
 
 # Find the current module's location for relative path resolution
 _HERE = Path(__file__).resolve()
 
-# Search up to 5 parent directories for config/config.yaml
-# This supports local development with the repo checked out alongside this backend
-_CANDIDATE_CONFIG_PATHS = [parent / "config/config.yaml" for parent in _HERE.parents[:5]]
-
-# Also try to find config from installed adt_press package
-try:
-    import adt_press  # type: ignore
-
-    _CANDIDATE_CONFIG_PATHS.append(Path(adt_press.__file__).resolve().parents[1] / "config/config.yaml")
-except ModuleNotFoundError:
-    # adt_press not installed as package; rely on local development paths
-    pass
-
-# Determine the actual config path at module load time
-CONFIG_PATH = next((path for path in _CANDIDATE_CONFIG_PATHS if path.exists()), None)
-if CONFIG_PATH is None:
-    raise FileNotFoundError(
-        "Default config.yaml could not be located. "
-        "Ensure adt-press is installed as a package or checked out alongside adt-backend."
-    )
+
+@lru_cache(maxsize=1)
+def _discover_config_path() -> Path:
+    """
+    Locate config.yaml on first use and cache the result.
+
+    Searches up to 5 parent directories for config/config.yaml (local development
+    with the repo checked out alongside this backend), then the installed
+    adt_press package. Discovery is deferred until the configuration is first
+    needed, so importing this module performs no filesystem probing.
+
+    Returns:
+        Path to the first config.yaml that exists
+
+    Raises:
+        FileNotFoundError: If no candidate location contains config.yaml
+    """
+    candidates = [parent / "config/config.yaml" for parent in _HERE.parents[:5]]
+
+    # Also try to find config from installed adt_press package. find_spec only
+    # locates the package; it does not execute adt_press or its dependencies.
+    try:
+        spec = importlib.util.find_spec("adt_press")
+    except (ModuleNotFoundError, ValueError):
+        # ValueError: adt_press is in sys.modules without a __spec__
+        spec = None
+    if spec is not None and spec.origin:
+        candidates.append(Path(spec.origin).resolve().parents[1] / "config/config.yaml")
+    # Otherwise adt_press is not installed as a package; rely on local development paths
+
+    config_path = next((path for path in candidates if path.exists()), None)
+    if config_path is None:
+        raise FileNotFoundError(
+            "Default config.yaml could not be located. "
+            "Ensure adt-press is installed as a package or checked out alongside adt-backend."
+        )
+    return config_path
+
+
+def get_config_path() -> Path:
+    """
+    Get the path of the default config.yaml.
+
+    Returns:
+        Path to the discovered config.yaml
+
+    Raises:
+        FileNotFoundError: If config.yaml could not be located
+    """
+    return _discover_config_path()
+
 
 # Available processing strategies for each pipeline stage
 # These define the valid values for strategy configuration options
@@ -92,30 +129,79 @@ def _load_default_config() -> DictConfig:
     Note:
         The cache is process-local. Configuration changes require a server restart.
     """
-    if not CONFIG_PATH.exists():
-        raise FileNotFoundError(f"Default config not found at {CONFIG_PATH}")
-    return OmegaConf.load(CONFIG_PATH)
+    config_path = get_config_path()
+    if not config_path.exists():
+        raise FileNotFoundError(f"Default config not found at {config_path}")
+    return OmegaConf.load(config_path)
 
 
-def get_default_config_container(resolve: bool = False) -> Dict[str, Any]:
+@lru_cache(maxsize=2)
+def _default_config_container(resolve: bool) -> Dict[str, Any]:
     """
-    Get the default configuration as a standard Python dictionary.
+    Convert the default configuration to a dictionary once per resolve mode.
+
+    Args:
+        resolve: Whether variable interpolations should be resolved
+
+    Returns:
+        Cached dictionary shared by all callers; it must not be mutated
+    """
+    config = _load_default_config()
+    return OmegaConf.to_container(config, resolve=resolve, enum_to_str=True)  # type: ignore[return-value]
+
+
+def get_default_config_container(resolve: bool = False) -> Mapping[str, Any]:
+    """
+    Get the default configuration as a read-only mapping.
 
     Args:
         resolve: If True, resolve all variable interpolations in the config.
                 If False, keep interpolations as-is (e.g., "${other_key}").
 
     Returns:
-        Dictionary representation of the configuration
+        Read-only mapping view of the configuration
 
     Note:
         Setting resolve=True expands all OmegaConf variable references,
         which is useful for providing complete resolved values to clients.
+        The conversion is cached per resolve mode and nested containers are
+        shared between callers, so use copy.deepcopy() before mutating them.
     """
-    config = _load_default_config()
-    return OmegaConf.to_container(config, resolve=resolve, enum_to_str=True)  # type: ignore[return-value]
+    return MappingProxyType(_default_config_container(resolve))
+
+
+@lru_cache(maxsize=1)
+def _struct_base_config() -> DictConfig:
+    """
+    Build the struct-mode base configuration used for merging overrides.
+
+    Returns:
+        Private copy of the default config with struct mode enabled
+
+    Note:
+        OmegaConf.merge copies its first argument, so this object is never
+        modified by callers and can be reused for every job.
+    """
+    base = copy.deepcopy(_load_default_config())
+    # Enable struct mode to prevent unknown configuration keys
+    OmegaConf.set_struct(base, True)
+    return base
+
+
+@lru_cache(maxsize=1)
+def get_render_strategies() -> tuple[str, ...]:
+    """
+    Get the valid render strategy names, sorted and computed once.
+
+    Returns:
+        Tuple of strategy names from config.yaml plus the built-in "dynamic"
+    """
+    defaults = _default_config_container(False)
+    # Include "dynamic" as a built-in render strategy option
+    return tuple(sorted({"dynamic", *defaults.get("render_strategies", {})}))
 
 
+@lru_cache(maxsize=1)
 def build_config_metadata() -> ConfigMetadata:
     """
     Build configuration metadata for API clients.
@@ -132,13 +218,16 @@ def build_config_metadata() -> ConfigMetadata:
     Note:
         "dynamic" is always included as a render strategy even if not
         explicitly defined in config.yaml, as it's a built-in option.
+        The result is cached; config.yaml is immutable for the process lifetime.
+        The model is built with model_construct() around the shared cached
+        defaults, skipping validation of a payload that OmegaConf already
+        produced and avoiding a deep copy of the defaults.
     """
-    defaults = get_default_config_container(resolve=False)
-    # Include "dynamic" as a built-in render strategy option
-    render_strategies = sorted(set(["dynamic", *list(defaults.get("render_strategies", {}).keys())]))
+    defaults = _default_config_container(False)
+    render_strategies = list(get_render_strategies())
     layout_types = defaults.get("layout_types", {})
 
-    return ConfigMetadata(
+    return ConfigMetadata.model_construct(
         defaults=defaults,
         strategies=STRATEGY_OPTIONS,
         render_strategies=render_strategies,
@@ -148,6 +237,25 @@ def build_config_metadata() -> ConfigMetadata:
     )
 
 
+@lru_cache(maxsize=1)
+def build_config_metadata_json() -> bytes:
+    """
+    Serialize the configuration metadata to JSON once and cache the bytes.
+
+    Returns:
+        UTF-8 encoded JSON representation of build_config_metadata()
+
+    Note:
+        Serving these bytes directly skips Pydantic serialization on every
+        /config/defaults request.
+    """
+    return orjson.dumps(build_config_metadata().model_dump(mode="json"))
+
+
+# Override keys whose values have arbitrary keys of their own (section IDs)
+_DYNAMIC_KEYS = ("edit_sections", "regenerate_sections")
+
+
 def make_runtime_config(overrides: Dict[str, Any]) -> DictConfig:
     """
     Create a runtime configuration by merging user overrides with defaults.
@@ -159,7 +267,8 @@ def make_runtime_config(overrides: Dict[str, Any]) -> DictConfig:
     4. Returns the final configuration for pipeline execution
 
     Args:
-        overrides: User-provided configuration values to override defaults
+        overrides: User-provided configuration values to override defaults;
+            the dictionary itself is not modified
 
     Returns:
         Merged DictConfig ready for pipeline execution
@@ -170,28 +279,140 @@ def make_runtime_config(overrides: Dict[str, Any]) -> DictConfig:
 
     Note:
         Setting struct=True provides protection against typos in configuration
-        keys by raising errors for undefined parameters.
+        keys by raising errors for undefined parameters. Every call returns a
+        new DictConfig, since the pipeline owns and may modify its config.
     """
-    # Load base configuration and convert to container for manipulation
-    base_container = OmegaConf.to_container(_load_default_config(), resolve=False)
-    base = OmegaConf.create(base_container)
-
-    # Enable struct mode to prevent unknown configuration keys
-    OmegaConf.set_struct(base, True)
+    base = _struct_base_config()
 
     # Extract dynamic dict fields that have arbitrary keys (like section IDs)
     # These must be handled separately to avoid struct mode rejecting unknown keys
-    dynamic_fields = {}
-    for key in ["edit_sections", "regenerate_sections"]:
-        if key in overrides:
-            dynamic_fields[key] = overrides.pop(key)
-
-    # Create config from user overrides and merge with base
-    cli_config = OmegaConf.create(overrides)
-    merged = DictConfig(OmegaConf.merge(base, cli_config))
+    overrides = dict(overrides)
+    dynamic_fields = {key: overrides.pop(key) for key in _DYNAMIC_KEYS if key in overrides}
+
+    if overrides:
+        # Create config from user overrides and merge with base
+        cli_config = OmegaConf.create(overrides)
+        merged = cast(DictConfig, OmegaConf.merge(base, cli_config))
+    else:
+        # Nothing to merge: a private copy of the cached base is equivalent
+        # and skips building and walking an empty override tree
+        merged = copy.deepcopy(base)
 
     # Re-add dynamic fields after merge (bypassing struct mode)
     for key, value in dynamic_fields.items():
         OmegaConf.update(merged, key, value, force_add=True)
 
     return merged
+
+
+# Matches one "${...}" interpolation without nested interpolations
+_INTERPOLATION_PATTERN = re.compile(r"\$\{([^${}]*)\}")
+
+
+def _interpolation_roots(value: Any) -> Optional[set[str]]:
+    """
+    Find the top-level keys an unresolved config value interpolates.
+
+    Args:
+        value: A value from the unresolved default configuration
+
+    Returns:
+        Top-level keys referenced anywhere in value, or None if it uses an
+        interpolation whose target can't be determined statically (relative
+        references, resolvers such as ${oc.env:...}, or nesting)
+    """
+    if isinstance(value, str):
+        if "${" not in value:
+            return set()
+        bodies = _INTERPOLATION_PATTERN.findall(value)
+        if len(bodies) != value.count("${"):
+            return None
+        roots = set()
+        for body in bodies:
+            if not body or body.startswith(".") or ":" in body:
+                return None
+            roots.add(body.split(".", 1)[0].split("[", 1)[0])
+        return roots
+    if isinstance(value, (dict, list)):
+        roots = set()
+        for item in value.values() if isinstance(value, dict) else value:
+            item_roots = _interpolation_roots(item)
+            if item_roots is None:
+                return None
+            roots |= item_roots
+        return roots
+    return set()
+
+
+@lru_cache(maxsize=1)
+def _default_key_dependencies() -> Dict[str, Optional[frozenset[str]]]:
+    """
+    Map each top-level default key to the keys its resolved value depends on.
+
+    Dependencies are followed transitively, so a key interpolating another
+    interpolated key depends on everything that key depends on.
+
+    Returns:
+        Dependencies per key; None when they can't be determined
+    """
+    defaults = _default_config_container(False)
+    direct = {key: _interpolation_roots(value) for key, value in defaults.items()}
+
+    dependencies: Dict[str, Optional[frozenset[str]]] = {}
+    for key in direct:
+        closure: set[str] = set()
+        pending = [key]
+        known = True
+        while pending:
+            roots = direct.get(pending.pop(), set())
+            if roots is None:
+                known = False
+                break
+            new_roots = roots - closure
+            closure |= new_roots
+            pending.extend(new_roots)
+        dependencies[key] = frozenset(closure) if known else None
+    return dependencies
+
+
+def resolve_runtime_config(config: DictConfig, override_keys: AbstractSet[str]) -> Dict[str, Any]:
+    """
+    Resolve a runtime configuration to a plain dictionary.
+
+    Equivalent to OmegaConf.to_container(config, resolve=True,
+    enum_to_str=True) for configs built by make_runtime_config(), but only
+    walks the keys that can differ from the defaults: overridden keys and
+    keys whose interpolations reach an overridden key. Every other key,
+    including interpolated ones the overrides don't affect, reuses the
+    cached resolved defaults.
+
+    Args:
+        config: Configuration returned by make_runtime_config()
+        override_keys: Top-level keys present in the overrides it was given
+
+    Returns:
+        Resolved configuration; values taken from the defaults are shared
+        with the cache and must not be mutated
+    """
+    dependencies = _default_key_dependencies()
+    defaults = _default_config_container(True)
+
+    resolved: Dict[str, Any] = {}
+    for key in config:
+        depends_on = dependencies.get(key)
+        if (
+            key not in override_keys
+            and depends_on is not None
+            and depends_on.isdisjoint(override_keys)
+        ):
+            resolved[key] = defaults[key]
+        elif OmegaConf.is_missing(config, key):
+            resolved[key] = "???"
+        else:
+            value = config[key]
+            if isinstance(value, (DictConfig, ListConfig)):
+                value = OmegaConf.to_container(value, resolve=True, enum_to_str=True)
+            elif isinstance(value, Enum):
+                value = value.name
+            resolved[key] = value
+    return resolved
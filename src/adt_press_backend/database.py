@@ -5,171 +5,647 @@ This module provides a simple SQLite-based persistence layer for job records,
 ensuring jobs survive server restarts.
 """
 
-import json
+import atexit
+import logging
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .models import JobStatus
+import orjson
 
+from .models import STATUS_BY_VALUE, JobStatus
+
+logger = logging.getLogger(__name__)
 
 # Default database path
 DEFAULT_DB_PATH = Path("data/jobs.db")
 
+# Schema version stored in PRAGMA user_version; bump when adding a migration
+SCHEMA_VERSION = 6
+
+# Maximum number of queued events written in one transaction
+EVENT_BATCH_SIZE = 50
+
+# Columns of the jobs table, in schema order
+_JOB_COLUMNS = (
+    "id", "display_label", "effective_label", "status", "created_at", "updated_at",
+    "pdf_filename", "pdf_path", "output_dir", "plate_path", "zip_path", "s3_key", "error",
+)
+
+# JSON configuration columns, stored in the job_configs side table
+_CONFIG_COLUMNS = ("submitted_overrides", "overrides", "resolved_config")
+
 
 def _ensure_db_dir(db_path: Path) -> None:
     """Ensure the database directory exists."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _serialize_datetime(dt: datetime) -> str:
-    """Serialize datetime to ISO format string."""
-    return dt.isoformat() if dt else None
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _serialize_datetime(dt: Optional[Union[datetime, int]]) -> Optional[int]:
+    """Serialize datetime to integer microseconds since the Unix epoch."""
+    if dt is None or isinstance(dt, int):
+        # Integers are already epoch microseconds
+        return dt
+    if dt.tzinfo is None:
+        # Naive datetimes are UTC throughout this package
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _now_epoch_us() -> int:
+    """Current time as integer microseconds since the Unix epoch, without a datetime."""
+    return time.time_ns() // 1000
 
 
-def _deserialize_datetime(s: str) -> Optional[datetime]:
-    """Deserialize ISO format string to datetime."""
-    if not s:
+def _deserialize_datetime(value: Optional[int]) -> Optional[datetime]:
+    """Deserialize epoch microseconds to a timezone-aware UTC datetime."""
+    if value is None:
         return None
-    return datetime.fromisoformat(s)
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _iso_to_epoch_us(value: Any) -> Any:
+    """Convert a legacy ISO timestamp column value to epoch microseconds."""
+    if not isinstance(value, str):
+        return value
+    return _serialize_datetime(datetime.fromisoformat(value))
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string for a TEXT column."""
+    return orjson.dumps(value).decode()
+
+
+# Columns that may change after a job has been inserted
+_UPDATABLE_COLUMNS = frozenset({
+    "status", "updated_at", "plate_path", "zip_path", "s3_key", "error",
+})
+
+
+def _create_jobs_table(conn: sqlite3.Connection, table: str = "jobs") -> None:
+    """
+    Create the jobs table with the current schema if it does not exist.
+
+    The table is WITHOUT ROWID: rows are stored in the primary key B-tree, so
+    lookups by job ID touch one tree instead of the id index plus the table.
+    Bulky configuration JSON lives in job_configs, keeping these rows small.
+    """
+    statuses = ", ".join(f"'{status.value}'" for status in JobStatus)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            display_label TEXT NOT NULL,
+            effective_label TEXT NOT NULL,
+            status TEXT NOT NULL CHECK (status IN ({statuses})),
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL,
+            pdf_filename TEXT NOT NULL,
+            pdf_path TEXT NOT NULL,
+            output_dir TEXT NOT NULL,
+            plate_path TEXT,
+            zip_path TEXT,
+            s3_key TEXT,
+            error TEXT
+        ) WITHOUT ROWID
+    """)
+
+
+def _create_job_configs_table(conn: sqlite3.Connection) -> None:
+    """Create the job_configs side table if it does not exist."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_configs (
+            job_id TEXT PRIMARY KEY,
+            submitted_overrides TEXT,
+            overrides TEXT,
+            resolved_config TEXT,
+            FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+        )
+    """)
+
+
+def _create_job_events_table(conn: sqlite3.Connection, table: str = "job_events") -> None:
+    """
+    Create the job_events table with the current schema if it does not exist.
+
+    Events are keyed by (job_id, seq), where seq is the event's position in
+    the job's log. The table is WITHOUT ROWID, so a job's events are stored
+    contiguously in key order and read back without a separate index.
+    """
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            job_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            message TEXT NOT NULL,
+            PRIMARY KEY (job_id, seq),
+            FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+
+
+def _update_statement(job_id: str, fields: Dict[str, Any]) -> tuple[str, List[Any]]:
+    """Build a parameterized UPDATE for the given job columns."""
+    unknown = fields.keys() - _UPDATABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Cannot update job columns: {sorted(unknown)}")
+
+    assignments = ", ".join(f"{column} = ?" for column in fields)
+    values = [_encode_column(column, value) for column, value in fields.items()]
+    values.append(job_id)
+    return f"UPDATE jobs SET {assignments} WHERE id = ?", values
+
+
+def _encode_json(value: Any) -> str:
+    """Encode a configuration value as JSON, passing pre-encoded strings through."""
+    return value if isinstance(value, str) else _dumps(value)
+
+
+def _encode_column(column: str, value: Any) -> Any:
+    """Convert a job field value to its SQLite column representation."""
+    if value is None:
+        return None
+    if column == "status":
+        return STATUS_BY_VALUE[value].value
+    if column in ("created_at", "updated_at"):
+        return _serialize_datetime(value)
+    if column in ("plate_path", "zip_path"):
+        return str(value)
+    return value
 
 
 class JobDatabase:
     """
     SQLite database for job persistence.
 
-    Thread-safe: SQLite handles concurrent access with WAL mode.
+    Thread-safe: SQLite handles concurrent access with WAL mode. Each thread
+    keeps its own long-lived connection, so PRAGMAs are applied once per
+    connection rather than on every call.
+
+    SQL for the hot paths is kept in class-level constants so every call
+    passes the identical string and hits the connection's prepared
+    statement cache instead of being re-parsed and re-planned.
     """
 
+    _INSERT_JOB_SQL = f"""
+        INSERT INTO jobs ({", ".join(_JOB_COLUMNS)})
+        VALUES ({", ".join("?" for _ in _JOB_COLUMNS)})
+    """
+    _INSERT_CONFIG_SQL = f"""
+        INSERT INTO job_configs (job_id, {", ".join(_CONFIG_COLUMNS)}) VALUES (?, ?, ?, ?)
+    """
+    # Parameters: (job_id, timestamp, message, job_id); seq is the next
+    # position in the job's log, found through the primary key
+    _INSERT_EVENT_SQL = """
+        INSERT INTO job_events (job_id, seq, timestamp, message)
+        SELECT ?, COALESCE(MAX(seq), -1) + 1, ?, ?
+        FROM job_events WHERE job_id = ?
+    """
+    _SELECT_JOB_SQL = "SELECT * FROM jobs WHERE id = ?"
+    _SELECT_JOB_WITH_CONFIG_SQL = f"""
+        SELECT jobs.*, {", ".join(f"c.{column}" for column in _CONFIG_COLUMNS)}
+        FROM jobs LEFT JOIN job_configs AS c ON c.job_id = jobs.id
+        WHERE jobs.id = ?
+    """
+    _SELECT_JOB_EVENTS_SQL = """
+        SELECT timestamp, message FROM job_events
+        WHERE job_id = ? ORDER BY seq
+    """
+    _LIST_JOBS_SQL = "SELECT * FROM jobs ORDER BY created_at DESC"
+    _LIST_JOBS_WITH_CONFIG_SQL = f"""
+        SELECT jobs.*, {", ".join(f"c.{column}" for column in _CONFIG_COLUMNS)}
+        FROM jobs LEFT JOIN job_configs AS c ON c.job_id = jobs.id
+        ORDER BY jobs.created_at DESC
+    """
+    _LIST_EVENTS_SQL = """
+        SELECT job_id, timestamp, message FROM job_events
+        ORDER BY job_id, seq
+    """
+    _LIST_SUMMARY_SQL = """
+        SELECT id, display_label, effective_label, status,
+               created_at, updated_at, pdf_filename
+        FROM jobs ORDER BY created_at DESC
+    """
+    _DELETE_JOB_SQL = "DELETE FROM jobs WHERE id = ?"
+
     def __init__(self, db_path: Path = DEFAULT_DB_PATH):
         self.db_path = db_path
+        self._local = threading.local()
         _ensure_db_dir(db_path)
         self._init_db()
 
+        # Background writer that group-commits queued job events
+        self._event_queue: queue.Queue = queue.Queue()
+        self._event_writer = threading.Thread(
+            target=self._write_queued_events, name="job-event-writer", daemon=True
+        )
+        self._event_writer.start()
+        atexit.register(self.flush_events)
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get (or open) the connection owned by the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: transactions are only opened explicitly
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=30.0,
+                isolation_level=None,
+                cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            # NORMAL is durable across application crashes in WAL mode and
+            # skips the fsync on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
     @contextmanager
-    def _get_connection(self):
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+    def _get_connection(self, begin: Optional[str] = None):
+        """
+        Get the thread's database connection.
+
+        Args:
+            begin: Transaction mode to open around the block: "IMMEDIATE" for
+                multi-statement writes (takes the write lock up front instead
+                of upgrading mid-transaction), "DEFERRED" for multi-statement
+                reads that need a consistent snapshot, or None to run each
+                statement in autocommit mode (single statements and pure reads,
+                which WAL serves without taking locks).
+        """
+        conn = self._thread_connection()
+        if begin is None:
+            yield conn
+            return
+
+        conn.execute(f"BEGIN {begin}")
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
             raise
-        finally:
+
+    def close(self) -> None:
+        """Close the current thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
     def _init_db(self) -> None:
-        """Initialize database schema."""
-        with self._get_connection() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id TEXT PRIMARY KEY,
-                    display_label TEXT NOT NULL,
-                    effective_label TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    pdf_filename TEXT NOT NULL,
-                    pdf_path TEXT NOT NULL,
-                    submitted_overrides TEXT,
-                    overrides TEXT,
-                    resolved_config TEXT,
-                    output_dir TEXT NOT NULL,
-                    plate_path TEXT,
-                    zip_path TEXT,
-                    s3_key TEXT,
-                    error TEXT,
-                    events TEXT
-                )
-            """)
+        """
+        Initialize database schema, migrating older databases in place.
+
+        Foreign keys are disabled while the schema is set up so that table
+        rebuilds during migration do not cascade deletes into job_events.
+        """
+        conn = self._thread_connection()
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            with self._get_connection("IMMEDIATE"):
+                existing = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+                ).fetchone()
+
+                _create_jobs_table(conn)
+                _create_job_configs_table(conn)
+                _create_job_events_table(conn)
+
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if existing and version < SCHEMA_VERSION:
+                    self._migrate(conn, version)
+
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_jobs_created_at
+                    ON jobs(created_at DESC)
+                """)
+
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_jobs_status_created
+                    ON jobs(status, created_at DESC)
+                """)
+
+                # Appending an event refreshes the job's updated_at, so
+                # add_job_event is a single INSERT statement. MAX() keeps a
+                # late-flushed queued event from moving updated_at backwards.
+                conn.execute("DROP TRIGGER IF EXISTS trg_job_events_touch_job")
+                conn.execute("""
+                    CREATE TRIGGER trg_job_events_touch_job
+                    AFTER INSERT ON job_events
+                    BEGIN
+                        UPDATE jobs SET updated_at = MAX(updated_at, NEW.timestamp)
+                        WHERE id = NEW.job_id;
+                    END
+                """)
+
+                if version < SCHEMA_VERSION:
+                    # Fresh or migrated schema: give the planner statistics
+                    conn.execute("ANALYZE")
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
+        conn.execute("PRAGMA optimize")
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_created_at
-                ON jobs(created_at DESC)
+    def _migrate(self, conn: sqlite3.Connection, version: int) -> None:
+        """
+        Upgrade an existing database from the given schema version.
+
+        Args:
+            conn: Connection inside the schema initialization transaction
+            version: Current PRAGMA user_version of the database
+        """
+        if version < 1:
+            # Move the legacy events JSON column into job_events
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "events" in columns:
+                conn.execute("""
+                    INSERT INTO job_events (job_id, seq, timestamp, message)
+                    SELECT jobs.id,
+                           e.key,
+                           json_extract(e.value, '$.timestamp'),
+                           json_extract(e.value, '$.message')
+                    FROM jobs, json_each(COALESCE(jobs.events, '[]')) AS e
+                    ORDER BY jobs.id, e.key
+                """)
+                conn.execute("ALTER TABLE jobs DROP COLUMN events")
+
+        # The event trigger references jobs and would block renaming a rebuilt
+        # table; _init_db() recreates it after migrating
+        conn.execute("DROP TRIGGER IF EXISTS trg_job_events_touch_job")
+
+        conn.create_function(
+            "iso_to_epoch_us", 1, _iso_to_epoch_us, deterministic=True
+        )
+
+        if version < 5:
+            # Move configuration JSON into the job_configs side table
+            conn.execute(f"""
+                INSERT OR REPLACE INTO job_configs (job_id, {", ".join(_CONFIG_COLUMNS)})
+                SELECT id, {", ".join(_CONFIG_COLUMNS)} FROM jobs
             """)
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_status
-                ON jobs(status)
+            # Rebuild jobs with the current schema: adds the status CHECK
+            # constraint (v2, also dropping the old idx_jobs_status index),
+            # converts ISO text timestamps to epoch microseconds (v3),
+            # switches to a WITHOUT ROWID table (v4) and drops the
+            # configuration columns (v5)
+            self._rebuild_jobs_table(conn, {
+                "created_at": "iso_to_epoch_us(created_at)",
+                "updated_at": "iso_to_epoch_us(updated_at)",
+            })
+
+        if version < 6:
+            # Rebuild job_events with the current schema: converts ISO text
+            # timestamps to epoch microseconds (v3) and keys events by
+            # (job_id, seq) in a WITHOUT ROWID table (v6, replacing the
+            # idx_job_events_job_ts index)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(job_events)")}
+            seq = (
+                "seq" if "seq" in columns
+                else "ROW_NUMBER() OVER (PARTITION BY job_id ORDER BY rowid) - 1"
+            )
+            conn.execute("DROP TABLE IF EXISTS job_events_new")
+            _create_job_events_table(conn, "job_events_new")
+            conn.execute(f"""
+                INSERT INTO job_events_new (job_id, seq, timestamp, message)
+                SELECT job_id, {seq}, iso_to_epoch_us(timestamp), message
+                FROM job_events
             """)
+            conn.execute("DROP TABLE job_events")
+            conn.execute("ALTER TABLE job_events_new RENAME TO job_events")
 
-    def save_job(self, job_data: Dict[str, Any]) -> None:
+    def _rebuild_jobs_table(
+        self,
+        conn: sqlite3.Connection,
+        conversions: Optional[Dict[str, str]] = None,
+    ) -> None:
         """
-        Save or update a job record.
+        Recreate the jobs table with the current schema, keeping all rows.
 
         Args:
-            job_data: Dictionary with job fields
+            conn: Connection inside the schema initialization transaction
+            conversions: SQL expressions used instead of plain column copies,
+                keyed by column name
+
+        Note:
+            Indexes on jobs are dropped with the old table and recreated by
+            _init_db() afterwards.
         """
-        with self._get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO jobs (
-                    id, display_label, effective_label, status,
-                    created_at, updated_at, pdf_filename, pdf_path,
-                    submitted_overrides, overrides, resolved_config,
-                    output_dir, plate_path, zip_path, s3_key, error, events
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        conversions = conversions or {}
+        columns = ", ".join(_JOB_COLUMNS)
+        values = ", ".join(conversions.get(column, column) for column in _JOB_COLUMNS)
+        conn.execute("DROP TABLE IF EXISTS jobs_new")
+        _create_jobs_table(conn, "jobs_new")
+        conn.execute(f"INSERT INTO jobs_new ({columns}) SELECT {values} FROM jobs")
+        conn.execute("DROP TABLE jobs")
+        conn.execute("ALTER TABLE jobs_new RENAME TO jobs")
+
+    def insert_job(self, job_data: Dict[str, Any]) -> None:
+        """
+        Insert a new job record with all of its columns.
+
+        This is called once per job at registration time. Subsequent changes
+        go through update_job_fields(), which only writes the columns that
+        actually changed.
+
+        Args:
+            job_data: Dictionary with job fields; configuration fields may be
+                dicts or pre-encoded JSON strings
+        """
+        with self._get_connection("IMMEDIATE") as conn:
+            conn.execute(self._INSERT_JOB_SQL, (
                 job_data["id"],
                 job_data["display_label"],
                 job_data["effective_label"],
-                job_data["status"],
+                _encode_column("status", job_data["status"]),
                 _serialize_datetime(job_data["created_at"]),
                 _serialize_datetime(job_data["updated_at"]),
                 job_data["pdf_filename"],
                 str(job_data["pdf_path"]),
-                json.dumps(job_data.get("submitted_overrides", {})),
-                json.dumps(job_data.get("overrides", {})),
-                json.dumps(job_data.get("resolved_config", {})),
                 str(job_data["output_dir"]),
-                str(job_data["plate_path"]) if job_data.get("plate_path") else None,
-                str(job_data["zip_path"]) if job_data.get("zip_path") else None,
+                _encode_column("plate_path", job_data.get("plate_path")),
+                _encode_column("zip_path", job_data.get("zip_path")),
                 job_data.get("s3_key"),
                 job_data.get("error"),
-                json.dumps([
-                    {"timestamp": _serialize_datetime(e["timestamp"]), "message": e["message"]}
-                    for e in job_data.get("events", [])
-                ]),
             ))
+            conn.execute(self._INSERT_CONFIG_SQL, (
+                job_data["id"],
+                _encode_json(job_data.get("submitted_overrides", {})),
+                _encode_json(job_data.get("overrides", {})),
+                _encode_json(job_data.get("resolved_config", {})),
+            ))
+            conn.executemany(
+                self._INSERT_EVENT_SQL,
+                [
+                    (job_data["id"], _serialize_datetime(e["timestamp"]), e["message"], job_data["id"])
+                    for e in job_data.get("events", [])
+                ],
+            )
+
+    def update_job_fields(self, job_id: str, **fields: Any) -> None:
+        """
+        Update only the given columns of an existing job.
+
+        Args:
+            job_id: The job ID
+            **fields: Column values to write (status, updated_at, plate_path,
+                zip_path, s3_key, error)
+
+        Raises:
+            ValueError: If a field is not an updatable column
+
+        Note:
+            Configuration columns are immutable after insert_job() and are
+            deliberately not updatable, so they are never re-serialized.
+        """
+        if not fields:
+            return
+
+        sql, values = _update_statement(job_id, fields)
+        with self._get_connection() as conn:
+            conn.execute(sql, values)
+
+    def update_jobs_bulk(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Apply field updates for several jobs in a single transaction.
+
+        Args:
+            updates: Mapping of job ID to the columns to write for that job
+                (same columns as update_job_fields())
+
+        Raises:
+            ValueError: If any field is not an updatable column
 
-    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        Note:
+            All updates share one commit, so a batch of status changes
+            costs one WAL sync instead of one per job.
+        """
+        statements = [
+            _update_statement(job_id, fields)
+            for job_id, fields in updates.items()
+            if fields
+        ]
+        if not statements:
+            return
+
+        with self._get_connection("IMMEDIATE") as conn:
+            for sql, values in statements:
+                conn.execute(sql, values)
+
+    def get_job(
+        self,
+        job_id: str,
+        include_events: bool = True,
+        include_configs: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieve a job by ID.
 
         Args:
             job_id: The job ID
+            include_events: Whether to load the job's event log
+            include_configs: Whether to load the configuration JSON
 
         Returns:
-            Job data dictionary or None if not found
+            Job data dictionary or None if not found; configuration fields
+            are empty dicts when include_configs is False
         """
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM jobs WHERE id = ?", (job_id,)
-            ).fetchone()
+        self.flush_events()
+        sql = self._SELECT_JOB_WITH_CONFIG_SQL if include_configs else self._SELECT_JOB_SQL
+        with self._get_connection("DEFERRED" if include_events else None) as conn:
+            row = conn.execute(sql, (job_id,)).fetchone()
 
             if not row:
                 return None
 
-            return self._row_to_dict(row)
+            job = self._row_to_dict(row, include_configs)
+            if include_events:
+                job["events"] = self.get_job_events(job_id)
+            return job
+
+    def get_job_events(self, job_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve a job's events in chronological order.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            List of event dictionaries with timestamp and message
+        """
+        self.flush_events()
+        with self._get_connection() as conn:
+            rows = conn.execute(self._SELECT_JOB_EVENTS_SQL, (job_id,)).fetchall()
+
+            return [_row_to_event(row) for row in rows]
 
-    def list_jobs(self) -> List[Dict[str, Any]]:
+    def list_jobs(
+        self,
+        include_events: bool = True,
+        include_configs: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
         List all jobs ordered by creation time (newest first).
 
+        Args:
+            include_events: Whether to load each job's event log
+            include_configs: Whether to load each job's configuration JSON
+
         Returns:
             List of job data dictionaries
         """
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM jobs ORDER BY created_at DESC"
-            ).fetchall()
+        self.flush_events()
+        sql = self._LIST_JOBS_WITH_CONFIG_SQL if include_configs else self._LIST_JOBS_SQL
+        with self._get_connection("DEFERRED" if include_events else None) as conn:
+            rows = conn.execute(sql).fetchall()
+            jobs = [self._row_to_dict(row, include_configs) for row in rows]
+
+            if include_events:
+                # One pass over job_events instead of a query per job
+                by_id = {job["id"]: job for job in jobs}
+                for row in conn.execute(self._LIST_EVENTS_SQL):
+                    job = by_id.get(row["job_id"])
+                    if job is not None:
+                        job["events"].append(_row_to_event(row))
+
+            return jobs
+
+    def list_jobs_summary(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over lightweight job rows ordered by creation time (newest first).
 
-            return [self._row_to_dict(row) for row in rows]
+        Only the columns needed for list views are selected, so the stored
+        configuration JSON is never read or decoded.
+
+        Yields:
+            Dictionaries with id, display_label, effective_label, status,
+            created_at, updated_at and pdf_filename, one row at a time
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(self._LIST_SUMMARY_SQL)
+            for row in cursor:
+                yield {
+                    "id": row["id"],
+                    "display_label": row["display_label"],
+                    "effective_label": row["effective_label"],
+                    "status": row["status"],
+                    "created_at": _deserialize_datetime(row["created_at"]),
+                    "updated_at": _deserialize_datetime(row["updated_at"]),
+                    "pdf_filename": row["pdf_filename"],
+                }
 
     def update_job_status(
         self,
@@ -191,7 +667,7 @@ class JobDatabase:
         """
         with self._get_connection() as conn:
             updates = ["status = ?", "updated_at = ?"]
-            values = [status, _serialize_datetime(datetime.utcnow())]
+            values = [status, _now_epoch_us()]
 
             if error is not None:
                 updates.append("error = ?")
@@ -212,33 +688,98 @@ class JobDatabase:
                 values
             )
 
-    def add_job_event(self, job_id: str, message: str) -> None:
+    def add_job_event(
+        self,
+        job_id: str,
+        message: str,
+        timestamp: Optional[Union[datetime, int]] = None,
+    ) -> None:
         """
         Add an event to a job's event log.
 
         Args:
             job_id: The job ID
             message: Event message
+            timestamp: Event time as a datetime or epoch microseconds
+                (default: current UTC time)
+
+        Note:
+            Events live in the append-only job_events table, so an append is
+            a single cached INSERT regardless of how many events the job
+            already has. The next seq is found through the (job_id, seq)
+            primary key, and a trigger refreshes the job's updated_at in the
+            same statement.
         """
+        timestamp = _now_epoch_us() if timestamp is None else _serialize_datetime(timestamp)
+
         with self._get_connection() as conn:
-            # Get current events
-            row = conn.execute(
-                "SELECT events FROM jobs WHERE id = ?", (job_id,)
-            ).fetchone()
+            conn.execute(self._INSERT_EVENT_SQL, (job_id, timestamp, message, job_id))
 
-            if not row:
-                return
+    def queue_job_event(
+        self,
+        job_id: str,
+        message: str,
+        timestamp: Optional[Union[datetime, int]] = None,
+    ) -> None:
+        """
+        Queue an event for the background writer and return immediately.
 
-            events = json.loads(row["events"] or "[]")
-            events.append({
-                "timestamp": _serialize_datetime(datetime.utcnow()),
-                "message": message,
-            })
+        Args:
+            job_id: The job ID
+            message: Event message
+            timestamp: Event time as a datetime or epoch microseconds
+                (default: current UTC time)
+
+        Note:
+            Events queued while a batch is being written are committed
+            together in the next transaction (up to EVENT_BATCH_SIZE), so
+            bursts of pipeline events share one commit instead of paying one
+            each. Reads through this class call flush_events() first.
+        """
+        timestamp = _now_epoch_us() if timestamp is None else _serialize_datetime(timestamp)
+        self._event_queue.put((job_id, timestamp, message, job_id))
+
+    def flush_events(self) -> None:
+        """Block until every queued event has been written."""
+        if threading.current_thread() is not self._event_writer:
+            self._event_queue.join()
+
+    def _write_queued_events(self) -> None:
+        """Background loop writing queued events in batched transactions."""
+        while True:
+            batch = [self._event_queue.get()]
+            # Coalesce whatever else is already waiting, without delaying
+            while len(batch) < EVENT_BATCH_SIZE:
+                try:
+                    batch.append(self._event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._insert_events(batch)
+            except Exception:
+                logger.exception(f"Failed to write {len(batch)} queued job events")
+            finally:
+                for _ in batch:
+                    self._event_queue.task_done()
+
+    def _insert_events(self, batch: List[tuple]) -> None:
+        """
+        Insert a batch of _INSERT_EVENT_SQL parameter rows in one transaction.
 
-            conn.execute(
-                "UPDATE jobs SET events = ?, updated_at = ? WHERE id = ?",
-                (json.dumps(events), _serialize_datetime(datetime.utcnow()), job_id)
-            )
+        If the batch violates a constraint (e.g. an event for a deleted job),
+        rows are retried individually so one bad event does not drop the rest.
+        """
+        try:
+            with self._get_connection("IMMEDIATE") as conn:
+                conn.executemany(self._INSERT_EVENT_SQL, batch)
+        except sqlite3.IntegrityError:
+            with self._get_connection("IMMEDIATE") as conn:
+                for row in batch:
+                    try:
+                        conn.execute(self._INSERT_EVENT_SQL, row)
+                    except sqlite3.IntegrityError as e:
+                        logger.warning(f"Dropping event for job {row[0]}: {e}")
 
     def delete_job(self, job_id: str) -> bool:
         """
@@ -250,21 +791,19 @@ class JobDatabase:
         Returns:
             True if deleted, False if not found
         """
+        self.flush_events()
         with self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            cursor = conn.execute(self._DELETE_JOB_SQL, (job_id,))
             return cursor.rowcount > 0
 
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        """Convert a database row to a job data dictionary."""
-        events_raw = json.loads(row["events"] or "[]")
-        events = [
-            {
-                "timestamp": _deserialize_datetime(e["timestamp"]),
-                "message": e["message"],
-            }
-            for e in events_raw
-        ]
+    def _row_to_dict(self, row: sqlite3.Row, include_configs: bool = True) -> Dict[str, Any]:
+        """
+        Convert a database row to a job data dictionary (events empty).
 
+        Path columns are returned as plain strings; callers that touch the
+        filesystem wrap them in Path themselves. Configuration fields are
+        decoded only when the row was joined with job_configs.
+        """
         return {
             "id": row["id"],
             "display_label": row["display_label"],
@@ -273,14 +812,23 @@ class JobDatabase:
             "created_at": _deserialize_datetime(row["created_at"]),
             "updated_at": _deserialize_datetime(row["updated_at"]),
             "pdf_filename": row["pdf_filename"],
-            "pdf_path": Path(row["pdf_path"]),
-            "submitted_overrides": json.loads(row["submitted_overrides"] or "{}"),
-            "overrides": json.loads(row["overrides"] or "{}"),
-            "resolved_config": json.loads(row["resolved_config"] or "{}"),
-            "output_dir": Path(row["output_dir"]),
-            "plate_path": Path(row["plate_path"]) if row["plate_path"] else None,
-            "zip_path": Path(row["zip_path"]) if row["zip_path"] else None,
+            "pdf_path": row["pdf_path"],
+            **{
+                column: orjson.loads(row[column] or "{}") if include_configs else {}
+                for column in _CONFIG_COLUMNS
+            },
+            "output_dir": row["output_dir"],
+            "plate_path": row["plate_path"],
+            "zip_path": row["zip_path"],
             "s3_key": row["s3_key"],
             "error": row["error"],
-            "events": events,
+            "events": [],
         }
+
+
+def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
+    """Convert a job_events row to an event dictionary."""
+    return {
+        "timestamp": _deserialize_datetime(row["timestamp"]),
+        "message": row["message"],
+    }
@@ -14,16 +14,27 @@ between user requests, configuration management, and pipeline execution.
 
 from __future__ import annotations
 
-import json
-from concurrent.futures import ThreadPoolExecutor
+import atexit
+import hashlib
+import mmap
+import multiprocessing
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Literal, Mapping, Optional
 
+import orjson
 from omegaconf import DictConfig, OmegaConf
+from pydantic import TypeAdapter
 
 # Import the ADT Press pipeline runner
 # Try package import first, fall back to local development path
@@ -43,11 +54,101 @@ except ModuleNotFoundError:
 
     from adt_press.pipeline import run_pipeline  # type: ignore
 
-from .configuration import build_config_metadata, make_runtime_config
+from .configuration import (
+    build_config_metadata,
+    build_config_metadata_json,
+    make_runtime_config,
+    resolve_runtime_config,
+)
 from .database import JobDatabase
-from .models import ConfigMetadata, JobDetail, JobEvent, JobStatus, JobSummary
-from .s3_service import upload_to_s3, zip_directory
-from .utils import ensure_directory, sanitize_label
+from .models import (
+    STATUS_BY_VALUE,
+    ConfigMetadata,
+    JobDetail,
+    JobEvent,
+    JobStatus,
+    JobSummary,
+    trusted_builder,
+)
+from .s3_service import is_s3_configured, stream_zip_to_s3, zip_directory
+from .utils import ensure_directory, sanitize_label, write_file
+
+
+# orjson options for job JSON: plate data may carry numpy values or
+# non-string keys, and files on disk are indented for readability
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_JSON_FILE_OPTIONS = _JSON_OPTIONS | orjson.OPT_INDENT_2
+
+# Serializer for the job list, built once rather than per request
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[JobSummary])
+
+# Validation-free constructors for summaries and details built from a
+# record's own, already-typed fields
+_build_job_summary = trusted_builder(JobSummary)
+_build_job_detail = trusted_builder(JobDetail)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a timezone-aware datetime to integer microseconds since the epoch."""
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the epoch to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the pending-job limit is reached."""
+
+
+# Most recent events kept in memory per job; the database keeps the full log
+MAX_EVENTS_IN_MEMORY = 1024
+
+
+# Number of plate files whose bytes are kept in memory for repeated loads
+PLATE_CACHE_SIZE = 16
+
+
+def _run_pipeline_from_yaml(config_yaml: str) -> None:
+    """
+    Run the pipeline in a worker process from a YAML-serialized config.
+
+    The config travels as YAML rather than a pickled DictConfig; any
+    interpolations are resolved in the worker exactly as they would be in
+    the server process.
+    """
+    run_pipeline(OmegaConf.create(config_yaml))
+
+
+def _pipeline_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the start method for pipeline worker processes.
+
+    forkserver avoids forking the server's threads and open connections;
+    spawn is the fallback where it is unavailable.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _json_etag(body: bytes) -> str:
+    """A strong ETag for a JSON body, derived from its content."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _new_event_log(events: Iterable[tuple[int, str]] = ()) -> deque[tuple[int, str]]:
+    """Create a job's bounded in-memory event log."""
+    return deque(events, maxlen=MAX_EVENTS_IN_MEMORY)
+
+
+def _events_to_db(events: Iterable[tuple[int, str]]) -> list[Dict[str, Any]]:
+    """Convert job events to the dictionaries expected by JobDatabase."""
+    return [{"timestamp": ts, "message": message} for ts, message in events]
 
 
 @dataclass
@@ -71,11 +172,19 @@ class JobRecord:
         submitted_overrides: Configuration values submitted by user
         overrides: Effective overrides including auto-injected values (label, pdf_path)
         runtime_config: OmegaConf configuration object for pipeline
-        resolved_config: Final resolved configuration as dictionary
+        resolved_config: Final resolved configuration as a read-only mapping
         output_dir: Directory where job outputs are stored
         plate_path: Path to plate.json if available
         error: Error message if job failed
-        events: Chronological list of job lifecycle events
+        events: Most recent job lifecycle events as (epoch microseconds,
+            message) pairs, bounded by MAX_EVENTS_IN_MEMORY; converted to
+            JobEvent on demand
+        config_json: JSON encodings of the configuration fields, keyed by
+            database column; computed once since they never change
+        output_dir_str: output_dir as a string, for summaries
+        default_plate_path: Where the pipeline writes plate.json
+        default_zip_path: Where a local archive of the output is written
+        lock: Guards multi-step mutations of this record
     """
 
     id: str
@@ -89,13 +198,86 @@ class JobRecord:
     submitted_overrides: Dict[str, Any]
     overrides: Dict[str, Any]
     runtime_config: DictConfig
-    resolved_config: Dict[str, Any]
+    resolved_config: Mapping[str, Any]
     output_dir: Path
     plate_path: Optional[Path] = None
     zip_path: Optional[Path] = None
     s3_key: Optional[str] = None
     error: Optional[str] = None
-    events: list[JobEvent] = field(default_factory=list)
+    events: deque[tuple[int, str]] = field(default_factory=_new_event_log)
+    config_json: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # Derived paths, computed once in __post_init__
+    output_dir_str: str = field(init=False, repr=False)
+    default_plate_path: Path = field(init=False, repr=False)
+    default_zip_path: Path = field(init=False, repr=False)
+    lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+    # Cached to_summary()/to_detail() results and the state version each was
+    # built from
+    _version: int = field(default=0, init=False, repr=False)
+    _summary: Optional[tuple[int, JobSummary]] = field(default=None, init=False, repr=False)
+    _detail: Optional[tuple[int, JobDetail]] = field(default=None, init=False, repr=False)
+    # Cached encoded detail and status responses with their ETags
+    _detail_json: Optional[tuple[int, bytes, str]] = field(default=None, init=False, repr=False)
+    _status_json: Optional[tuple[int, bytes, str]] = field(default=None, init=False, repr=False)
+    # JobEvent models for the events in the last detail, keyed by event, so
+    # each event's timestamp is converted to a datetime only once
+    _event_models: Dict[tuple[int, str], JobEvent] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # output_dir with symlinks resolved; computed on first use
+    _resolved_output_dir: Optional[Path] = field(default=None, init=False, repr=False)
+    # Whether plate_path exists; set when plate_path changes, or checked once
+    # for records loaded from the database
+    _plate_available: Optional[bool] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.output_dir_str = str(self.output_dir)
+        self.default_plate_path = self.output_dir / "plate.json"
+        self.default_zip_path = self.output_dir.parent / f"{self.effective_label}.zip"
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached summary and detail after the record changes.
+
+        Note:
+            Bumping the version, rather than only clearing the caches, keeps a
+            model built concurrently from the old state from being reused.
+        """
+        self._version += 1
+        self._summary = None
+        self._detail = None
+        self._detail_json = None
+        self._status_json = None
+
+    def last_modified(self) -> datetime:
+        """
+        Get the later of updated_at and the latest event's timestamp.
+
+        Returns:
+            Last modification time (UTC)
+
+        Note:
+            Event appends only record an integer timestamp, so the datetime
+            is built here when a summary is requested rather than per event.
+        """
+        if self.events and self.events[-1][0] > _to_epoch_us(self.updated_at):
+            return _from_epoch_us(self.events[-1][0])
+        return self.updated_at
+
+    def plate_available(self) -> bool:
+        """
+        Check whether the job's plate file exists, stat-ing it at most once.
+
+        Returns:
+            True if plate_path is set and the file exists
+
+        Note:
+            Updates through JobManager record availability directly, so the
+            stat only happens once for jobs restored from the database.
+        """
+        if self._plate_available is None:
+            self._plate_available = bool(self.plate_path and self.plate_path.exists())
+        return self._plate_available
 
     def to_summary(self) -> JobSummary:
         """
@@ -103,18 +285,47 @@ class JobRecord:
 
         Returns:
             JobSummary with essential fields for list views
+
+        Note:
+            The summary is cached until the next invalidate_cache() call,
+            so polling list views don't rebuild it for unchanged jobs. On a
+            miss, the mutable fields are copied under the record's lock and
+            the model is validated after releasing it.
+        """
+        cached = self._summary
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        with self.lock:
+            version = self._version
+            status = self.status
+            updated_at = self.last_modified()
+            s3_key = self.s3_key
+        summary = self._build_summary(status, updated_at, s3_key)
+        self._summary = (version, summary)
+        return summary
+
+    def _build_summary(
+        self, status: JobStatus, updated_at: datetime, s3_key: Optional[str]
+    ) -> JobSummary:
+        """
+        Build a JobSummary from a snapshot of the record's mutable fields.
+
+        Note:
+            The record's fields already have the model's types, so the model
+            is built with a trusted_builder() constructor, which neither
+            validates them again nor applies defaults.
         """
-        return JobSummary(
+        return _build_job_summary(
             id=self.id,
             label=self.effective_label,
             display_label=self.display_label,
-            status=self.status,
+            status=status,
             created_at=self.created_at,
-            updated_at=self.updated_at,
+            updated_at=updated_at,
             pdf_filename=self.pdf_filename,
-            output_dir=str(self.output_dir),
-            plate_available=bool(self.plate_path and self.plate_path.exists()),
-            zip_available=bool(self.s3_key),
+            output_dir=self.output_dir_str,
+            plate_available=self.plate_available(),
+            zip_available=bool(s3_key),
         )
 
     def to_detail(self) -> JobDetail:
@@ -123,17 +334,95 @@ class JobRecord:
 
         Returns:
             JobDetail with all fields including configuration and events
+
+        Note:
+            Like the summary, the detail is cached until the next
+            invalidate_cache() call, so status polling of an unchanged job
+            skips validating its configuration and events again. The lock is
+            held only to copy the mutable fields, so the summary, events and
+            error always come from the same update.
         """
-        summary = self.to_summary()
-        return JobDetail(
-            **summary.model_dump(),
+        cached = self._detail
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        with self.lock:
+            version = self._version
+            status = self.status
+            updated_at = self.last_modified()
+            s3_key = self.s3_key
+            error = self.error
+            events = list(self.events)
+        cached_summary = self._summary
+        if cached_summary is not None and cached_summary[0] == version:
+            summary = cached_summary[1]
+        else:
+            summary = self._build_summary(status, updated_at, s3_key)
+            self._summary = (version, summary)
+        # Only events added since the last detail need a new model; the
+        # rebuilt map drops events that have aged out of the bounded log
+        known = self._event_models
+        event_models = [
+            known.get(event)
+            or JobEvent.model_construct(timestamp=_from_epoch_us(event[0]), message=event[1])
+            for event in events
+        ]
+        self._event_models = dict(zip(events, event_models))
+        # Trusted, already-typed fields: construct without validation, like
+        # the summary. resolved_config is copied out of its read-only proxy
+        # because serialization expects a dict.
+        detail = _build_job_detail(
+            **dict(summary),
             submitted_overrides=self.submitted_overrides,
             effective_overrides=self.overrides,
-            resolved_config=self.resolved_config,
-            events=self.events,
-            error=self.error,
-            s3_key=self.s3_key,
+            resolved_config=dict(self.resolved_config),
+            events=event_models,
+            error=error,
+            s3_key=s3_key,
         )
+        self._detail = (version, detail)
+        return detail
+
+    def to_detail_json(self) -> tuple[bytes, str]:
+        """
+        Get the JSON-encoded detail and its ETag.
+
+        Returns:
+            Tuple of (JSON body, ETag), cached like to_detail()
+
+        Note:
+            The version is read before the detail is built, so if the record
+            changes meanwhile the cached body is simply rebuilt next time.
+        """
+        cached = self._detail_json
+        version = self._version
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        body = self.to_detail().model_dump_json(by_alias=True).encode()
+        self._detail_json = (version, body, _json_etag(body))
+        return body, self._detail_json[2]
+
+    def to_status_json(self) -> tuple[bytes, str]:
+        """
+        Get the JSON-encoded status (status, error, plate and zip availability)
+        and its ETag, cached until the next invalidate_cache() call.
+
+        Returns:
+            Tuple of (JSON body, ETag)
+        """
+        cached = self._status_json
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+        with self.lock:
+            version = self._version
+            status = {
+                "status": self.status,
+                "error": self.error,
+                "plate_available": self.plate_available(),
+                "zip_available": bool(self.s3_key),
+            }
+        body = orjson.dumps(status)
+        self._status_json = (version, body, _json_etag(body))
+        return body, self._status_json[2]
 
 
 class JobManager:
@@ -147,8 +436,10 @@ class JobManager:
     - Persisting configuration and intermediate results
 
     Thread Safety:
-        All job state modifications are protected by a lock to ensure
-        consistency when accessed from multiple HTTP request threads.
+        Multi-step mutations of a job's state are protected by that job's
+        own lock, so requests that touch different jobs never serialize.
+        Reads hold a job's lock only to copy its fields and build models
+        after releasing it.
 
     Attributes:
         output_root: Base directory for job outputs
@@ -161,6 +452,9 @@ class JobManager:
         upload_root: Path | None = None,
         max_workers: int = 1,
         db_path: Path | None = None,
+        flush_interval: float = 0.1,
+        max_pending: int | None = None,
+        execution_mode: Literal["thread", "process"] = "thread",
     ) -> None:
         """
         Initialize the job manager.
@@ -170,23 +464,66 @@ class JobManager:
             upload_root: Base directory for uploads (default: ./uploads)
             max_workers: Number of concurrent pipeline executions (default: 1)
             db_path: Path to SQLite database (default: data/jobs.db)
+            flush_interval: Seconds between write-behind flushes of changed
+                job fields to the database (default: 0.1)
+            max_pending: Maximum number of submitted jobs whose pipeline has
+                not finished yet, queued or running (default: max_workers * 4)
+            execution_mode: Where run_pipeline executes: "thread" runs it in
+                the worker thread, "process" in a pool of max_workers
+                processes so CPU-bound stages of concurrent jobs don't
+                contend for the GIL (default: "thread")
+
+        Raises:
+            ValueError: If execution_mode is not "thread" or "process"
 
         Note:
             Setting max_workers > 1 enables parallel job processing but may
             increase resource usage. Consider available CPU and memory when
             configuring this value.
         """
+        if execution_mode not in ("thread", "process"):
+            raise ValueError(f"Unknown execution mode: {execution_mode!r}")
         self.output_root = ensure_directory(output_root or Path("output"))
         self.upload_root = ensure_directory(upload_root or Path("uploads"))
         self._jobs: Dict[str, JobRecord] = {}
-        self._lock = Lock()
+        # Registry lock guards insertion into _jobs; record state is guarded
+        # by each JobRecord's own lock, so unrelated jobs never contend
+        self._registry_lock = Lock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._config_metadata: ConfigMetadata | None = None
+        # In process mode, worker threads still own each job's lifecycle and
+        # only hand run_pipeline itself to a process
+        self._max_workers = max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = Lock()
+        if execution_mode == "process":
+            self._process_pool = self._new_process_pool()
+        # Bounds the executor's otherwise unbounded queue; each slot is held
+        # from create_job until the job's pipeline run finishes
+        self._pending = threading.BoundedSemaphore(max_pending or max_workers * 4)
+        # Archiving and upload run on their own pool so a slow S3 upload never
+        # holds a pipeline worker
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="adt-io")
+        # Recently loaded or saved plates: job_id -> (path, mtime_ns, size,
+        # bytes), least recently used first
+        self._plate_cache: OrderedDict[str, tuple[Path, int, int, bytes]] = OrderedDict()
+        self._plate_cache_lock = Lock()
 
         # Initialize database and load existing jobs
         self._db = JobDatabase(db_path) if db_path else JobDatabase()
         self._load_jobs_from_db()
 
+        # Write-behind state: changed fields per job, flushed in batches
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._dirty_lock = Lock()
+        self._flush_lock = Lock()
+        self._flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="job-db-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
     def _load_jobs_from_db(self) -> None:
         """
         Load all jobs from the database into memory.
@@ -203,24 +540,24 @@ class JobManager:
                     id=job_data["id"],
                     display_label=job_data["display_label"],
                     effective_label=job_data["effective_label"],
-                    status=JobStatus(job_data["status"]),
+                    status=STATUS_BY_VALUE[job_data["status"]],
                     created_at=job_data["created_at"],
                     updated_at=job_data["updated_at"],
                     pdf_filename=job_data["pdf_filename"],
-                    pdf_path=job_data["pdf_path"],
+                    pdf_path=Path(job_data["pdf_path"]),
                     submitted_overrides=job_data["submitted_overrides"],
                     overrides=job_data["overrides"],
                     runtime_config=OmegaConf.create({}),  # Not used for loaded jobs
-                    resolved_config=job_data["resolved_config"],
-                    output_dir=job_data["output_dir"],
-                    plate_path=job_data["plate_path"],
-                    zip_path=job_data["zip_path"],
+                    resolved_config=MappingProxyType(job_data["resolved_config"]),
+                    output_dir=Path(job_data["output_dir"]),
+                    plate_path=Path(job_data["plate_path"]) if job_data["plate_path"] else None,
+                    zip_path=Path(job_data["zip_path"]) if job_data["zip_path"] else None,
                     s3_key=job_data["s3_key"],
                     error=job_data["error"],
-                    events=[
-                        JobEvent(timestamp=e["timestamp"], message=e["message"])
+                    events=_new_event_log(
+                        (_to_epoch_us(e["timestamp"]), e["message"])
                         for e in job_data["events"]
-                    ],
+                    ),
                 )
                 self._jobs[record.id] = record
         except Exception as e:
@@ -228,39 +565,91 @@ class JobManager:
             import logging
             logging.warning(f"Failed to load jobs from database: {e}")
 
-    def _save_job_to_db(self, record: JobRecord) -> None:
+    def _insert_job_to_db(self, record: JobRecord) -> None:
         """
-        Save a job record to the database.
+        Insert a newly registered job record into the database.
 
         Args:
-            record: The job record to save
+            record: The job record to insert
+
+        Raises:
+            sqlite3.Error: If the row cannot be written
         """
-        try:
-            self._db.save_job({
-                "id": record.id,
-                "display_label": record.display_label,
-                "effective_label": record.effective_label,
-                "status": record.status.value,
-                "created_at": record.created_at,
-                "updated_at": record.updated_at,
-                "pdf_filename": record.pdf_filename,
-                "pdf_path": record.pdf_path,
-                "submitted_overrides": record.submitted_overrides,
-                "overrides": record.overrides,
-                "resolved_config": record.resolved_config,
-                "output_dir": record.output_dir,
-                "plate_path": record.plate_path,
-                "zip_path": record.zip_path,
-                "s3_key": record.s3_key,
-                "error": record.error,
-                "events": [
-                    {"timestamp": e.timestamp, "message": e.message}
-                    for e in record.events
-                ],
-            })
-        except Exception as e:
-            import logging
-            logging.error(f"Failed to save job {record.id} to database: {e}")
+        self._db.insert_job({
+            "id": record.id,
+            "display_label": record.display_label,
+            "effective_label": record.effective_label,
+            "status": record.status,
+            "created_at": record.created_at,
+            "updated_at": record.updated_at,
+            "pdf_filename": record.pdf_filename,
+            "pdf_path": record.pdf_path,
+            "submitted_overrides": record.config_json.get("submitted_overrides", record.submitted_overrides),
+            "overrides": record.config_json.get("overrides", record.overrides),
+            "resolved_config": record.config_json.get("resolved_config", dict(record.resolved_config)),
+            "output_dir": record.output_dir,
+            "plate_path": record.plate_path,
+            "zip_path": record.zip_path,
+            "s3_key": record.s3_key,
+            "error": record.error,
+            "events": _events_to_db(record.events),
+        })
+
+    def _update_job_in_db(self, job_id: str, **fields: Any) -> None:
+        """
+        Mark changed fields of a job record for the next database flush.
+
+        Repeated changes to the same job between flushes are coalesced, so
+        only the latest value of each field is written.
+
+        Args:
+            job_id: The job to update
+            **fields: Changed record attributes
+        """
+        with self._dirty_lock:
+            self._dirty.setdefault(job_id, {}).update(fields)
+
+    def flush(self) -> None:
+        """
+        Write all pending job field changes to the database in one transaction.
+
+        Thread Safety:
+            Flushes are serialized so an older batch can never be written
+            after a newer one
+        """
+        with self._flush_lock:
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, {}
+            if not dirty:
+                return
+            try:
+                self._db.update_jobs_bulk(dirty)
+            except Exception as e:
+                import logging
+                logging.error(f"Failed to save jobs {sorted(dirty)} to database: {e}")
+
+    def _flush_loop(self) -> None:
+        """Background loop flushing pending changes every flush_interval seconds."""
+        while not self._closed.wait(self._flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Drain the pipeline and upload pools, stop the background flusher and
+        persist all pending changes.
+
+        Safe to call more than once; it is also registered to run at exit.
+        """
+        # Pipelines submit uploads, so drain them before the upload pool
+        self._executor.shutdown(wait=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+        self._io_executor.shutdown(wait=True)
+        self._closed.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        self._db.flush_events()
 
     def list_jobs(self) -> list[JobSummary]:
         """
@@ -270,11 +659,23 @@ class JobManager:
             List of job summaries for all registered jobs
 
         Thread Safety:
-            Acquires lock for consistent snapshot of job state
+            The registry snapshot is atomic under the GIL; each record's lock
+            is held only while copying its mutable fields, never while a
+            summary is validated
         """
-        with self._lock:
-            records = sorted(self._jobs.values(), key=lambda r: r.created_at, reverse=True)
-            return [record.to_summary() for record in records]
+        records = list(self._jobs.values())
+        records.sort(key=lambda r: r.created_at, reverse=True)
+        return [record.to_summary() for record in records]
+
+    def list_jobs_json(self) -> bytes:
+        """
+        Get all job summaries, newest first, as encoded JSON.
+
+        Returns:
+            JSON array of the summaries list_jobs() returns, serialized by
+            pydantic-core without a validation pass
+        """
+        return _SUMMARY_LIST_ADAPTER.dump_json(self.list_jobs())
 
     def get_job(self, job_id: str) -> Optional[JobDetail]:
         """
@@ -287,25 +688,79 @@ class JobManager:
             JobDetail if found, None otherwise
 
         Thread Safety:
-            Acquires lock for consistent snapshot of job state
+            The registry lookup is atomic under the GIL; the record's lock is
+            held only while copying its mutable fields, never while the
+            detail is validated
+        """
+        record = self._jobs.get(job_id)
+        return record.to_detail() if record else None
+
+    def get_job_json(self, job_id: str) -> Optional[tuple[bytes, str]]:
         """
-        with self._lock:
-            record = self._jobs.get(job_id)
-            return record.to_detail() if record else None
+        Get a job's detail as encoded JSON with an ETag.
+
+        Args:
+            job_id: The unique job identifier
+
+        Returns:
+            Tuple of (JSON body, ETag) if found, None otherwise
+
+        Note:
+            The body is encoded once per job state, so polling an unchanged
+            job costs a dictionary lookup.
+        """
+        record = self._jobs.get(job_id)
+        return record.to_detail_json() if record else None
+
+    def get_job_status_json(self, job_id: str) -> Optional[tuple[bytes, str]]:
+        """
+        Get a job's status fields as encoded JSON with an ETag.
+
+        Args:
+            job_id: The unique job identifier
+
+        Returns:
+            Tuple of (JSON body, ETag) if found, None otherwise
+        """
+        record = self._jobs.get(job_id)
+        return record.to_status_json() if record else None
+
+    def get_output_dir(self, job_id: str) -> Optional[Path]:
+        """
+        Get a job's output directory as an absolute, symlink-free path.
+
+        Args:
+            job_id: The unique job identifier
+
+        Returns:
+            The resolved output directory if the job exists, None otherwise
+
+        Note:
+            The directory never changes, so it is resolved once per job
+            instead of on every output file request.
+        """
+        record = self._jobs.get(job_id)
+        if record is None:
+            return None
+        if record._resolved_output_dir is None:
+            record._resolved_output_dir = record.output_dir.resolve()
+        return record._resolved_output_dir
 
     def _register_job(self, record: JobRecord) -> None:
         """
-        Register a new job in the internal registry and persist to database.
+        Register a new job in the internal registry.
 
         Args:
             record: The job record to register
 
         Thread Safety:
-            Acquires lock before modifying job registry
+            Acquires the registry lock before modifying the job registry
+
+        Note:
+            The database row is inserted separately, by _store_and_submit.
         """
-        with self._lock:
+        with self._registry_lock:
             self._jobs[record.id] = record
-        self._save_job_to_db(record)
 
     def _update_job(self, job_id: str, **kwargs: Any) -> None:
         """
@@ -316,18 +771,12 @@ class JobManager:
             **kwargs: Attributes to update on the job record
 
         Thread Safety:
-            Acquires lock before modifying job state
+            Acquires the job's lock before modifying job state
 
         Note:
             The updated_at timestamp is automatically refreshed to the current UTC time.
         """
-        with self._lock:
-            record = self._jobs[job_id]
-            for key, value in kwargs.items():
-                setattr(record, key, value)
-            record.updated_at = datetime.utcnow()
-            # Persist to database
-            self._save_job_to_db(record)
+        self._update_and_event(job_id, None, **kwargs)
 
     def _append_event(self, job_id: str, message: str) -> None:
         """
@@ -338,15 +787,49 @@ class JobManager:
             message: Human-readable event description
 
         Thread Safety:
-            Acquires lock before modifying job events
+            Acquires the job's lock before modifying job events
+        """
+        self._update_and_event(job_id, message)
+
+    def _update_and_event(self, job_id: str, message: Optional[str], **kwargs: Any) -> None:
+        """
+        Update job attributes and/or append an event under one lock acquisition.
+
+        Args:
+            job_id: The job to update
+            message: Event description to append, or None for no event
+            **kwargs: Attributes to update on the job record; when given,
+                updated_at is refreshed as well
+
+        Thread Safety:
+            Acquires the job's lock once for both changes, which share a
+            single timestamp
         """
-        event = JobEvent(timestamp=datetime.utcnow(), message=message)
-        with self._lock:
-            record = self._jobs[job_id]
-            record.events.append(event)
-            record.updated_at = event.timestamp
-            # Persist to database
-            self._save_job_to_db(record)
+        timestamp = time.time_ns() // 1000
+        record = self._jobs[job_id]
+        with record.lock:
+            if kwargs:
+                fields = {**kwargs, "updated_at": _from_epoch_us(timestamp)}
+                # One dict update applies every field; JobRecord has no slots
+                # or property setters, so this matches per-field setattr
+                record.__dict__.update(fields)
+                if "plate_path" in fields:
+                    # plate_path is only ever set to a file that was just
+                    # written or checked, so no stat is needed to know it exists
+                    record._plate_available = fields["plate_path"] is not None
+                # Persist only the changed fields to database
+                self._update_job_in_db(job_id, **fields)
+            if message is not None:
+                # The event's timestamp doubles as the record's last-modified
+                # time; see JobRecord.last_modified()
+                record.events.append((timestamp, message))
+                # Queue the new event for the database's batched writer
+                try:
+                    self._db.queue_job_event(job_id, message, timestamp)
+                except Exception as e:
+                    import logging
+                    logging.error(f"Failed to save job {job_id} to database: {e}")
+            record.invalidate_cache()
 
     def _persist_config(self, record: JobRecord) -> None:
         """
@@ -362,19 +845,61 @@ class JobManager:
 
         Note:
             This enables full transparency and reproducibility - users can see
-            exactly what configuration was used for each job.
+            exactly what configuration was used for each job. It runs on the
+            I/O executor rather than in create_job, keeping disk writes off
+            both the request path and the pipeline workers. The pipeline
+            reads its configuration from memory, so it need not wait for it.
         """
-        config_path = record.output_dir / "config.yaml"
         ensure_directory(record.output_dir)
-        OmegaConf.save(record.runtime_config, config_path)
+        write_file(
+            record.output_dir / "config.yaml",
+            OmegaConf.to_yaml(record.runtime_config).encode("utf-8"),
+        )
 
         # Persist user-submitted overrides for transparency
-        submitted_path = record.output_dir / "submitted_overrides.json"
-        submitted_path.write_text(json.dumps(record.submitted_overrides, indent=2), encoding="utf-8")
+        write_file(
+            record.output_dir / "submitted_overrides.json",
+            orjson.dumps(record.submitted_overrides, option=_JSON_FILE_OPTIONS),
+        )
 
         # Persist effective overrides (includes auto-injected label and pdf_path)
-        effective_path = record.output_dir / "effective_overrides.json"
-        effective_path.write_text(json.dumps(record.overrides, indent=2), encoding="utf-8")
+        write_file(
+            record.output_dir / "effective_overrides.json",
+            orjson.dumps(record.overrides, option=_JSON_FILE_OPTIONS),
+        )
+
+    def _persist_config_logged(self, record: JobRecord) -> None:
+        """
+        Persist a job's configuration files, recording failure as an event.
+
+        Args:
+            record: The job whose configuration to persist
+        """
+        try:
+            self._persist_config(record)
+        except Exception as e:
+            import logging
+            logging.error(f"Failed to persist configuration for job {record.id}: {e}")
+            self._append_event(record.id, f"Failed to save configuration files: {e}")
+
+    def reserve_slot(self) -> None:
+        """
+        Reserve a pending-job slot ahead of create_job or regenerate_job.
+
+        Callers that must not waste work on a full queue (charging quota,
+        storing an upload) reserve first and pass slot_reserved=True. Until
+        that call is made the caller owns the slot and must give it back
+        with release_slot if it gives up.
+
+        Raises:
+            JobQueueFullError: If max_pending jobs are already queued or running
+        """
+        if not self._pending.acquire(blocking=False):
+            raise JobQueueFullError("Too many jobs are pending; try again later.")
+
+    def release_slot(self) -> None:
+        """Give back a slot taken with reserve_slot that was never used."""
+        self._pending.release()
 
     def create_job(
         self,
@@ -382,6 +907,7 @@ class JobManager:
         pdf_filename: str,
         pdf_path: Path,
         overrides: Dict[str, Any],
+        slot_reserved: bool = False,
     ) -> JobSummary:
         """
         Create and register a new processing job.
@@ -390,78 +916,155 @@ class JobManager:
         1. Generates a unique job ID
         2. Creates a filesystem-safe label with unique suffix
         3. Merges user overrides with defaults
-        4. Persists configuration to disk
-        5. Submits job for asynchronous execution
+        4. Registers the job, then stores it, submits it for asynchronous
+           execution and persists its configuration in the background
 
         Args:
             display_label: User-provided label for UI display
             pdf_filename: Original uploaded PDF filename
             pdf_path: Path to the stored PDF file
             overrides: User-provided configuration overrides
+            slot_reserved: Whether the caller already holds a slot from
+                reserve_slot; the job takes it over, releasing it on failure
 
         Returns:
             JobSummary of the created job
 
+        Raises:
+            JobQueueFullError: If max_pending jobs are already queued or running
+
         Note:
             The job is immediately submitted to the executor and will begin
             processing as soon as a worker is available.
         """
+        # Apply backpressure before doing any work for the job
+        if not slot_reserved:
+            self.reserve_slot()
+        try:
+            return self._create_and_submit(display_label, pdf_filename, pdf_path, overrides)
+        except BaseException:
+            self._pending.release()
+            raise
+
+    def _create_and_submit(
+        self,
+        display_label: str,
+        pdf_filename: str,
+        pdf_path: Path,
+        overrides: Dict[str, Any],
+    ) -> JobSummary:
+        """
+        Build, register and submit a job once create_job holds a pending slot.
+
+        Args:
+            display_label: User-provided label for UI display
+            pdf_filename: Original uploaded PDF filename
+            pdf_path: Path to the stored PDF file
+            overrides: User-provided configuration overrides
+
+        Returns:
+            JobSummary of the created job
+        """
         # Generate unique identifiers
-        job_id = uuid4().hex
-        safe_label = sanitize_label(display_label, fallback=f"job-{job_id[:8]}")
+        # token_hex(16) keeps the 32-character hex ID format of uuid4().hex
+        # without building a UUID object
+        job_id = secrets.token_hex(16)
+        short_id = job_id[:8]
+        safe_label = sanitize_label(display_label, fallback=f"job-{short_id}")
         # Append short job ID to ensure uniqueness even for duplicate labels
-        effective_label = f"{safe_label}-{job_id[:8]}"
+        effective_label = f"{safe_label}-{short_id}"
 
         # Preserve user input and add required fields
         submitted_overrides = dict(overrides)
-        overrides_with_defaults = {
-            **submitted_overrides,
+        overrides_with_defaults = submitted_overrides | {
             "label": effective_label,
             "pdf_path": str(pdf_path),
         }
 
         # Build runtime configuration by merging overrides with defaults
         runtime_config = make_runtime_config(overrides_with_defaults)
-        resolved_config = OmegaConf.to_container(runtime_config, resolve=True, enum_to_str=True)  # type: ignore[assignment]
+        resolved_config = resolve_runtime_config(runtime_config, overrides_with_defaults.keys())
 
         # Determine output directory (from config or default location)
         output_dir = Path(resolved_config["run_output_dir"]) if resolved_config.get("run_output_dir") else self.output_root / effective_label
-        ensure_directory(output_dir)
 
         # Create job record with all metadata
+        now = datetime.now(timezone.utc)
         record = JobRecord(
             id=job_id,
             display_label=display_label,
             effective_label=effective_label,
             status=JobStatus.PENDING,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             pdf_filename=pdf_filename,
             pdf_path=pdf_path,
             submitted_overrides=submitted_overrides,
             overrides=overrides_with_defaults,
             runtime_config=runtime_config,
-            resolved_config=resolved_config,  # type: ignore[arg-type]
+            # Frozen: nested values may be shared with the cached defaults
+            resolved_config=MappingProxyType(resolved_config),
             output_dir=output_dir,
         )
+        # Configuration is immutable after creation (regeneration creates a
+        # new record), so encode it once for the database
+        record.config_json = {
+            "submitted_overrides": orjson.dumps(submitted_overrides, default=str, option=_JSON_OPTIONS).decode(),
+            "overrides": orjson.dumps(overrides_with_defaults, default=str, option=_JSON_OPTIONS).decode(),
+            "resolved_config": orjson.dumps(resolved_config, default=str, option=_JSON_OPTIONS).decode(),
+        }
 
-        # Persist configuration for reproducibility
-        self._persist_config(record)
-
-        # Log initial event and register job
-        record.events.append(JobEvent(timestamp=record.created_at, message="Job registered and awaiting execution."))
+        # Log initial event and register job; it is visible (as pending) as
+        # soon as this returns, while storing and starting it happen on the
+        # I/O executor, off the request path
+        record.events.append((_to_epoch_us(record.created_at), "Job registered and awaiting execution."))
         self._register_job(record)
-
-        # Submit for asynchronous execution
-        self._executor.submit(self._run_pipeline, job_id)
+        try:
+            self._io_executor.submit(self._store_and_submit, record)
+        except BaseException:
+            # E.g. RuntimeError once the manager is closed; nothing will ever
+            # run the job, so don't leave it listed as pending
+            with self._registry_lock:
+                self._jobs.pop(record.id, None)
+            raise
 
         return record.to_summary()
 
+    def _store_and_submit(self, record: JobRecord) -> None:
+        """
+        Insert a newly registered job into the database, persist its
+        configuration and start it.
+
+        Runs on the I/O executor. The row is inserted before the pipeline is
+        submitted, so status updates from the run always find it, and the
+        configuration files are written first so the job's archive always
+        contains them. If inserting or submitting fails the job is marked
+        FAILED rather than left pending.
+
+        Args:
+            record: The registered job record
+        """
+        try:
+            self._insert_job_to_db(record)
+            # Persist configuration for reproducibility
+            self._persist_config_logged(record)
+            # Submit for asynchronous execution; the slot is freed once the
+            # pipeline run ends (archiving and upload run on the I/O executor)
+            future = self._executor.submit(self._run_pipeline, record.id)
+        except Exception as e:
+            self._pending.release()
+            import logging
+            logging.error(f"Failed to start job {record.id}: {e}")
+            self._fail_job(record.id, e)
+            return
+        future.add_done_callback(lambda _: self._pending.release())
+
     def regenerate_job(
         self,
         source_job_id: str,
         regenerate_sections: list[str],
         edit_sections: dict[str, str],
+        slot_reserved: bool = False,
     ) -> JobSummary:
         """
         Create a new job that regenerates/edits specific sections from an existing job.
@@ -476,10 +1079,51 @@ class JobManager:
             source_job_id: ID of the completed job to regenerate from
             regenerate_sections: List of section IDs to regenerate from scratch
             edit_sections: Dict mapping section IDs to edit instructions
+            slot_reserved: Whether the caller already holds a slot from
+                reserve_slot; it is released if the job cannot be created
 
         Returns:
             JobSummary of the newly created regeneration job
 
+        Raises:
+            ValueError: If source job not found or not in COMPLETED status
+            ValueError: If neither regenerate_sections nor edit_sections provided
+            JobQueueFullError: If max_pending jobs are already queued or running
+        """
+        try:
+            overrides = self._regeneration_overrides(source_job_id, regenerate_sections, edit_sections)
+        except BaseException:
+            if slot_reserved:
+                self.release_slot()
+            raise
+        source_record = self._jobs[source_job_id]
+
+        # Create new job with same PDF but new regeneration parameters
+        return self.create_job(
+            display_label=f"{source_record.display_label} (regenerated)",
+            pdf_filename=source_record.pdf_filename,
+            pdf_path=source_record.pdf_path,
+            overrides=overrides,
+            slot_reserved=slot_reserved,
+        )
+
+    def _regeneration_overrides(
+        self,
+        source_job_id: str,
+        regenerate_sections: list[str],
+        edit_sections: dict[str, str],
+    ) -> Dict[str, Any]:
+        """
+        Validate a regeneration request and build the new job's overrides.
+
+        Args:
+            source_job_id: ID of the completed job to regenerate from
+            regenerate_sections: List of section IDs to regenerate from scratch
+            edit_sections: Dict mapping section IDs to edit instructions
+
+        Returns:
+            The source job's submitted overrides plus the regeneration parameters
+
         Raises:
             ValueError: If source job not found or not in COMPLETED status
             ValueError: If neither regenerate_sections nor edit_sections provided
@@ -489,8 +1133,7 @@ class JobManager:
             raise ValueError("At least one of regenerate_sections or edit_sections must be provided")
 
         # Get source job
-        with self._lock:
-            source_record = self._jobs.get(source_job_id)
+        source_record = self._jobs.get(source_job_id)
 
         if not source_record:
             raise ValueError(f"Source job {source_job_id} not found")
@@ -504,22 +1147,16 @@ class JobManager:
             overrides["regenerate_sections"] = regenerate_sections
         if edit_sections:
             overrides["edit_sections"] = edit_sections
-
-        # Create new job with same PDF but new regeneration parameters
-        return self.create_job(
-            display_label=f"{source_record.display_label} (regenerated)",
-            pdf_filename=source_record.pdf_filename,
-            pdf_path=source_record.pdf_path,
-            overrides=overrides,
-        )
+        return overrides
 
     def _run_pipeline(self, job_id: str) -> None:
         """
         Execute the ADT Press pipeline for a job (runs in background thread).
 
         This method is invoked by the thread pool executor and handles
-        the complete pipeline execution lifecycle, including error handling
-        and status updates.
+        the pipeline execution lifecycle, including error handling and status
+        updates. Archiving and upload are handed off to the I/O executor
+        (see _finalize_and_upload); the job stays RUNNING until they finish.
 
         Args:
             job_id: The job to process
@@ -527,56 +1164,111 @@ class JobManager:
         Note:
             This method runs in a background thread. All job state modifications
             must use the lock-protected update methods to ensure thread safety.
+            Jobs are submitted one per task rather than batched: run_pipeline
+            takes a single document, so a batch would only run its jobs in
+            sequence on one worker, while submit() costs microseconds next
+            to a pipeline run.
         """
-        self._update_job(job_id, status=JobStatus.RUNNING)
-        self._append_event(job_id, "Pipeline execution started.")
+        self._update_and_event(job_id, "Pipeline execution started.", status=JobStatus.RUNNING)
 
-        # Get configuration snapshot under lock
-        with self._lock:
-            runtime_config = self._jobs[job_id].runtime_config
-            resolved_config = self._jobs[job_id].resolved_config
+        # Configuration is fixed at creation, so no lock is needed to read it
+        record = self._jobs[job_id]
+        runtime_config = record.runtime_config
 
         try:
             # Execute the pipeline (this may take several minutes for large documents)
-            run_pipeline(runtime_config)
+            if self._process_pool is None:
+                run_pipeline(runtime_config)
+            else:
+                self._run_in_process(OmegaConf.to_yaml(runtime_config))
+        except Exception as exc:
+            # Capture error and mark job as failed
+            self._fail_job(job_id, exc)
+            return
 
-            # Check if pipeline generated a plate.json file
-            output_dir = Path(resolved_config["run_output_dir"])
-            plate_path = output_dir / "plate.json"
-            
-            # Get effective_label for zip naming
-            with self._lock:
-                effective_label = self._jobs[job_id].effective_label
-            
-            # Zip the output directory
-            self._append_event(job_id, "Creating zip archive...")
-            zip_path = output_dir.parent / f"{effective_label}.zip"
-            zip_directory(output_dir, zip_path)
-            
-            # Upload to S3
-            self._append_event(job_id, "Uploading to S3...")
+        # Archive and upload on the I/O pool, freeing this worker for the next job
+        self._io_executor.submit(self._finalize_and_upload, job_id)
+
+    def _new_process_pool(self) -> ProcessPoolExecutor:
+        """Create the pool that runs pipelines in process execution mode."""
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers, mp_context=_pipeline_mp_context()
+        )
+
+    def _run_in_process(self, config_yaml: str) -> None:
+        """
+        Run the pipeline in the process pool and wait for it to finish.
+
+        Args:
+            config_yaml: The job's runtime configuration as YAML
+
+        Raises:
+            BrokenProcessPool: If a worker process died during the run; the
+                pool is replaced so later jobs can still run
+        """
+        pool = self._process_pool
+        try:
+            pool.submit(_run_pipeline_from_yaml, config_yaml).result()
+        except BrokenProcessPool:
+            # A crashed worker breaks the whole pool; replace it once, even
+            # when several running jobs observe the failure
+            with self._process_pool_lock:
+                if self._process_pool is pool:
+                    self._process_pool = self._new_process_pool()
+            raise
+
+    def _finalize_and_upload(self, job_id: str) -> None:
+        """
+        Zip a finished job's output to S3 (or to disk) and mark it completed.
+
+        Runs on the I/O executor after the pipeline itself has finished, so
+        network-bound uploads don't block queued pipeline runs. When S3 is
+        configured the archive is streamed without a local copy; otherwise,
+        or if the upload fails, it is written next to the output directory.
+
+        Args:
+            job_id: The job to finalize
+        """
+        record = self._jobs[job_id]
+        output_dir = record.output_dir
+        effective_label = record.effective_label
+        try:
+            # Stream the zipped output directory straight to S3
             s3_key = f"jobs/{effective_label}/{effective_label}.zip"
-            upload_success = upload_to_s3(zip_path, s3_key)
+            upload_success = False
+            if is_s3_configured():
+                self._append_event(job_id, "Uploading zip archive to S3...")
+                upload_success = stream_zip_to_s3(output_dir, s3_key)
             
             # Update job with results
-            update_kwargs = {"status": JobStatus.COMPLETED, "zip_path": zip_path}
-            if plate_path.exists():
-                update_kwargs["plate_path"] = plate_path
+            update_kwargs: Dict[str, Any] = {"status": JobStatus.COMPLETED}
+            # Check if pipeline generated a plate.json file
+            if record.default_plate_path.exists():
+                update_kwargs["plate_path"] = record.default_plate_path
             if upload_success:
                 update_kwargs["s3_key"] = s3_key
                 self._append_event(job_id, "Upload to S3 completed.")
             else:
+                # Keep a local archive when S3 is unavailable
+                self._append_event(job_id, "Creating zip archive...")
+                update_kwargs["zip_path"] = zip_directory(output_dir, record.default_zip_path)
                 self._append_event(job_id, "S3 upload skipped (not configured or unavailable).")
             
-            self._update_job(job_id, **update_kwargs)
-            self._append_event(job_id, "Pipeline execution completed.")
+            self._update_and_event(job_id, "Pipeline execution completed.", **update_kwargs)
         except Exception as exc:
-            # Capture error and mark job as failed
-            self._update_job(job_id, status=JobStatus.FAILED, error=str(exc))
-            self._append_event(job_id, f"Pipeline failed: {exc}")
-        finally:
-            # Ensure updated_at is refreshed
-            self._update_job(job_id)
+            self._fail_job(job_id, exc)
+
+    def _fail_job(self, job_id: str, exc: Exception) -> None:
+        """
+        Mark a job as failed and record the error.
+
+        Args:
+            job_id: The failed job
+            exc: The exception that ended the job
+        """
+        self._update_and_event(
+            job_id, f"Pipeline failed: {exc}", status=JobStatus.FAILED, error=str(exc)
+        )
 
     def save_plate(self, job_id: str, plate_data: Dict[str, Any]) -> Path:
         """
@@ -600,16 +1292,17 @@ class JobManager:
             Plate edits are only allowed for completed jobs to prevent
             conflicts with ongoing pipeline execution.
         """
-        with self._lock:
-            record = self._jobs[job_id]
+        record = self._jobs[job_id]
         if record.status != JobStatus.COMPLETED:
             raise RuntimeError("Job must be completed before saving plate edits.")
 
         # Determine plate path (use existing or default location)
-        plate_path = record.plate_path or (record.output_dir / "plate.json")
-        plate_path.write_text(json.dumps(plate_data, indent=2), encoding="utf-8")
-        record.plate_path = plate_path
-        self._append_event(job_id, "Plate updated via API.")
+        plate_path = record.plate_path or record.default_plate_path
+        # Atomic, so a crash mid-write can't leave a plate load_plate can't parse
+        data = orjson.dumps(plate_data, option=_JSON_FILE_OPTIONS)
+        write_file(plate_path, data, atomic=True)
+        self._cache_plate(job_id, plate_path, plate_path.stat(), data)
+        self._update_and_event(job_id, "Plate updated via API.", plate_path=plate_path)
         return plate_path
 
     def load_plate(self, job_id: str) -> Dict[str, Any]:
@@ -625,16 +1318,100 @@ class JobManager:
         Raises:
             FileNotFoundError: If plate.json doesn't exist for this job
             KeyError: If job_id doesn't exist
-            json.JSONDecodeError: If plate file is not valid JSON
+            orjson.JSONDecodeError: If plate file is not valid JSON (a
+                json.JSONDecodeError subclass)
+
+        Note:
+            A cached plate is parsed from memory; otherwise the file is
+            memory-mapped and parsed in place, without reading it into an
+            intermediate bytes object.
         """
-        with self._lock:
-            record = self._jobs[job_id]
-            plate_path = record.plate_path or (record.output_dir / "plate.json")
+        record = self._jobs[job_id]
+        plate_path = record.plate_path or record.default_plate_path
+
+        try:
+            stat = plate_path.stat()
+            cached = self._cached_plate(job_id, plate_path, stat)
+            if cached is not None:
+                return orjson.loads(cached)
+            if stat.st_size == 0:
+                # mmap can't map an empty file; let orjson report it
+                return orjson.loads(b"")
+            with open(plate_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        except FileNotFoundError:
+            raise FileNotFoundError("Plate file not found for this job.") from None
+
+    def load_plate_bytes(self, job_id: str) -> bytes:
+        """
+        Read a job's plate.json without parsing it.
+
+        Args:
+            job_id: The job whose plate to load
 
-        if not plate_path.exists():
-            raise FileNotFoundError("Plate file not found for this job.")
+        Returns:
+            The plate file's raw JSON bytes, suitable for serving as-is
 
-        return json.loads(plate_path.read_text(encoding="utf-8"))
+        Raises:
+            FileNotFoundError: If plate.json doesn't exist for this job
+            KeyError: If job_id doesn't exist
+
+        Note:
+            Recently used plates are cached in memory and served after a
+            single stat, as long as the file's mtime and size are unchanged.
+        """
+        record = self._jobs[job_id]
+        plate_path = record.plate_path or record.default_plate_path
+
+        try:
+            stat = plate_path.stat()
+            cached = self._cached_plate(job_id, plate_path, stat)
+            if cached is not None:
+                return cached
+            data = plate_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError("Plate file not found for this job.") from None
+        # The file may have been replaced between stat and read; a mismatch
+        # only costs a reread on the next load
+        self._cache_plate(job_id, plate_path, stat, data)
+        return data
+
+    def _cached_plate(self, job_id: str, plate_path: Path, stat: os.stat_result) -> Optional[bytes]:
+        """
+        Look up a job's cached plate bytes.
+
+        Args:
+            job_id: The job the plate belongs to
+            plate_path: Where the plate is stored
+            stat: The plate file's current stat result
+
+        Returns:
+            The cached bytes if they match the file's path, mtime and size,
+            None otherwise
+        """
+        with self._plate_cache_lock:
+            cached = self._plate_cache.get(job_id)
+            if cached is None or cached[:3] != (plate_path, stat.st_mtime_ns, stat.st_size):
+                return None
+            self._plate_cache.move_to_end(job_id)
+            return cached[3]
+
+    def _cache_plate(self, job_id: str, plate_path: Path, stat: os.stat_result, data: bytes) -> None:
+        """
+        Remember a plate's bytes, evicting the least recently used plate.
+
+        Args:
+            job_id: The job the plate belongs to
+            plate_path: Where the plate is stored
+            stat: The plate file's stat result matching data
+            data: The plate file's content
+        """
+        with self._plate_cache_lock:
+            self._plate_cache[job_id] = (plate_path, stat.st_mtime_ns, stat.st_size, data)
+            self._plate_cache.move_to_end(job_id)
+            while len(self._plate_cache) > PLATE_CACHE_SIZE:
+                self._plate_cache.popitem(last=False)
 
     def get_config_metadata(self) -> ConfigMetadata:
         """
@@ -646,6 +1423,13 @@ class JobManager:
         Note:
             Metadata is cached to avoid redundant configuration processing.
         """
-        if self._config_metadata is None:
-            self._config_metadata = build_config_metadata()
-        return self._config_metadata
+        return build_config_metadata()
+
+    def get_config_metadata_json(self) -> bytes:
+        """
+        Get configuration metadata as pre-serialized JSON bytes.
+
+        Returns:
+            Cached JSON encoding of get_config_metadata()
+        """
+        return build_config_metadata_json()
@@ -1,14 +1,93 @@
 
 import sqlite3
+import base64
 import hashlib
+import os
 import secrets
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from dataclasses import dataclass
 from uuid import uuid4
 
-@dataclass
+# Per-connection settings: NORMAL sync is durable across application crashes
+# in WAL mode without an fsync per commit, and busy_timeout makes concurrent
+# writers wait for the lock instead of failing
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Prepared statements kept per connection; comfortably more than the
+# statements KeyManager issues, so none is ever recompiled
+_STATEMENT_CACHE_SIZE = 256
+
+
+def _open_connection(database: str, uri: bool = False) -> sqlite3.Connection:
+    """Open a connection with Row results and the per-connection PRAGMAs."""
+    conn = sqlite3.connect(database, uri=uri, cached_statements=_STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Each thread's open connections to database files, by connection target,
+# shared by every KeyManager on the same file so it is opened once per thread
+_thread_connections = threading.local()
+
+
+def _shared_connection(target: str, uri: bool = False) -> sqlite3.Connection:
+    """Get (or open) the current thread's connection to target."""
+    conns = getattr(_thread_connections, "by_target", None)
+    if conns is None:
+        conns = _thread_connections.by_target = {}
+    conn = conns.get(target)
+    if conn is None:
+        conn = conns[target] = _open_connection(target, uri=uri)
+    return conn
+
+
+def _close_shared_connection(target: str) -> None:
+    """Close the current thread's connection to target, if it has one."""
+    conn = getattr(_thread_connections, "by_target", {}).pop(target, None)
+    if conn is not None:
+        conn.close()
+
+
+# Every issued key is KEY_PREFIX followed by 32 random bytes in URL-safe
+# base64 (43 characters), so anything else can be rejected without hashing
+KEY_PREFIX = "adt_"
+KEY_LENGTH = len(KEY_PREFIX) + 43
+
+# How long a validated key is trusted without re-reading it, in seconds.
+# Only this process's own writes drop entries early, so this bounds how long
+# a key revoked (or exhausted) through another worker keeps validating here.
+VALIDATION_CACHE_TTL = 5.0
+# Maximum number of validated keys kept in memory
+VALIDATION_CACHE_SIZE = 1024
+
+# Bloom filter of active key hashes, so unknown keys are usually rejected
+# without a query: BLOOM_BITS bits (a power of two), BLOOM_HASHES bits per key
+BLOOM_BITS = 1 << 20
+BLOOM_HASHES = 4
+
+
+def _bloom_positions(key_hash: str) -> list[int]:
+    """Bit positions of a hex key hash, taken from its first 32-bit words."""
+    return [
+        int(key_hash[i:i + 8], 16) & (BLOOM_BITS - 1) for i in range(0, 8 * BLOOM_HASHES, 8)
+    ]
+
+# Slotted and frozen: records are cached and shared between requests, and
+# the middleware reads their fields on every keyed request
+@dataclass(frozen=True, slots=True)
 class APIKeyRecord:
     id: str
     owner: str
@@ -18,42 +97,230 @@ class APIKeyRecord:
     is_active: bool
     created_at: str
 
+    @property
+    def has_quota(self) -> bool:
+        """Whether generations remained when this record was read."""
+        return self.current_generations < self.max_generations
+
 class KeyManager:
     """
     Manages API keys and usage tracking using a local SQLite database.
+
+    SQL is kept in class-level constants so every call passes the identical
+    string and hits the reused connection's prepared statement cache.
+    """
+
+    # Columns of an APIKeyRecord, listed explicitly rather than SELECT *
+    _RECORD_COLUMNS = "id, prefix, owner, max_generations, current_generations, is_active, created_at"
+    _VALIDATE_SQL = f"SELECT {_RECORD_COLUMNS} FROM api_keys WHERE key_hash = ? AND is_active = 1"
+    _UPGRADE_HASH_SQL = "UPDATE api_keys SET key_hash = ? WHERE key_hash = ?"
+    _INSERT_KEY_SQL = """
+        INSERT INTO api_keys (id, key_hash, prefix, owner, max_generations, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    _QUOTA_SQL = "SELECT max_generations, current_generations FROM api_keys WHERE id = ?"
+    # The quota check is part of the UPDATE itself, so it is atomic without
+    # holding a write lock across a separate SELECT. Parameters: (n, key_id);
+    # either all n generations fit the quota or none are recorded.
+    _INCREMENT_SQL = """
+        UPDATE api_keys SET current_generations = current_generations + ?1
+        WHERE id = ?2 AND current_generations + ?1 <= max_generations AND is_active = 1
+        RETURNING current_generations
+    """
+    # Parameters: (after, limit)
+    _LIST_SQL = f"""
+        SELECT {_RECORD_COLUMNS}
+        FROM api_keys
+        WHERE ?1 IS NULL
+           OR (created_at, id) < (SELECT created_at, id FROM api_keys WHERE id = ?1)
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?2
+    """
+    _REVOKE_SQL = "UPDATE api_keys SET is_active = 0 WHERE id = ?"
+    _ACTIVE_HASHES_SQL = "SELECT key_hash FROM api_keys WHERE is_active = 1"
+    # Run as one script and one transaction, so startup commits once
+    _SCHEMA_SQL = """
+        BEGIN;
+        CREATE TABLE IF NOT EXISTS api_keys (
+            id TEXT PRIMARY KEY,
+            key_hash TEXT UNIQUE NOT NULL,
+            prefix TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            max_generations INTEGER NOT NULL,
+            current_generations INTEGER DEFAULT 0,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        -- Serves list_keys' newest-first keyset pagination
+        CREATE INDEX IF NOT EXISTS idx_api_keys_created ON api_keys(created_at, id);
+        COMMIT;
     """
 
     def __init__(self, db_path: str = "data/adt_press.db"):
         self.db_path = Path(db_path)
+        # Optional server-side secret keying the key hashes, so a leaked
+        # database alone can't be used to test candidate keys offline
+        self._pepper = os.environ.get("ADT_KEY_PEPPER", "").encode()
+        if len(self._pepper) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(
+                f"ADT_KEY_PEPPER must be at most {hashlib.blake2b.MAX_KEY_SIZE} bytes"
+            )
+        # Hasher already keyed with the pepper; _hash_key copies it rather
+        # than re-processing the key block for every API key it hashes
+        self._key_hasher = hashlib.blake2b(digest_size=32, key=self._pepper)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # In-memory databases are private to their connection, so only
+        # file databases share connections between instances
+        self._in_memory = str(self.db_path) == ":memory:"
+        if not self._in_memory:
+            self._write_target = str(self.db_path.resolve())
+            self._read_target = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        self._local = threading.local()
+        # key_hash -> (record, monotonic time cached), oldest first; only
+        # valid keys are cached, so unknown keys can't grow it
+        self._validation_cache: OrderedDict[str, Tuple[APIKeyRecord, float]] = OrderedDict()
+        self._validation_lock = threading.Lock()
+        # Revoked keys keep their bits until the next rebuild; their lookups
+        # just fall through to the query
+        self._bloom = bytearray(BLOOM_BITS // 8)
+        self._bloom_lock = threading.Lock()
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Get (or open) the connection owned by the current thread.
+
+        Connections are kept open and reused, and shared with other
+        KeyManagers on the same file, so each thread opens the database and
+        applies PRAGMAs once. Use it as a context manager ("with
+        self._get_conn() as conn") to commit or roll back; that does not
+        close it.
+        """
+        if not self._in_memory:
+            return _shared_connection(self._write_target)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _open_connection(":memory:")
+            self._local.conn = conn
         return conn
 
+    def _get_read_conn(self) -> sqlite3.Connection:
+        """
+        Get (or open) the current thread's read-only connection.
+
+        Lookups use it so they can never take a write lock; in WAL mode
+        they run concurrently with each other and with the writer.
+        """
+        if self._in_memory:
+            return self._get_conn()
+        return _shared_connection(self._read_target, uri=True)
+
+    def close(self) -> None:
+        """
+        Close the current thread's connections, if any are open.
+
+        Other KeyManagers on the same file share them and reopen them on
+        their next query.
+        """
+        if not self._in_memory:
+            _close_shared_connection(self._write_target)
+            _close_shared_connection(self._read_target)
+            return
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Initialize the database schema if it doesn't exist."""
-        with self._get_conn() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS api_keys (
-                    id TEXT PRIMARY KEY,
-                    key_hash TEXT UNIQUE NOT NULL,
-                    prefix TEXT NOT NULL,
-                    owner TEXT NOT NULL,
-                    max_generations INTEGER NOT NULL,
-                    current_generations INTEGER DEFAULT 0,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.commit()
+        conn = self._get_conn()
+        # WAL is persistent, so enabling it once lets readers proceed
+        # while a key's usage is being incremented. It can't be changed
+        # inside a transaction, so it runs before the schema script.
+        if not self._in_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self._SCHEMA_SQL)
+        self.optimize()
+        self._rebuild_bloom()
+
+    def optimize(self) -> None:
+        """
+        Refresh the query planner's statistics where they are out of date.
+
+        PRAGMA optimize is cheap when nothing changed, so it is safe to run
+        periodically as well as at startup.
+        """
+        self._get_conn().execute("PRAGMA optimize")
 
     def _hash_key(self, key: str) -> str:
-        """SHA-256 hash of the API key."""
+        """BLAKE2b hash of the API key, keyed with the server's pepper."""
+        hasher = self._key_hasher.copy()
+        hasher.update(key.encode())
+        return hasher.hexdigest()
+
+    def _legacy_hash_key(self, key: str) -> str:
+        """SHA-256 hash that keys created before BLAKE2b were stored under."""
         return hashlib.sha256(key.encode()).hexdigest()
 
+    def _upgrade_legacy_hash(self, key: str, key_hash: str) -> Optional[sqlite3.Row]:
+        """
+        Re-hash a key stored under its legacy SHA-256 hash, if there is one.
+
+        Hashes can't be converted without the raw key, so existing rows are
+        migrated lazily, the first time their key is validated.
+        """
+        legacy_hash = self._legacy_hash_key(key)
+        # Look up before writing, so unknown keys never take the write lock
+        row = self._get_read_conn().execute(self._VALIDATE_SQL, (legacy_hash,)).fetchone()
+        if row is None:
+            return None
+        with self._get_conn() as conn:
+            conn.execute(self._UPGRADE_HASH_SQL, (key_hash, legacy_hash))
+            conn.commit()
+        self._bloom_add(key_hash)
+        return row
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the bloom filter from the active keys in the database."""
+        bloom = bytearray(BLOOM_BITS // 8)
+        # Held across the query, so a key committed meanwhile is added to
+        # the new filter rather than the one being replaced
+        with self._bloom_lock:
+            for (key_hash,) in self._get_read_conn().execute(self._ACTIVE_HASHES_SQL):
+                for position in _bloom_positions(key_hash):
+                    bloom[position >> 3] |= 1 << (position & 7)
+            self._bloom = bloom
+
+    def _bloom_add(self, *key_hashes: str) -> None:
+        """Add newly stored key hashes to the bloom filter."""
+        with self._bloom_lock:
+            for key_hash in key_hashes:
+                for position in _bloom_positions(key_hash):
+                    self._bloom[position >> 3] |= 1 << (position & 7)
+
+    def _may_be_stored(self, key_hash: str) -> bool:
+        """False if the bloom filter rules out an active row with this hash."""
+        bloom = self._bloom
+        return all(bloom[p >> 3] & (1 << (p & 7)) for p in _bloom_positions(key_hash))
+
+    def _known_absent(self, key: str, key_hash: str) -> bool:
+        """
+        Check whether a key can't be active, under either of its hashes.
+
+        Keys stored by other processes only reach this process's filter when
+        it is rebuilt, so a miss rebuilds it first if the database changed
+        since this thread last looked (PRAGMA data_version).
+        """
+        legacy_hash = self._legacy_hash_key(key)
+        if self._may_be_stored(key_hash) or self._may_be_stored(legacy_hash):
+            return False
+        version = self._get_read_conn().execute("PRAGMA data_version").fetchone()[0]
+        if version == getattr(self._local, "bloom_version", None):
+            return True
+        self._local.bloom_version = version
+        self._rebuild_bloom()
+        return not (self._may_be_stored(key_hash) or self._may_be_stored(legacy_hash))
+
     def create_key(self, owner: str, max_generations: int = 100) -> Tuple[str, dict]:
         """
         Generate a new API key for a user.
@@ -62,108 +329,188 @@ class KeyManager:
             Tuple[str, dict]: (raw_api_key, key_record_dict)
             WARNING: raw_api_key is shown ONLY ONCE here.
         """
-        # Generate a secure random key
-        raw_key = f"adt_{secrets.token_urlsafe(32)}"
-        key_hash = self._hash_key(raw_key)
-        prefix = raw_key[:8]
-        key_id = str(uuid4())
-        created_at = datetime.utcnow().isoformat()
+        return self.create_keys([(owner, max_generations)])[0]
+
+    def create_keys(self, specs: Iterable[Tuple[str, int]]) -> List[Tuple[str, dict]]:
+        """
+        Generate API keys for many users in one transaction.
+
+        Args:
+            specs: (owner, max_generations) pairs, one per key
+
+        Returns:
+            List of (raw_api_key, key_record_dict) in the order of specs;
+            as with create_key, the raw keys are shown ONLY ONCE here.
+        """
+        specs = list(specs)
+        # One read from the system's CSPRNG for every key's 32 random bytes,
+        # encoded like secrets.token_urlsafe(32)
+        entropy = secrets.token_bytes(32 * len(specs))
+        # Stored as naive UTC ISO 8601, like existing rows, so created_at
+        # keeps sorting correctly. SQLite's CURRENT_TIMESTAMP default uses a
+        # different format and only second precision.
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+        rows = []
+        created = []
+        for i, (owner, max_generations) in enumerate(specs):
+            token = base64.urlsafe_b64encode(entropy[32 * i:32 * (i + 1)]).rstrip(b"=")
+            raw_key = KEY_PREFIX + token.decode()
+            key_hash = self._hash_key(raw_key)
+            key_id = str(uuid4())
+            rows.append((key_id, key_hash, raw_key[:8], owner, max_generations, created_at))
+            created.append((raw_key, {
+                "id": key_id,
+                "prefix": raw_key[:8],
+                "owner": owner,
+                "max_generations": max_generations,
+                "current_generations": 0,
+                "is_active": True,
+                "created_at": created_at
+            }))
 
         with self._get_conn() as conn:
-            conn.execute("""
-                INSERT INTO api_keys (id, key_hash, prefix, owner, max_generations, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (key_id, key_hash, prefix, owner, max_generations, created_at))
+            conn.executemany(self._INSERT_KEY_SQL, rows)
             conn.commit()
-
-        record = {
-            "id": key_id,
-            "prefix": prefix,
-            "owner": owner,
-            "max_generations": max_generations,
-            "current_generations": 0,
-            "is_active": True,
-            "created_at": created_at
-        }
-        return raw_key, record
+        self._bloom_add(*(row[1] for row in rows))
+        return created
 
     def validate_key(self, key: str) -> Optional[APIKeyRecord]:
         """
         Validate an API key and return its record if valid.
+
+        Valid keys are cached for VALIDATION_CACHE_TTL seconds. Revoking a
+        key or incrementing its usage through this KeyManager drops its
+        entry at once, but changes made by other processes are only seen
+        once the entry expires, so a key revoked elsewhere can keep
+        validating here for up to VALIDATION_CACHE_TTL seconds. Quota is
+        still enforced by increment_usage's conditional UPDATE. Keys the
+        bloom filter rules out are rejected without a query.
         """
-        if not key:
+        if not self.is_well_formed(key):
             return None
             
         key_hash = self._hash_key(key)
+        now = time.monotonic()
+        cached = self._lookup_validation(key_hash, now)
+        if cached is not None:
+            return cached
+        if self._known_absent(key, key_hash):
+            return None
         
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT * FROM api_keys WHERE key_hash = ? AND is_active = 1",
-                (key_hash,)
-            ).fetchone()
-            
-            if row:
-                return APIKeyRecord(
-                    id=row["id"],
-                    owner=row["owner"],
-                    prefix=row["prefix"],
-                    max_generations=row["max_generations"],
-                    current_generations=row["current_generations"],
-                    is_active=bool(row["is_active"]),
-                    created_at=row["created_at"]
-                )
+        row = self._get_read_conn().execute(self._VALIDATE_SQL, (key_hash,)).fetchone()
+        if row is None:
+            row = self._upgrade_legacy_hash(key, key_hash)
+        
+        if row:
+            record = APIKeyRecord(
+                id=row["id"],
+                owner=row["owner"],
+                prefix=row["prefix"],
+                max_generations=row["max_generations"],
+                current_generations=row["current_generations"],
+                is_active=bool(row["is_active"]),
+                created_at=row["created_at"]
+            )
+            with self._validation_lock:
+                self._validation_cache[key_hash] = (record, now)
+                self._validation_cache.move_to_end(key_hash)
+                while len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+            return record
         return None
 
+    def get_cached_key(self, key: str) -> Optional[APIKeyRecord]:
+        """
+        Return a key's record if a recent validation of it is cached.
+
+        Never touches the database, so async callers can try it inline and
+        only hand validate_key to a worker thread on a miss.
+        """
+        if not self.is_well_formed(key):
+            return None
+        return self._lookup_validation(self._hash_key(key), time.monotonic())
+
+    @staticmethod
+    def is_well_formed(key: Optional[str]) -> bool:
+        """
+        Check that a key has the shape of an issued key.
+
+        Only the public format is checked, so this reveals nothing about
+        stored keys; it lets garbage be rejected without hashing it or
+        querying the database.
+        """
+        return bool(key) and len(key) == KEY_LENGTH and key.startswith(KEY_PREFIX)
+
+    def _lookup_validation(self, key_hash: str, now: float) -> Optional[APIKeyRecord]:
+        """Get a cached, unexpired validation by key hash."""
+        with self._validation_lock:
+            cached = self._validation_cache.get(key_hash)
+        if cached is not None and now - cached[1] < VALIDATION_CACHE_TTL:
+            return cached[0]
+        return None
+
+    def _forget_validation(self, key_id: str) -> None:
+        """Drop cached validations of a key after its row changes."""
+        with self._validation_lock:
+            stale = [h for h, (record, _) in self._validation_cache.items() if record.id == key_id]
+            for key_hash in stale:
+                del self._validation_cache[key_hash]
+
     def check_quota(self, key_id: str) -> bool:
         """
         Check if the key has remaining generations.
         """
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT max_generations, current_generations FROM api_keys WHERE id = ?",
-                (key_id,)
-            ).fetchone()
-            
-            if row:
-                return row["current_generations"] < row["max_generations"]
+        row = self._get_read_conn().execute(self._QUOTA_SQL, (key_id,)).fetchone()
+        
+        if row:
+            return row["current_generations"] < row["max_generations"]
         return False
 
     def increment_usage(self, key_id: str) -> bool:
         """
         Increment the usage count for a key. Returns True if successful (within quota).
+
+        Revoked keys are never incremented.
         """
+        return self.bulk_increment(key_id) is not None
+
+    def bulk_increment(self, key_id: str, n: int = 1) -> Optional[int]:
+        """
+        Record n generations for a key in one statement and transaction.
+
+        Returns the new usage count, or None if the key is revoked, unknown,
+        or would exceed its quota; in that case nothing is recorded.
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
         with self._get_conn() as conn:
-            # Check quota first with a lock (transaction)
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                row = cursor.execute(
-                    "SELECT max_generations, current_generations FROM api_keys WHERE id = ?",
-                    (key_id,)
-                ).fetchone()
-                
-                if not row or row["current_generations"] >= row["max_generations"]:
-                    return False
-                
-                cursor.execute(
-                    "UPDATE api_keys SET current_generations = current_generations + 1 WHERE id = ?",
-                    (key_id,)
-                )
-                conn.commit()
-                return True
-            except:
-                conn.rollback()
-                raise
-
-    def list_keys(self) -> list[dict]:
-        """List all API keys (admin only)."""
-        with self._get_conn() as conn:
-            rows = conn.execute("SELECT * FROM api_keys ORDER BY created_at DESC").fetchall()
-            return [dict(row) for row in rows]
+            row = conn.execute(self._INCREMENT_SQL, (n, key_id)).fetchone()
+            conn.commit()
+        if row is None:
+            return None
+        self._forget_validation(key_id)
+        return row[0]
+
+    def list_keys(self, limit: int = 100, after: Optional[str] = None) -> list[dict]:
+        """
+        List API keys newest first, one page at a time (admin only).
+
+        Args:
+            limit: Maximum number of keys to return
+            after: ID of the last key of the previous page, or None for the
+                first page
+
+        Pages are cut on (created_at, id), so keys created while paging
+        neither repeat nor shift later pages. Key hashes are not returned.
+        """
+        rows = self._get_read_conn().execute(self._LIST_SQL, (after, limit)).fetchall()
+        return [dict(row) for row in rows]
 
     def revoke_key(self, key_id: str) -> bool:
         """Revoke a key by ID."""
         with self._get_conn() as conn:
-            cursor = conn.execute("UPDATE api_keys SET is_active = 0 WHERE id = ?", (key_id,))
+            cursor = conn.execute(self._REVOKE_SQL, (key_id,))
             conn.commit()
-            return cursor.rowcount > 0
+        self._forget_validation(key_id)
+        return cursor.rowcount > 0
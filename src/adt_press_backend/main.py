@@ -8,7 +8,9 @@ This module defines the HTTP API endpoints for:
 - Plate (intermediate result) editing
 
 The API follows RESTful conventions and provides async endpoints for
-efficient handling of concurrent requests.
+efficient handling of concurrent requests. Blocking work (SQLite, file I/O,
+pipeline setup) is offloaded with asyncio.to_thread so it never stalls the
+event loop.
 
 Architecture:
     - FastAPI handles HTTP routing and request validation
@@ -17,35 +19,166 @@ Architecture:
     - Static file serving provides direct access to generated outputs
 """
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile, Header, status
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, Request, Security, UploadFile, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.security import APIKeyHeader
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from .job_manager import JobManager
+from .job_manager import JobManager, JobQueueFullError
 from .models import ConfigMetadata, JobDetail, JobSummary, RegenerateRequest, SectionEditRequest, SectionEditResponse
 from .s3_service import generate_presigned_url
-from .utils import ensure_directory
+from .utils import (
+    allowed_pdf_extensions,
+    copy_to_path,
+    ensure_directory,
+    sanitize_filename,
+    split_extension,
+)
 from .key_manager import KeyManager, APIKeyRecord
-from .middleware import RateLimiter
-from .configuration import CONFIG_PATH, get_default_config_container
+from .middleware import KEY_REQUIRED, QUOTA, RATE_LIMIT, AuthRateLimitMiddleware, RateLimiter
+from .configuration import get_config_path, get_default_config_container
+
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
+import httpx
 import instructor
+import litellm
 from banks import Prompt
 from litellm import acompletion
-import json
+import orjson
+import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, List, Optional, TypeVar
+import mimetypes
 import os
+import random
+import stat
+from urllib.parse import quote
+import hashlib
 import secrets
-import shutil
 import uuid
 
+# Seconds between PRAGMA optimize runs on the API key database
+KEY_DB_OPTIMIZE_INTERVAL = 15 * 60
+
+
+async def _optimize_key_db_periodically() -> None:
+    """Keep the key database's planner statistics fresh as keys are added."""
+    while True:
+        await asyncio.sleep(KEY_DB_OPTIMIZE_INTERVAL)
+        try:
+            await asyncio.to_thread(key_manager.optimize)
+        except Exception as e:
+            logging.warning(f"Failed to optimize key database: {e}")
+
+
+# Seconds between sweeps of idle rate limiter buckets, plus up to
+# RATE_LIMIT_SWEEP_JITTER so workers started together don't sweep in step
+RATE_LIMIT_SWEEP_INTERVAL = 30
+RATE_LIMIT_SWEEP_JITTER = 5
+
+
+async def _sweep_rate_limiter_periodically() -> None:
+    """Free rate limiter buckets of clients that have gone quiet."""
+    while True:
+        await asyncio.sleep(RATE_LIMIT_SWEEP_INTERVAL + random.random() * RATE_LIMIT_SWEEP_JITTER)
+        rate_limiter.cleanup()
+
+
+# Connection pool for the LLM HTTP client shared by section edits
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background maintenance for the lifetime of the server."""
+    tasks = [
+        asyncio.create_task(_optimize_key_db_periodically()),
+        asyncio.create_task(_sweep_rate_limiter_periodically()),
+    ]
+    llm_http = None
+    if PIPELINE_EXECUTION_MODE == "process":
+        # Share one pooled client across section edits so LLM connections
+        # (and their TLS sessions) are reused. litellm's session is global,
+        # so this is only safe when pipelines run in other processes: in
+        # thread mode they would use it from their own event loops.
+        llm_http = httpx.AsyncClient(limits=LLM_HTTP_LIMITS, timeout=httpx.Timeout(120.0))
+        litellm.aclient_session = llm_http
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        if llm_http is not None:
+            litellm.aclient_session = None
+            await llm_http.aclose()
+
+
 # Initialize FastAPI application with metadata
-app = FastAPI(title="ADT Press API", version="0.1.0")
+app = FastAPI(title="ADT Press API", version="0.1.0", lifespan=lifespan)
+
+# Initialize services
+# MAX_PENDING_JOBS bounds queued plus running jobs; beyond it job creation
+# returns 503 (default: four per worker). PIPELINE_EXECUTION_MODE=process
+# runs pipelines in worker processes instead of threads
+PIPELINE_EXECUTION_MODE = os.getenv("PIPELINE_EXECUTION_MODE", "thread")
+job_manager = JobManager(
+    max_workers=int(os.getenv("MAX_WORKERS", "2")),
+    max_pending=int(os.getenv("MAX_PENDING_JOBS", "0")) or None,
+    execution_mode=PIPELINE_EXECUTION_MODE,
+)
+key_manager = KeyManager()
+rate_limiter = RateLimiter(requests_per_minute=60)
 
+ensure_directory(job_manager.output_root)
+ensure_directory(job_manager.upload_root)
+# Uploaded PDFs are stored here; created once rather than on every upload
+UPLOAD_STAGING_DIR = ensure_directory(Path("data/uploads"))
+
+# When set (e.g. "/_internal_outputs/"), output files are handed to the
+# reverse proxy with X-Accel-Redirect instead of being streamed by the app.
+# The proxy must map this prefix to OUTPUT_DIR as an internal location.
+OUTPUT_ACCEL_REDIRECT_PREFIX = os.getenv("OUTPUT_ACCEL_REDIRECT_PREFIX", "")
+OUTPUT_ROOT = job_manager.output_root.resolve()
+
+# Build and serialize config metadata at startup so a missing config.yaml
+# fails fast and /config/defaults only ever serves cached bytes
+job_manager.get_config_metadata_json()
+
+# Rate limiting and API key checks run in middleware, once per request,
+# rather than as a chain of route dependencies. Paths not listed here
+# (health check, static outputs, docs) are not checked. Admin routes are
+# rate limited here and verify the master key in their own dependency.
+API_ROUTES = [
+    ("GET", "/config/defaults", RATE_LIMIT),
+    ("GET", "/jobs", RATE_LIMIT),
+    ("POST", "/jobs", QUOTA),
+    ("GET", "/jobs/{job_id}", RATE_LIMIT),
+    ("GET", "/jobs/{job_id}/plate", RATE_LIMIT),
+    ("PUT", "/jobs/{job_id}/plate", RATE_LIMIT),
+    ("POST", "/jobs/{job_id}/regenerate", QUOTA),
+    ("GET", "/jobs/{job_id}/status", RATE_LIMIT),
+    ("GET", "/jobs/{job_id}/outputs/{path:path}", RATE_LIMIT),
+    ("GET", "/jobs/{job_id}/download", RATE_LIMIT),
+    ("POST", "/sections/edit", KEY_REQUIRED),
+    ("POST", "/admin/keys", RATE_LIMIT),
+    ("GET", "/admin/keys", RATE_LIMIT),
+    ("DELETE", "/admin/keys/{key_id}", RATE_LIMIT),
+    ("POST", "/admin/web-edit/reload", RATE_LIMIT),
+]
+app.add_middleware(
+    AuthRateLimitMiddleware,
+    rate_limiter=rate_limiter,
+    key_manager=key_manager,
+    routes=API_ROUTES,
+)
+
+# Added last so it wraps the auth middleware and its error responses
 # Configure CORS to allow requests from any origin
 allowed_origins = ["*"]
 app.add_middleware(
@@ -56,97 +189,90 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-job_manager = JobManager(max_workers=2)
-key_manager = KeyManager()
-rate_limiter = RateLimiter(requests_per_minute=60)
-
-ensure_directory(job_manager.output_root)
-ensure_directory(job_manager.upload_root)
-
 # Mount static file serving for job outputs
 app.mount("/outputs", StaticFiles(directory=job_manager.output_root), name="outputs")
 
 
 # Dependencies
-def get_job_manager() -> JobManager:
+# The managers are created once at import, so these just return them. They
+# stay async: FastAPI awaits async dependencies inline but would dispatch a
+# sync (e.g. lru_cache-wrapped) provider to the threadpool on every request.
+async def get_job_manager() -> JobManager:
     return job_manager
 
-def get_key_manager() -> KeyManager:
+async def get_key_manager() -> KeyManager:
     return key_manager
 
-async def check_rate_limit(
-    request: Request,
-    x_api_key: str | None = Header(None, alias="X-API-Key"),
-):
-    """
-    Enforce rate limits based on API Key (if present) or Client IP.
-    """
-    identifier = x_api_key if x_api_key else (request.client.host if request.client else "unknown")
-    
-    if not rate_limiter.is_allowed(identifier):
-        raise HTTPException(
-            status_code=429, 
-            detail="Rate limit exceeded. Please slow down."
-        )
-    return x_api_key
+async def get_key_record(request: Request) -> APIKeyRecord:
+    """The API key record validated by AuthRateLimitMiddleware."""
+    return request.state.api_key_record
 
-async def require_api_key(
-    key: str | None = Depends(check_rate_limit),
-    manager: KeyManager = Depends(get_key_manager)
-) -> APIKeyRecord:
-    """
-    Strictly require a valid API Key.
-    """
-    if not key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="API Key required for this endpoint (Header: X-API-Key)",
-        )
-    
-    record = manager.validate_key(key)
-    if not record:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or inactive API Key",
-        )
-    return record
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
-async def verify_quota(
-    record: APIKeyRecord = Depends(require_api_key),
-    manager: KeyManager = Depends(get_key_manager)
-) -> APIKeyRecord:
+def json_body(model: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
     """
-    Ensure the key has remaining generations.
+    Build a dependency that parses the JSON request body into model.
+
+    model_validate_json parses and validates in a single pydantic-core pass,
+    without the intermediate dict a plain body parameter builds. Invalid
+    bodies get the same 422 response. Pair with json_body_openapi() so the
+    body still appears in the API docs.
     """
-    if not manager.check_quota(record.id):
-        raise HTTPException(
-            status_code=429, 
-            detail="Usage quota exceeded for this API Key. Please contact support."
-        )
-    return record
+    async def parse(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]) from exc
+    return parse
+
+def json_body_openapi(model: type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for a route reading model through json_body()."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
 
 
 @app.get("/healthz")
-def healthcheck() -> Dict[str, str]:
+async def healthcheck() -> Dict[str, str]:
     return {"status": "ok"}
 
 
 # --- Admin Endpoints ---
 
+# Reads the header straight from request.headers (no Pydantic coercion) and
+# documents it as a security scheme in OpenAPI
+_master_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+# The master key is read once at startup and kept only as a digest: comparing
+# fixed-length digests takes the same time whatever length the caller sends
+_MASTER_KEY = os.getenv("ADT_API_KEY", "")
+_MASTER_KEY_DIGEST = hashlib.sha256(_MASTER_KEY.encode()).digest()
+if not _MASTER_KEY:
+    logging.warning("ADT_API_KEY is not set; admin endpoints will be unavailable")
+
 async def verify_master_key(
-    x_api_key: str = Header(..., alias="X-API-Key"),
+    x_api_key: str | None = Security(_master_key_header),
 ):
     """
     Verify the Master API Key for admin actions.
     """
-    master_key = os.getenv("ADT_API_KEY")
-    if not master_key:
+    if x_api_key is None:
+        # Same 422 body FastAPI produced for the required Header parameter
+        raise RequestValidationError([
+            {"type": "missing", "loc": ("header", "X-API-Key"), "msg": "Field required", "input": None}
+        ])
+    if not _MASTER_KEY:
         # If no master key configured, deny all admin access for safety
         raise HTTPException(status_code=500, detail="Server misconfiguration: ADT_API_KEY not set")
     
     # constant time comparison to prevent timing attacks
-    if not secrets.compare_digest(x_api_key, master_key):
+    if not secrets.compare_digest(hashlib.sha256(x_api_key.encode()).digest(), _MASTER_KEY_DIGEST):
         raise HTTPException(status_code=401, detail="Invalid Master API Key")
     return x_api_key
 
@@ -158,8 +284,7 @@ class CreateKeyRequest(BaseModel):
 def create_api_key(
     request: CreateKeyRequest,
     manager: KeyManager = Depends(get_key_manager),
-    _: str = Depends(verify_master_key),
-    __: str | None = Depends(check_rate_limit)
+    _: str = Depends(verify_master_key)
 ):
     """
     Create a new API Key with specified quota.
@@ -170,54 +295,96 @@ def create_api_key(
 
 @app.get("/admin/keys")
 def list_api_keys(
+    limit: int = Query(100, ge=1, le=1000),
+    after: str | None = None,
     manager: KeyManager = Depends(get_key_manager),
-    _: str = Depends(verify_master_key),
-    __: str | None = Depends(check_rate_limit)
-):
-    """List all API keys (Requires Master Key)."""
-    return manager.list_keys()
+    _: str = Depends(verify_master_key)
+) -> Response:
+    """
+    List API keys newest first (Requires Master Key).
+
+    Pass the last returned key's id as `after` to fetch the next page.
+    """
+    keys = manager.list_keys(limit=limit, after=after)
+    return Response(content=orjson.dumps(keys), media_type="application/json")
 
 @app.delete("/admin/keys/{key_id}")
 def revoke_api_key(
     key_id: str, 
     manager: KeyManager = Depends(get_key_manager),
-    _: str = Depends(verify_master_key),
-    __: str | None = Depends(check_rate_limit)
+    _: str = Depends(verify_master_key)
 ):
     """Revoke an API key (Requires Master Key)."""
     if manager.revoke_key(key_id):
         return {"status": "revoked"}
     raise HTTPException(status_code=404, detail="Key not found")
 
+@app.post("/admin/web-edit/reload")
+async def reload_web_edit_config(
+    _: str = Depends(verify_master_key)
+):
+    """
+    Reload the section-edit prompt template and settings (Requires Master Key).
+
+    They are cached after first use; call this after editing the template
+    to pick up changes without restarting the server.
+    """
+    _load_web_edit_config.cache_clear()
+    _get_web_edit_prompt.cache_clear()
+    _get_instructor_client.cache_clear()
+    return {"status": "reloaded"}
+
 
 # --- Public Endpoints (Rate Limited) ---
 
 @app.get("/config/defaults", response_model=ConfigMetadata)
-def get_config_defaults(
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
-) -> ConfigMetadata:
-    return manager.get_config_metadata()
+async def get_config_defaults(
+    manager: JobManager = Depends(get_job_manager)
+) -> Response:
+    return Response(content=manager.get_config_metadata_json(), media_type="application/json")
 
 
 @app.get("/jobs", response_model=list[JobSummary])
-def list_jobs(
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
-) -> list[JobSummary]:
-    return manager.list_jobs()
+async def list_jobs(
+    manager: JobManager = Depends(get_job_manager)
+) -> Response:
+    return Response(content=manager.list_jobs_json(), media_type="application/json")
+
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serve a server-built model encoded by pydantic-core.
+
+    Returning a Response skips FastAPI's validation of the route's
+    response_model, which would only re-check what the server constructed;
+    the response_model is still used for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Serve pre-encoded JSON with an ETag, or 304 if the client has it already.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/jobs/{job_id}", response_model=JobDetail)
-def get_job(
+async def get_job(
     job_id: str, 
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
-) -> JobDetail:
-    job = manager.get_job(job_id)
-    if not job:
+    request: Request,
+    manager: JobManager = Depends(get_job_manager)
+) -> Response:
+    encoded = manager.get_job_json(job_id)
+    if not encoded:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return _json_response(request, *encoded)
 
 
 
@@ -228,70 +395,94 @@ async def create_job(
     config: str = Form("{}"),
     manager: JobManager = Depends(get_job_manager),
     key_mgr: KeyManager = Depends(get_key_manager),
-    key_record: APIKeyRecord = Depends(verify_quota)  # Enforce Quota
-) -> JobSummary:
+    key_record: APIKeyRecord = Depends(get_key_record)  # Enforce Quota
+) -> Response:
     # ... (Validation Logic) ...
     if not pdf.filename:
         raise HTTPException(status_code=400, detail="PDF file must have a filename")
 
-    if not pdf.filename.lower().endswith(".pdf") and (pdf.content_type or "") != "application/pdf":
+    stem, extension = split_extension(pdf.filename)
+    if (
+        extension.lower() not in allowed_pdf_extensions()
+        and (pdf.content_type or "") != "application/pdf"
+    ):
         raise HTTPException(status_code=400, detail="Only PDF uploads are supported")
 
     try:
-        parsed_config: Dict[str, Any] = json.loads(config) if config else {}
-    except json.JSONDecodeError as exc:
+        submitted_config = orjson.loads(config) if config else {}
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid config JSON: {exc}") from exc
+    if not isinstance(submitted_config, dict):
+        raise HTTPException(status_code=400, detail="Invalid config JSON: expected an object")
 
-    for key in list(parsed_config.keys()):
-        if parsed_config[key] is None:
-            parsed_config.pop(key)
-
-    # Increment Usage (Atomically)
-    # We do this BEFORE starting the job. If job fails immediately, we might want to refund?
-    # For now, simplistic approach: "Attempting a generation costs 1 credit".
-    if not key_mgr.increment_usage(key_record.id):
-        # Should be caught by verify_quota, but double check race condition
-        raise HTTPException(status_code=429, detail="Quota exceeded")
-
-    stored_pdf_path = await _store_upload(pdf)
-    display_label = label or Path(pdf.filename).stem
+    # Null values mean "use the default", so drop them in the same pass
+    parsed_config: Dict[str, Any] = {
+        key: value for key, value in submitted_config.items() if value is not None
+    }
 
-    summary = manager.create_job(
+    # Claim a queue slot first, so a full queue costs neither a generation
+    # nor a stored upload
+    _reserve_job_slot(manager)
+    try:
+        # Increment Usage (Atomically)
+        # We do this BEFORE starting the job. If job fails immediately, we might want to refund?
+        # For now, simplistic approach: "Attempting a generation costs 1 credit".
+        # The middleware's quota check may be stale; this conditional UPDATE is
+        # the authoritative check-and-increment
+        if not await asyncio.to_thread(key_mgr.increment_usage, key_record.id):
+            raise HTTPException(status_code=429, detail="Quota exceeded")
+
+        stored_pdf_path = await _store_upload(pdf)
+    except BaseException:
+        manager.release_slot()
+        raise
+    display_label = label or stem
+
+    summary = await asyncio.to_thread(
+        manager.create_job,
         display_label=display_label,
         pdf_filename=pdf.filename,
         pdf_path=stored_pdf_path,
         overrides=parsed_config,
+        slot_reserved=True,
     )
-    return summary
+    return _model_response(summary)
+
+
+def _reserve_job_slot(manager: JobManager) -> None:
+    """Reserve a pending-job slot, answering 503 when the queue is full."""
+    try:
+        manager.reserve_slot()
+    except JobQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "30"}) from exc
 
 
 @app.get("/jobs/{job_id}/plate")
-def get_plate(
+async def get_plate(
     job_id: str, 
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
-) -> JSONResponse:
+    manager: JobManager = Depends(get_job_manager)
+) -> Response:
+    # Serve the stored JSON as-is rather than parsing and re-encoding it
     try:
-        data = manager.load_plate(job_id)
+        data = await asyncio.to_thread(manager.load_plate_bytes, job_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return JSONResponse(content=data)
+    return Response(content=data, media_type="application/json")
 
 
 @app.put("/jobs/{job_id}/plate")
 async def update_plate(
     job_id: str, 
     request: Request, 
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
+    manager: JobManager = Depends(get_job_manager)
 ) -> Dict[str, str]:
     try:
-        payload = await request.json()
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid JSON payload") from exc
 
     try:
-        manager.save_plate(job_id, payload)
+        await asyncio.to_thread(manager.save_plate, job_id, payload)
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
     except FileNotFoundError as exc:
@@ -300,14 +491,18 @@ async def update_plate(
     return {"status": "saved"}
 
 
-@app.post("/jobs/{job_id}/regenerate", response_model=JobSummary)
+@app.post(
+    "/jobs/{job_id}/regenerate",
+    response_model=JobSummary,
+    openapi_extra=json_body_openapi(RegenerateRequest),
+)
 async def regenerate_job(
     job_id: str,
-    request: RegenerateRequest,
+    request: RegenerateRequest = Depends(json_body(RegenerateRequest)),
     manager: JobManager = Depends(get_job_manager),
     key_mgr: KeyManager = Depends(get_key_manager),
-    key_record: APIKeyRecord = Depends(verify_quota),
-) -> JobSummary:
+    key_record: APIKeyRecord = Depends(get_key_record),
+) -> Response:
     """
     Regenerate or edit specific sections of a completed job.
 
@@ -325,6 +520,7 @@ async def regenerate_job(
         400: If neither regenerate_sections nor edit_sections provided
         404: If source job not found
         409: If source job is not in COMPLETED status
+        503: If too many jobs are already pending
     """
     # Validate that at least one operation is specified
     if not request.regenerate_sections and not request.edit_sections:
@@ -342,17 +538,28 @@ async def regenerate_job(
                 detail=f"Sections cannot be in both regenerate and edit lists: {overlap}",
             )
 
+    # Claim a queue slot before charging quota (see create_job)
+    _reserve_job_slot(manager)
+
     # Increment usage quota
-    if not key_mgr.increment_usage(key_record.id):
+    try:
+        charged = await asyncio.to_thread(key_mgr.increment_usage, key_record.id)
+    except BaseException:
+        manager.release_slot()
+        raise
+    if not charged:
+        manager.release_slot()
         raise HTTPException(status_code=429, detail="Quota exceeded")
 
     try:
-        summary = manager.regenerate_job(
+        summary = await asyncio.to_thread(
+            manager.regenerate_job,
             source_job_id=job_id,
             regenerate_sections=request.regenerate_sections,
             edit_sections=request.edit_sections,
+            slot_reserved=True,
         )
-        return summary
+        return _model_response(summary)
     except ValueError as exc:
         error_msg = str(exc)
         if "not found" in error_msg:
@@ -363,23 +570,20 @@ async def regenerate_job(
 
 
 @app.get("/jobs/{job_id}/status")
-def job_status(
+async def job_status(
     job_id: str, 
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
-) -> Dict[str, Any]:
-    job = manager.get_job(job_id)
-    if not job:
+    request: Request,
+    manager: JobManager = Depends(get_job_manager)
+) -> Response:
+    # Polled constantly by clients: the body is encoded once per job state,
+    # and clients sending If-None-Match get a bodiless 304 until it changes
+    encoded = manager.get_job_status_json(job_id)
+    if not encoded:
         raise HTTPException(status_code=404, detail="Job not found")
-    return {
-        "status": job.status,
-        "error": job.error,
-        "plate_available": job.plate_available,
-        "zip_available": job.zip_available,
-    }
+    return _json_response(request, *encoded)
 
 @app.get("/jobs/{job_id}/outputs/{path:path}")
-def job_output(
+async def job_output(
     job_id: str, 
     path: str, 
     manager: JobManager = Depends(get_job_manager),
@@ -393,29 +597,44 @@ def job_output(
     # BUT "Other APIs should be allowed to any use but rate limited."
     # If I protect this, the editor might break if it tries to load images directly.
     # Let's verify_api_key here too. If editor breaks, we might need a query param token or cookie.
-    _: str | None = Depends(check_rate_limit)
+    # Rate limited by AuthRateLimitMiddleware (see API_ROUTES)
 ):
-    job = manager.get_job(job_id)
-    # ... (rest of implementation)
-    if not job:
+    base_path = manager.get_output_dir(job_id)
+    if base_path is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    base_path = Path(job.output_dir).resolve()
-    file_path = (base_path / path).resolve()
-
-    if not str(file_path).startswith(str(base_path)):
+    # Resolve symlinks and ".." before checking the file stays inside the
+    # job's directory; is_relative_to compares path components, so siblings
+    # such as "<output_dir>-other" are rejected. The base is already resolved
+    # and cached, so only the candidate is resolved, off the event loop.
+    file_path = await asyncio.to_thread((base_path / path).resolve)
+    if file_path == base_path or not file_path.is_relative_to(base_path):
         raise HTTPException(status_code=400, detail="Invalid path request")
 
-    if not file_path.exists() or not file_path.is_file():
+    if OUTPUT_ACCEL_REDIRECT_PREFIX and file_path.is_relative_to(OUTPUT_ROOT):
+        # The proxy serves the file (and any 404) with sendfile, keeping the
+        # bytes out of the event loop
+        relative = file_path.relative_to(OUTPUT_ROOT).as_posix()
+        return Response(
+            headers={"X-Accel-Redirect": OUTPUT_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(relative)},
+            media_type=mimetypes.guess_type(relative)[0] or "application/octet-stream",
+        )
+
+    # Stat once, off the event loop, and hand the result to FileResponse,
+    # which would otherwise stat the file again
+    try:
+        file_stat = await asyncio.to_thread(os.stat, file_path)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         raise HTTPException(status_code=404, detail="Output file not found")
 
-    return FileResponse(file_path)
+    return FileResponse(file_path, stat_result=file_stat)
 
 @app.get("/jobs/{job_id}/download")
-def get_download_url(
+async def get_download_url(
     job_id: str, 
-    manager: JobManager = Depends(get_job_manager),
-    _: str | None = Depends(check_rate_limit)
+    manager: JobManager = Depends(get_job_manager)
 ) -> Dict[str, Any]:
     # ...
     job = manager.get_job(job_id)
@@ -425,7 +644,8 @@ def get_download_url(
     if not job.s3_key:
         raise HTTPException(status_code=404, detail="Zip not available for this job")
     
-    url = generate_presigned_url(job.s3_key, expiration=3600)
+    # The first call builds the boto3 client, which may fetch credentials
+    url = await asyncio.to_thread(generate_presigned_url, job.s3_key, expiration=3600)
     if not url:
         raise HTTPException(status_code=500, detail="Failed to generate download URL")
     
@@ -433,6 +653,16 @@ def get_download_url(
 
 # --- Section Edit Endpoint ---
 
+# At most LLM_CONCURRENCY section edits call the LLM at once; up to
+# LLM_MAX_PENDING edits may be running or waiting, beyond which requests get
+# 503 instead of piling onto the provider (default: four per slot)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+LLM_MAX_PENDING = int(os.getenv("LLM_MAX_PENDING", "0")) or 4 * LLM_CONCURRENCY
+_llm_slots = asyncio.Semaphore(LLM_CONCURRENCY)
+# Edits running or waiting for a slot; only touched on the event loop
+_llm_pending = 0
+
+@lru_cache(maxsize=1)
 def _get_instructor_client():
     """
     Return an Instructor-wrapped LiteLLM client that prefers JSON-schema modes.
@@ -451,10 +681,13 @@ def _get_instructor_client():
     return instructor.from_litellm(acompletion)
 
 
+@lru_cache(maxsize=1)
 def _load_web_edit_config() -> dict:
     """
     Load the web_edit configuration including model and template.
     Returns dict with 'model', 'template', 'max_retries', 'timeout'.
+
+    Cached after the first successful load; the result must not be mutated.
     """
     # Use resolve=False to avoid resolving job-specific interpolations like ${pdf_path}
     # The web_edit config values don't depend on those interpolations
@@ -469,8 +702,8 @@ def _load_web_edit_config() -> dict:
 
     # Load template
     template_path_str = web_edit_config.get("template_path", "prompts/web_edit.jinja2")
-    # CONFIG_PATH points to config/config.yaml, so parent.parent is the adt-press root
-    adt_press_root = CONFIG_PATH.parent.parent
+    # The config path points to config/config.yaml, so parent.parent is the adt-press root
+    adt_press_root = get_config_path().parent.parent
     template_path = adt_press_root / template_path_str
 
     if not template_path.exists():
@@ -486,17 +719,27 @@ def _load_web_edit_config() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
+def _get_web_edit_prompt() -> Prompt:
+    """Return the web_edit prompt, parsing its template only once."""
+    return Prompt(_load_web_edit_config()["template"])
+
+
 class _WebEditLLMResponse(BaseModel):
     """Internal response model for LLM output with validation."""
     html: str
     reasoning: str
 
 
-@app.post("/sections/edit", response_model=SectionEditResponse)
+@app.post(
+    "/sections/edit",
+    response_model=SectionEditResponse,
+    openapi_extra=json_body_openapi(SectionEditRequest),
+)
 async def edit_section(
-    request: SectionEditRequest,
-    _: APIKeyRecord = Depends(require_api_key)
-) -> SectionEditResponse:
+    request: SectionEditRequest = Depends(json_body(SectionEditRequest)),
+    _: APIKeyRecord = Depends(get_key_record)
+) -> Response:
     """
     Stateless section editing endpoint.
 
@@ -512,11 +755,20 @@ async def edit_section(
     Raises:
         400: If the request is invalid
         500: If the LLM call fails
+        503: If too many section edits are already in progress
     """
+    global _llm_pending
+    if _llm_pending >= LLM_MAX_PENDING:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many section edits in progress. Please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
+    _llm_pending += 1
     try:
-        # Load config and prompt template
+        # Load config and prompt template (both cached after the first call)
         web_edit_config = _load_web_edit_config()
-        prompt = Prompt(web_edit_config["template"])
+        prompt = _get_web_edit_prompt()
 
         # Build context for the prompt
         context = {
@@ -532,17 +784,17 @@ async def edit_section(
         client = _get_instructor_client()
 
         # Call LLM
-        response: _WebEditLLMResponse = await client.chat.completions.create(
-            model=web_edit_config["model"],
-            response_model=_WebEditLLMResponse,
-            messages=[m.model_dump(exclude_none=True) for m in prompt.chat_messages(context)],
-            max_retries=web_edit_config["max_retries"],
-            timeout=web_edit_config["timeout"],
-        )
+        async with _llm_slots:
+            response: _WebEditLLMResponse = await client.chat.completions.create(
+                model=web_edit_config["model"],
+                response_model=_WebEditLLMResponse,
+                messages=[m.model_dump(exclude_none=True) for m in prompt.chat_messages(context)],
+                max_retries=web_edit_config["max_retries"],
+                timeout=web_edit_config["timeout"],
+            )
 
-        return SectionEditResponse(
-            html=response.html,
-            reasoning=response.reasoning,
+        return _model_response(
+            SectionEditResponse(html=response.html, reasoning=response.reasoning)
         )
 
     except FileNotFoundError as exc:
@@ -553,23 +805,31 @@ async def edit_section(
             status_code=500,
             detail=f"Failed to edit section: {str(exc)}"
         ) from exc
+    finally:
+        _llm_pending -= 1
 
 
 async def _store_upload(upload_file: UploadFile) -> Path:
     """
     Store uploaded file to a temporary location and return the path.
+
+    The copy and closing the spooled upload both run in one worker thread
+    (see copy_to_path), so the event loop never blocks on disk I/O and pays
+    a single thread hop; UploadFile.close() would take a second one for
+    uploads spooled to disk.
     """
-    upload_dir = Path("data/uploads")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Use UUID to prevent filename collisions
-    filename = f"{uuid.uuid4()}_{upload_file.filename}"
-    file_path = upload_dir / filename
+    # Use UUID to prevent filename collisions; the client's filename is
+    # sanitized so it can't escape the upload directory
+    filename = f"{uuid.uuid4()}_{sanitize_filename(upload_file.filename or '', 'upload.pdf')}"
+    file_path = UPLOAD_STAGING_DIR / filename
     
+    await asyncio.to_thread(_copy_and_close, upload_file.file, file_path)
+    return file_path
+
+
+def _copy_and_close(source: BinaryIO, path: Path) -> None:
+    """Copy an uploaded file to path, then close it, whether or not the copy succeeds."""
     try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        copy_to_path(source, path)
     finally:
-        await upload_file.close()
-        
-    return file_path
+        source.close()
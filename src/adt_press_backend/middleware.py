@@ -1,63 +1,199 @@
 
+import asyncio
+import threading
 import time
-from fastapi import Request, HTTPException
+from collections import OrderedDict
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict, deque
-from typing import Dict, Tuple
+from starlette.routing import compile_path
+from typing import Dict
+
+# Number of independently locked bucket shards; identifiers hash to a shard,
+# so concurrent requests from different clients rarely share a lock. Must be
+# a power of two: shards are picked by masking the hash
+_SHARD_COUNT = 64
+_SHARD_MASK = _SHARD_COUNT - 1
+# Token amounts are tracked in thousandths so refills stay integral
+_MILLI = 1000
+# Most buckets tracked at once, across all shards; beyond it the least
+# recently used are evicted, which only resets them to a full bucket.
+# Buckets of idle clients are also dropped by cleanup()
+RATE_LIMIT_MAX_BUCKETS = 100_000
+
+
+class _BucketShard:
+    """A lock and the buckets it guards, kept together on one object."""
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # identifier -> (last refill in ms since the limiter started << 32)
+        #               | available millitokens, least recently used first
+        self.buckets: OrderedDict[str, int] = OrderedDict()
+
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter using a fixed window algorithm.
-    Tracks requests per IP/Key within a time window.
+    In-memory token bucket rate limiter.
+
+    Each identifier (IP or API key) gets a bucket holding up to
+    requests_per_minute tokens that refills continuously at the same rate
+    per minute; a request spends one token. Buckets are refilled lazily when
+    checked, packed into a single integer, and spread across sharded locks
+    so checks from the threadpool are safe without a global lock. Each shard
+    keeps at most its share of max_buckets, evicting the least recently
+    used, so memory stays bounded however many clients appear.
     """
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: int = 60, max_buckets: int = RATE_LIMIT_MAX_BUCKETS):
         self.rpm = requests_per_minute
-        # Map of identifier -> valid_until_timestamp
-        # Or better: Map of identifier -> list of timestamps (sliding window)
-        # For simplicity/performance, let's use a Token Bucket approximation or just fixed window.
-        
-        # Using a simple Fixed Window for MVP:
-        # identifier -> (count, window_start_time)
-        self.requests: Dict[str, Tuple[int, float]] = {}
+        self._shard_size = max(1, max_buckets // _SHARD_COUNT)
+        self._capacity = requests_per_minute * _MILLI
+        self._start_ns = time.monotonic_ns()
+        self._shards = tuple(_BucketShard() for _ in range(_SHARD_COUNT))
+
+    def _now_ms(self) -> int:
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
+
+    def _refill(self, word: int, now_ms: int) -> int:
+        """Available millitokens in a packed bucket after refilling to now."""
+        last_ms, tokens = word >> 32, word & 0xFFFFFFFF
+        # rpm tokens per 60,000 ms is rpm millitokens per 60 ms
+        return min(self._capacity, tokens + (now_ms - last_ms) * self.rpm // 60)
 
     def is_allowed(self, identifier: str) -> bool:
-        now = time.time()
-        count, start_time = self.requests.get(identifier, (0, now))
-        
-        if now - start_time > 60:
-            # New window
-            self.requests[identifier] = (1, now)
+        now_ms = self._now_ms()
+        shard = self._shards[hash(identifier) & _SHARD_MASK]
+        with shard.lock:
+            buckets = shard.buckets
+            word = buckets.get(identifier)
+            if word is None:
+                tokens = self._capacity
+                if len(buckets) >= self._shard_size:
+                    buckets.popitem(last=False)
+            else:
+                tokens = self._refill(word, now_ms)
+                buckets.move_to_end(identifier)
+            if tokens < _MILLI:
+                return False
+            buckets[identifier] = (now_ms << 32) | (tokens - _MILLI)
             return True
-        
-        if count >= self.rpm:
-            return False
-            
-        self.requests[identifier] = (count + 1, start_time)
-        return True
-
-    def cleanup(self):
-        """Cleanup old entries to prevent memory leak"""
-        now = time.time()
-        keys_to_delete = [k for k, v in self.requests.items() if now - v[1] > 60]
-        for k in keys_to_delete:
-            del self.requests[k]
-
-class APIKeyMiddleware(BaseHTTPMiddleware):
+
+    def cleanup(self) -> None:
+        """
+        Drop buckets that have refilled completely; a missing bucket is
+        treated as full, so this only frees memory.
+
+        Buckets are ordered by last use, not by when they will be full (a
+        nearly empty bucket used long ago can still be refilling while a
+        barely used recent one is full), so every bucket is checked.
+        """
+        now_ms = self._now_ms()
+        refill = self._refill
+        capacity = self._capacity
+        for shard in self._shards:
+            with shard.lock:
+                buckets = shard.buckets
+                full = [
+                    identifier
+                    for identifier, word in buckets.items()
+                    if refill(word, now_ms) >= capacity
+                ]
+                for identifier in full:
+                    del buckets[identifier]
+
+
+# Access levels for AuthRateLimitMiddleware, in increasing strictness
+RATE_LIMIT = 0    # rate limited by API key or client IP
+KEY_REQUIRED = 1  # additionally requires a valid, active API key
+QUOTA = 2         # additionally requires remaining generation quota
+
+
+class AuthRateLimitMiddleware:
     """
-    Middleware to extract API Key but NOT enforce it globally yet.
-    Enforcement is better handled via specific Dependencies on routes,
-    but this middleware could handle global rate limiting based on key or IP.
+    Pure ASGI middleware that rate limits and authenticates API requests.
+
+    Routes are matched once per request against a table of
+    (method, path template, access level) entries; unmatched paths (health
+    checks, static outputs, docs) pass straight through. For matched routes
+    the X-API-Key header is read from the raw ASGI headers, the rate limit
+    is checked and, where the level requires it, the key and its quota are
+    validated. The validated APIKeyRecord is stored as
+    request.state.api_key_record for the route to use.
+
+    Written against ASGI directly rather than BaseHTTPMiddleware, which
+    would wrap every request and response body in extra tasks and streams.
     """
-    pass 
-    # Actually, for FastAPI it's often better to use Dependencies for Auth.
-    # But for Rate Limiting, Middleware is good.
-    
-    # We will implement Rate Limiting Logic here? 
-    # Or just keep RateLimiter as a utility class used by Dependencies?
-    
-    # Plan says: "Create middleware to extract and validate X-API-Key"
-    # Validating in middleware for ALL routes is strict. 
-    # Let's stick to using Dependencies for validation to allow public endpoints if needed (like healthz).
-    
-    # However, implementing Global Rate Limiting here.
+    def __init__(self, app, rate_limiter: RateLimiter, key_manager, routes):
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.key_manager = key_manager
+        # method -> [(compiled path regex, access level)]
+        self._routes: Dict[str, list] = {}
+        for method, path, level in routes:
+            regex = compile_path(path)[0]
+            self._routes.setdefault(method, []).append((regex, level))
+            if method == "GET":
+                # Starlette answers HEAD on every GET route
+                self._routes.setdefault("HEAD", []).append((regex, level))
+
+    def _access_level(self, method: str, path: str):
+        for regex, level in self._routes.get(method, ()):
+            if regex.match(path):
+                return level
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        level = self._access_level(scope["method"], scope["path"])
+        if level is None:
+            await self.app(scope, receive, send)
+            return
+
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value.decode("latin-1")
+                break
+
+        client = scope.get("client")
+        identifier = api_key or (client[0] if client else "unknown")
+        if not self.rate_limiter.is_allowed(identifier):
+            await _reject(scope, receive, send, 429, "Rate limit exceeded. Please slow down.")
+            return
+
+        if level >= KEY_REQUIRED:
+            if not api_key:
+                await _reject(
+                    scope, receive, send, 401,
+                    "API Key required for this endpoint (Header: X-API-Key)",
+                )
+                return
+            # Malformed keys are rejected outright, and recently validated
+            # keys are served from memory, both without a thread hop
+            manager = self.key_manager
+            record = manager.is_well_formed(api_key) and (
+                manager.get_cached_key(api_key)
+                or await asyncio.to_thread(manager.validate_key, api_key)
+            )
+            if not record:
+                await _reject(scope, receive, send, 401, "Invalid or inactive API Key")
+                return
+            # Pre-check quota from the validated record, without another query;
+            # routes consume quota with KeyManager.increment_usage, which
+            # re-checks it atomically
+            if level >= QUOTA and not record.has_quota:
+                await _reject(
+                    scope, receive, send, 429,
+                    "Usage quota exceeded for this API Key. Please contact support.",
+                )
+                return
+            scope.setdefault("state", {})["api_key_record"] = record
+
+        await self.app(scope, receive, send)
+
+
+async def _reject(scope, receive, send, status_code: int, detail: str) -> None:
+    """Send a FastAPI-style {"detail": ...} error response."""
+    response = JSONResponse({"detail": detail}, status_code=status_code)
+    await response(scope, receive, send)
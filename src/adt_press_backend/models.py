@@ -17,9 +17,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -39,6 +39,42 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
+# Status members by stored value, for rows read back from the database;
+# members hash like their values, so lookups accept either
+STATUS_BY_VALUE: Dict[str, JobStatus] = {status.value: status for status in JobStatus}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def trusted_builder(cls: type[ModelT]) -> Callable[..., ModelT]:
+    """
+    Make a constructor for instances of a model built from trusted values.
+
+    Like model_construct(), the returned function skips validation, but it
+    also skips model_construct()'s per-call walk over model_fields to apply
+    defaults and aliases: the caller must pass every field by name.
+
+    Args:
+        cls: A model class without extra fields or private attributes
+
+    Returns:
+        Function taking every field of cls as a keyword argument
+    """
+    fields = tuple(cls.model_fields)
+    new = cls.__new__
+    set_attr = object.__setattr__
+
+    def build(**values: Any) -> ModelT:
+        instance = new(cls)
+        set_attr(instance, "__dict__", values)
+        set_attr(instance, "__pydantic_fields_set__", set(fields))
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
 class JobEvent(BaseModel):
     """
     A timestamped event in a job's execution history.
@@ -51,6 +87,8 @@ class JobEvent(BaseModel):
         message: Human-readable description of the event
     """
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     message: str
 
@@ -72,8 +110,17 @@ class JobSummary(BaseModel):
         pdf_filename: Original uploaded PDF filename
         output_dir: Path to job output directory (if processing started)
         plate_available: Whether a plate.json file exists for editing
+        zip_available: Whether the output archive has been uploaded and can
+            be downloaded
+
+    Note:
+        Summaries and details (which inherit this config) are frozen:
+        JobRecord caches one instance per job state and hands the same
+        object to every request.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     display_label: str
@@ -99,11 +146,17 @@ class JobDetail(JobSummary):
         resolved_config: Final configuration after merging defaults and overrides
         events: Chronological list of job lifecycle events
         error: Error message if job failed (None otherwise)
+        s3_key: Object key of the uploaded output archive, if any
+
+    Note:
+        The three configuration mappings are typed Any so pydantic-core
+        serializes them without checking every key; they come from the
+        server's own config merge, and are still documented as objects.
     """
 
-    submitted_overrides: Dict[str, Any]
-    effective_overrides: Dict[str, Any]
-    resolved_config: Dict[str, Any]
+    submitted_overrides: Any = Field(json_schema_extra={"type": "object"})
+    effective_overrides: Any = Field(json_schema_extra={"type": "object"})
+    resolved_config: Any = Field(json_schema_extra={"type": "object"})
     events: List[JobEvent]
     error: Optional[str] = None
     s3_key: Optional[str] = None
@@ -127,9 +180,12 @@ class ConfigMetadata(BaseModel):
 
     Note:
         This metadata is derived from the adt-press pipeline configuration
-        and allows clients to build dynamic configuration UIs.
+        and allows clients to build dynamic configuration UIs. Instances are
+        frozen because a single cached instance is shared by all requests.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     defaults: Dict[str, Any]
     strategies: Dict[str, List[str]]
     render_strategies: List[str]
@@ -153,7 +209,8 @@ class RegenerateRequest(BaseModel):
 
     Note:
         At least one of regenerate_sections or edit_sections must be provided.
-        A section cannot appear in both lists simultaneously.
+        A section cannot appear in both lists simultaneously. Request bodies
+        are parsed with model_validate_json, straight from the raw JSON.
     """
 
     regenerate_sections: List[str] = []
@@ -174,6 +231,10 @@ class SectionEditRequest(BaseModel):
         section_type: Type of section (e.g., "content", "activity"). Defaults to "content"
         page_number: Page number for context. Defaults to 1
         language: Language of the content. Defaults to "English"
+
+    Note:
+        Request bodies are parsed with model_validate_json, so the (often
+        large) html string is decoded once, straight from the raw JSON.
     """
 
     html: str
@@ -3,7 +3,7 @@ S3 service module for uploading job outputs and generating presigned URLs.
 
 This module provides functionality for:
 - Creating zip archives from job output directories
-- Uploading zip files to S3
+- Uploading zip files to S3, or streaming archives to S3 without a local copy
 - Generating presigned URLs for secure, time-limited downloads
 
 The S3 bucket name is configured via the S3_BUCKET_NAME environment variable.
@@ -14,12 +14,13 @@ from __future__ import annotations
 
 import logging
 import os
-import shutil
+import threading
+import time
+import zipfile
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Optional
 
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -30,10 +31,38 @@ logger = logging.getLogger(__name__)
 # S3 bucket name from environment variable
 S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME", "")
 
-# S3 client (lazy initialization)
-_s3_client = None
-
-
+# Deflate level for job archives: level 1 is several times faster than the
+# default of 6 and only slightly larger on pipeline output
+ZIP_COMPRESSLEVEL = 1
+
+# Formats that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is
+PRECOMPRESSED_SUFFIXES = frozenset({
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif",
+    ".mp3", ".mp4", ".m4a", ".ogg", ".webm",
+    ".zip", ".gz", ".woff", ".woff2",
+})
+
+# Multipart settings for uploads: 8 MiB parts sent by up to 8 threads, so
+# compression of later parts overlaps with the upload of earlier ones
+TRANSFER_SETTINGS = {
+    "multipart_chunksize": 8 * 1024 * 1024,
+    "max_concurrency": 8,
+    "use_threads": True,
+}
+
+# Presigned URLs are reused within windows of this many seconds, so a UI
+# polling many download links doesn't sign each one on every request
+PRESIGN_CACHE_WINDOW = 300
+PRESIGN_CACHE_SIZE = 4096
+
+# boto3 is imported on first use: it loads hundreds of modules, which every
+# worker and test run would otherwise pay for even when S3 is not configured
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+
+
+@cache
 def _get_s3_client():
     """
     Get or create the S3 client.
@@ -45,18 +74,27 @@ def _get_s3_client():
         We no longer test credentials with list_buckets() because that requires
         s3:ListAllMyBuckets permission which follows least-privilege principle.
         Credential errors will surface during actual upload operations.
+        The result, including None, is cached for the life of the process;
+        call _get_s3_client.cache_clear() after changing the configuration.
     """
-    global _s3_client
-    if _s3_client is None:
-        if not S3_BUCKET_NAME:
-            logger.warning("S3_BUCKET_NAME not configured")
-            return None
-        try:
-            _s3_client = boto3.client("s3")
-        except Exception as e:
-            logger.warning(f"Failed to create S3 client: {e}")
-            _s3_client = None
-    return _s3_client
+    if not S3_BUCKET_NAME:
+        logger.warning("S3_BUCKET_NAME not configured")
+        return None
+    try:
+        import boto3
+
+        return boto3.client("s3")
+    except Exception as e:
+        logger.warning("Failed to create S3 client: %s", e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _transfer_config() -> TransferConfig:
+    """Build the TransferConfig for uploads from TRANSFER_SETTINGS."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(**TRANSFER_SETTINGS)
 
 
 def zip_directory(source_dir: Path, zip_path: Path) -> Path:
@@ -71,30 +109,154 @@ def zip_directory(source_dir: Path, zip_path: Path) -> Path:
         Path to the created zip file (with .zip extension)
 
     Note:
-        The source directory contents are placed at the root of the zip archive.
-        Uses shutil.make_archive which handles large directories efficiently.
+        Entries are stored under the source directory's name, matching the
+        layout shutil.make_archive produced. Text files are deflated at
+        ZIP_COMPRESSLEVEL; images, audio and other PRECOMPRESSED_SUFFIXES
+        are stored uncompressed, which skips most of the archiving CPU.
     """
-    # Remove .zip extension if present for shutil.make_archive
-    zip_base = str(zip_path).removesuffix(".zip")
+    zip_path = Path(str(zip_path).removesuffix(".zip") + ".zip")
     
-    logger.info(f"Creating zip archive: {zip_base}.zip from {source_dir}")
+    logger.info("Creating zip archive: %s from %s", zip_path, source_dir)
     
-    # Create the zip archive
-    archive_path = shutil.make_archive(
-        base_name=zip_base,
-        format="zip",
-        root_dir=source_dir.parent,
-        base_dir=source_dir.name
-    )
+    with open(zip_path, "wb") as sink:
+        _write_zip(source_dir, sink)
     
-    logger.info(f"Zip archive created: {archive_path}")
-    return Path(archive_path)
+    logger.info("Zip archive created: %s", zip_path)
+    return zip_path
+
+
+def _write_zip(source_dir: Path, sink: BinaryIO) -> None:
+    """
+    Write a zip archive of a directory to a binary file object.
+
+    Args:
+        source_dir: Path to the directory to zip
+        sink: Destination file object; it does not need to be seekable
+
+    Note:
+        Entries are stored under the source directory's name. On unseekable
+        sinks such as pipes, zipfile writes sizes in data descriptors after
+        each entry, so the archive can be streamed. The tree is read with
+        os.scandir, whose entries answer is_dir/is_file from the directory
+        listing, and symlinked directories are not descended into.
+    """
+    with zipfile.ZipFile(
+        sink, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+    ) as archive:
+        # Depth-first in name order: each directory, its files, then its
+        # subdirectories, which are pushed reversed so the first pops next
+        stack = [(str(source_dir), source_dir.name)]
+        while stack:
+            directory, arcdir = stack.pop()
+            archive.write(directory, arcdir)
+            with os.scandir(directory) as scan:
+                entries = sorted(scan, key=lambda entry: entry.name)
+            subdirs = []
+            for entry in entries:
+                arcname = f"{arcdir}/{entry.name}"
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, arcname))
+                elif entry.is_file():
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if os.path.splitext(entry.name)[1].lower() in PRECOMPRESSED_SUFFIXES
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    archive.write(entry.path, arcname, compress_type=compress_type)
+            stack.extend(reversed(subdirs))
+
+
+def stream_zip_to_s3(source_dir: Path, s3_key: str) -> bool:
+    """
+    Zip a directory straight into S3 without writing the archive to disk.
+
+    A producer thread writes the archive into a pipe while the upload reads
+    from the other end, so S3's managed (multipart) upload consumes archive
+    bytes as they are produced.
+
+    Args:
+        source_dir: Path to the directory to zip
+        s3_key: S3 object key (path within the bucket)
+
+    Returns:
+        True if upload was successful, False otherwise
+
+    Raises:
+        OSError: If reading the directory fails while archiving; the
+            partially uploaded object is deleted first, as it is when the
+            upload itself fails
+
+    Note:
+        If S3 credentials are not available or bucket is not configured,
+        this function returns False without raising an exception.
+    """
+    if not S3_BUCKET_NAME:
+        logger.warning("S3_BUCKET_NAME not configured, skipping upload")
+        return False
+
+    client = _get_s3_client()
+    if client is None:
+        logger.warning("S3 client not available, skipping upload")
+        return False
+
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    def delete_partial() -> None:
+        try:
+            client.delete_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Failed to delete partial upload %s: %s", s3_key, e)
+
+    read_fd, write_fd = os.pipe()
+    errors: list[BaseException] = []
+
+    def produce() -> None:
+        try:
+            with open(write_fd, "wb") as sink:
+                _write_zip(source_dir, sink)
+        except BrokenPipeError:
+            # The upload stopped reading; its own error is reported below
+            pass
+        except BaseException as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=produce, name="zip-stream", daemon=True)
+    producer.start()
+    upload_error = None
+    try:
+        logger.info("Streaming %s to s3://%s/%s", source_dir, S3_BUCKET_NAME, s3_key)
+        with open(read_fd, "rb") as source:
+            client.upload_fileobj(
+                source, S3_BUCKET_NAME, s3_key, Config=_transfer_config()
+            )
+    except (ClientError, BotoCoreError) as e:
+        # BotoCoreError covers connection and credential failures, which
+        # don't come back as a ClientError
+        upload_error = e
+    finally:
+        producer.join()
+
+    if upload_error is not None:
+        logger.error("S3 upload failed: %s", upload_error)
+        delete_partial()
+        return False
+    if errors:
+        # The upload saw a truncated archive; don't leave it in the bucket
+        delete_partial()
+        raise errors[0]
+
+    logger.info("Upload successful: s3://%s/%s", S3_BUCKET_NAME, s3_key)
+    return True
 
 
 def upload_to_s3(zip_path: Path, s3_key: str) -> bool:
     """
     Upload a zip file to S3.
 
+    Deprecated: job archives are streamed with stream_zip_to_s3, which never
+    writes the zip to local disk. Kept for callers that already have one.
+
     Args:
         zip_path: Path to the local zip file
         s3_key: S3 object key (path within the bucket)
@@ -115,13 +277,17 @@ def upload_to_s3(zip_path: Path, s3_key: str) -> bool:
         logger.warning("S3 client not available, skipping upload")
         return False
 
+    from botocore.exceptions import ClientError
+
     try:
-        logger.info(f"Uploading {zip_path} to s3://{S3_BUCKET_NAME}/{s3_key}")
-        client.upload_file(str(zip_path), S3_BUCKET_NAME, s3_key)
-        logger.info(f"Upload successful: s3://{S3_BUCKET_NAME}/{s3_key}")
+        logger.info("Uploading %s to s3://%s/%s", zip_path, S3_BUCKET_NAME, s3_key)
+        client.upload_file(
+            str(zip_path), S3_BUCKET_NAME, s3_key, Config=_transfer_config()
+        )
+        logger.info("Upload successful: s3://%s/%s", S3_BUCKET_NAME, s3_key)
         return True
     except ClientError as e:
-        logger.error(f"S3 upload failed: {e}")
+        logger.error("S3 upload failed: %s", e)
         return False
 
 
@@ -138,7 +304,10 @@ def generate_presigned_url(s3_key: str, expiration: int = 3600) -> Optional[str]
 
     Note:
         The presigned URL allows anyone with the URL to download the file
-        until the expiration time is reached.
+        until the expiration time is reached. URLs are cached for up to
+        PRESIGN_CACHE_WINDOW seconds and signed for that much longer than
+        expiration, so a cached URL still has at least expiration seconds
+        left when it is handed out.
     """
     if not S3_BUCKET_NAME:
         logger.warning("S3_BUCKET_NAME not configured")
@@ -149,19 +318,33 @@ def generate_presigned_url(s3_key: str, expiration: int = 3600) -> Optional[str]
         logger.warning("S3 client not available")
         return None
 
+    from botocore.exceptions import ClientError
+
+    window = int(time.time()) // PRESIGN_CACHE_WINDOW
     try:
-        url = client.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": S3_BUCKET_NAME, "Key": s3_key},
-            ExpiresIn=expiration
-        )
-        logger.info(f"Generated presigned URL for {s3_key} (expires in {expiration}s)")
-        return url
+        return _presign(s3_key, expiration, window)
     except ClientError as e:
-        logger.error(f"Failed to generate presigned URL: {e}")
+        logger.error("Failed to generate presigned URL: %s", e)
         return None
 
 
+@lru_cache(maxsize=PRESIGN_CACHE_SIZE)
+def _presign(s3_key: str, expiration: int, window: int) -> str:
+    """Sign a download URL; window only makes cache entries expire."""
+    url = _get_s3_client().generate_presigned_url(
+        "get_object",
+        Params={"Bucket": S3_BUCKET_NAME, "Key": s3_key},
+        ExpiresIn=expiration + PRESIGN_CACHE_WINDOW
+    )
+    logger.info("Generated presigned URL for %s (expires in %ss)", s3_key, expiration)
+    return url
+
+
+def clear_presign_cache() -> None:
+    """Forget cached presigned URLs, e.g. after rotating credentials."""
+    _presign.cache_clear()
+
+
 def is_s3_configured() -> bool:
     """
     Check if S3 is properly configured and accessible.
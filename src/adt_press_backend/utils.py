@@ -2,21 +2,49 @@
 Utility functions for file system operations and string sanitization.
 
 This module provides helper functions for:
-- Sanitizing user-provided strings for safe filesystem usage
+- Sanitizing user-provided strings and filenames for safe filesystem usage
 - Ensuring directory creation with proper error handling
+- Writing small files without file-object overhead
+- Copying uploaded files with few system calls
 - Validating and parsing file extensions
 """
 
 from __future__ import annotations
 
+import io
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from tempfile import SpooledTemporaryFile, mkstemp
+from typing import BinaryIO
+
+# Buffer size for copies that cannot use os.sendfile
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Extensions accepted for uploaded PDFs, returned by allowed_pdf_extensions
+_ALLOWED_PDF_EXTENSIONS: frozenset[str] = frozenset({".pdf"})
 
 # Pattern to match characters that are not safe for filesystem paths
 # Allows: alphanumeric characters, dots, underscores, and hyphens
 SANITIZE_PATTERN = re.compile(r"[^a-zA-Z0-9._-]+")
 
+# Translation table for ASCII labels: lowercases letters and maps every
+# character outside [A-Za-z0-9._-] to NUL, which marks where runs of unsafe
+# characters are collapsed into a single hyphen
+_LABEL_TABLE = str.maketrans(
+    {
+        chr(c): (chr(c).lower() if chr(c).isalnum() or chr(c) in "._-" else "\0")
+        for c in range(128)
+    }
+)
+
+# Translation table mapping every ASCII character outside [A-Za-z0-9._-]
+# to a hyphen, used by sanitize_filename
+_FILENAME_TABLE = str.maketrans(
+    {chr(c): "-" for c in range(128) if not (chr(c).isalnum() or chr(c) in "._-")}
+)
+
 
 def sanitize_label(label: str, fallback: str) -> str:
     """
@@ -38,12 +66,55 @@ def sanitize_label(label: str, fallback: str) -> str:
         >>> sanitize_label("@#$", "default-doc")
         "default-doc"
     """
+    # Return fallback if result is empty
+    return _clean_label(label) or fallback
+
+
+@lru_cache(maxsize=1024)
+def _clean_label(label: str) -> str:
+    """
+    Apply sanitize_label's character rules, caching results per label.
+
+    The cache is keyed on the label alone: callers typically pass a
+    per-job fallback, which would otherwise make every key unique. ASCII
+    labels are cleaned and lowercased in one str.translate pass; others go
+    through SANITIZE_PATTERN, which gives the same result.
+    """
+    if label.isascii():
+        # Unsafe characters became NUL; empty pieces between them are runs
+        pieces = label.translate(_LABEL_TABLE).split("\0")
+        return "-".join(filter(None, pieces)).strip("-_.")
     # Replace non-safe characters with hyphens and normalize whitespace
     cleaned = SANITIZE_PATTERN.sub("-", label.strip())
     # Remove leading/trailing separators and convert to lowercase
-    cleaned = cleaned.strip("-_.").lower()
-    # Return fallback if result is empty
-    return cleaned or fallback
+    return cleaned.strip("-_.").lower()
+
+
+@lru_cache(maxsize=1024)
+def sanitize_filename(filename: str, fallback: str) -> str:
+    """
+    Make a user-provided filename safe to use as a single path component.
+
+    Unlike sanitize_label, case and the extension are preserved. Every
+    character outside [A-Za-z0-9._-] becomes a hyphen (one per character,
+    via a C-level str.translate), so path separators can't survive. Results
+    are cached, since clients tend to upload the same filenames repeatedly.
+
+    Args:
+        filename: The original filename, e.g. from an upload
+        fallback: Value to return if nothing usable remains
+
+    Returns:
+        A filename without separators or leading dots, or the fallback
+
+    Example:
+        >>> sanitize_filename("../My Book (v2).pdf", "upload.pdf")
+        "My-Book--v2-.pdf"
+    """
+    # Non-ASCII characters become "?" first, which the table then replaces
+    ascii_name = filename.encode("ascii", "replace").decode("ascii")
+    # Leading dots would make hidden files; leading hyphens look like options
+    return ascii_name.translate(_FILENAME_TABLE).lstrip(".-") or fallback
 
 
 def ensure_directory(path: Path) -> Path:
@@ -66,6 +137,116 @@ def ensure_directory(path: Path) -> Path:
     return path
 
 
+def write_file(path: Path, data: bytes, atomic: bool = False) -> None:
+    """
+    Write bytes to a file, replacing any existing content.
+
+    Uses os.open/os.write directly, skipping the buffered file object that
+    Path.write_text builds for what is usually a single write.
+
+    Args:
+        path: The file to write
+        data: The complete file content
+        atomic: If True, write a uniquely named temporary file next to
+            path, flush it to disk with fdatasync and rename it over path,
+            so readers, crashes and concurrent writers never see a
+            partially written file
+
+    Raises:
+        OSError: If the file cannot be opened or written
+    """
+    if not atomic:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
+        return
+
+    fd, temp_name = mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        try:
+            # mkstemp creates the file owner-only; match a plain write
+            os.fchmod(fd, 0o644)
+            _write_all(fd, data)
+            os.fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def copy_to_path(source: BinaryIO, path: Path) -> None:
+    """
+    Copy the rest of a binary file object to a new file.
+
+    When the source is backed by a real file, os.sendfile copies it inside
+    the kernel; otherwise the data is written with os.write, COPY_BUFFER_SIZE
+    bytes at a time. The destination is a raw descriptor, so no buffered
+    file object sits between the copy and the disk.
+
+    Args:
+        source: File object positioned at the data to copy (e.g. an
+            uploaded file's spooled temporary file)
+        path: The destination file, created or truncated
+
+    Raises:
+        OSError: If reading the source or writing the destination fails
+    """
+    if isinstance(source, SpooledTemporaryFile):
+        # Calling fileno() on a spooled file forces it to disk, so copy from
+        # the underlying file directly: BytesIO in memory, a real file once
+        # rolled over
+        source = source._file  # type: ignore[attr-defined]
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if isinstance(source, io.BytesIO):
+            _write_all(fd, source.getbuffer()[source.tell():])
+            return
+
+        try:
+            source_fd = source.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            _copy_buffered(source, fd)
+            return
+
+        offset = source.tell()
+        size = os.fstat(source_fd).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(fd, source_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # sendfile is unavailable for this pair; finish with a buffered copy
+            source.seek(offset)
+            _copy_buffered(source, fd)
+            return
+        source.seek(offset)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    """Write all of data to a file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _copy_buffered(source: BinaryIO, fd: int) -> None:
+    """Copy the rest of source to a file descriptor in large chunks."""
+    while chunk := source.read(COPY_BUFFER_SIZE):
+        _write_all(fd, chunk)
+
+
 def split_extension(filename: str) -> tuple[str, str]:
     """
     Split a filename into stem and extension components.
@@ -74,7 +255,8 @@ def split_extension(filename: str) -> tuple[str, str]:
         filename: The filename to split (can include path)
 
     Returns:
-        A tuple of (stem, extension) where extension includes the dot
+        A tuple of (stem, extension) where extension includes the dot,
+        always equal to (Path(filename).stem, Path(filename).suffix)
 
     Example:
         >>> split_extension("document.pdf")
@@ -82,19 +264,30 @@ def split_extension(filename: str) -> tuple[str, str]:
         >>> split_extension("/path/to/file.tar.gz")
         ("file.tar", ".gz")
     """
-    path = Path(filename)
-    return path.stem, path.suffix
+    _, _, name = filename.rpartition(os.sep)
+    if os.altsep is not None or not name or name == ".":
+        # Trailing separators, "." components and Windows paths need
+        # Path's own parsing to find the name
+        path = Path(filename)
+        return path.stem, path.suffix
+    # Same rule as Path.suffix: a leading or trailing dot is not an
+    # extension, so ".bashrc", "..pdf" and "file." have none
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ""
 
 
-def allowed_pdf_extensions() -> Iterable[str]:
+def allowed_pdf_extensions() -> frozenset[str]:
     """
-    Get the list of allowed PDF file extensions.
+    Get the set of allowed PDF file extensions.
 
     Returns:
-        An iterable of valid PDF extensions (currently only '.pdf')
+        A shared frozenset of valid PDF extensions (currently only '.pdf'),
+        so membership checks are a single hash lookup
 
     Note:
         This function exists for future extensibility if additional
         PDF-like formats need to be supported (e.g., '.PDF', compressed formats)
     """
-    return [".pdf"]
+    return _ALLOWED_PDF_EXTENSIONS
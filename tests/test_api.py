@@ -91,6 +91,31 @@ class TestAPIKeyManagement:
         # At least the key we created should exist
         assert len(data) >= 1
 
+    def test_list_api_keys_paginates(self, client, master_key):
+        """Pages fetched with limit/after should not overlap."""
+        for owner in ("page-a", "page-b", "page-c"):
+            client.post(
+                "/admin/keys",
+                json={"owner": owner, "max_generations": 1},
+                headers={"X-API-Key": master_key},
+            )
+
+        first = client.get(
+            "/admin/keys",
+            params={"limit": 2},
+            headers={"X-API-Key": master_key},
+        ).json()
+        assert len(first) == 2
+
+        second = client.get(
+            "/admin/keys",
+            params={"limit": 2, "after": first[-1]["id"]},
+            headers={"X-API-Key": master_key},
+        ).json()
+        assert second
+        assert not {key["id"] for key in first} & {key["id"] for key in second}
+        assert "key_hash" not in first[0]
+
     def test_revoke_api_key(self, client, master_key):
         """Revoking an API key should work."""
         # First create a key
@@ -113,6 +138,49 @@ class TestAPIKeyManagement:
 class TestJobManagement:
     """Tests for job management endpoints."""
 
+    def test_get_job_etag(self, client, api_key, sample_pdf, test_dirs):
+        """Job details should carry an ETag and answer a matching If-None-Match with 304."""
+        import os
+        import time
+
+        from adt_press_backend.main import job_manager
+
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/jobs",
+                files={"pdf": ("etag.pdf", f, "application/pdf")},
+                data={
+                    "label": "etag-job",
+                    "config": json.dumps({"run_output_dir": os.path.join(test_dirs["output"], "etag-job")}),
+                },
+                headers={"X-API-Key": api_key},
+            )
+        assert response.status_code == 200
+        job_id = response.json()["id"]
+
+        # Wait for the (mocked) pipeline, so the job no longer changes;
+        # polled directly so the wait doesn't spend rate limit tokens
+        for _ in range(300):
+            if job_manager.get_job(job_id).status in ("completed", "failed"):
+                break
+            time.sleep(0.05)
+
+        first = client.get(f"/jobs/{job_id}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        cached = client.get(f"/jobs/{job_id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        weak = client.get(f"/jobs/{job_id}", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert weak.status_code == 304
+
+        stale = client.get(f"/jobs/{job_id}", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == first.json()
+
     def test_list_jobs_empty(self, client):
         """Listing jobs should work even when empty."""
         response = client.get("/jobs")
@@ -150,6 +218,40 @@ class TestJobManagement:
         assert response.status_code == 400
         assert "PDF" in response.json()["detail"]
 
+    def test_create_job_queue_full_is_free(self, client, master_key, sample_pdf):
+        """A 503 for a full queue should neither charge quota nor keep the upload."""
+        from adt_press_backend.main import UPLOAD_STAGING_DIR, job_manager
+
+        created = client.post(
+            "/admin/keys",
+            json={"owner": "queue-full", "max_generations": 5},
+            headers={"X-API-Key": master_key},
+        ).json()
+        uploads_before = set(UPLOAD_STAGING_DIR.iterdir())
+
+        # Hold every pending slot so the queue is full
+        held = 0
+        while job_manager._pending.acquire(blocking=False):
+            held += 1
+        try:
+            with open(sample_pdf, "rb") as f:
+                response = client.post(
+                    "/jobs",
+                    files={"pdf": ("test.pdf", f, "application/pdf")},
+                    data={"label": "queue-full", "config": "{}"},
+                    headers={"X-API-Key": created["api_key"]},
+                )
+        finally:
+            for _ in range(held):
+                job_manager._pending.release()
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "30"
+        keys = client.get("/admin/keys", headers={"X-API-Key": master_key}).json()
+        record = next(key for key in keys if key["id"] == created["record"]["id"])
+        assert record["current_generations"] == 0
+        assert set(UPLOAD_STAGING_DIR.iterdir()) == uploads_before
+
 
 class TestPlateManagement:
     """Tests for plate management endpoints."""
@@ -273,6 +375,116 @@ class TestDownload:
         assert response.status_code == 404
 
 
+class TestJobOutputs:
+    """Tests for the /jobs/{job_id}/outputs/{path} endpoint."""
+
+    def test_symlink_out_of_output_dir_is_rejected(self, client, api_key, sample_pdf, test_dirs, tmp_path):
+        """A symlink inside the job's directory must not serve files outside it."""
+        import os
+        import time
+
+        from adt_press_backend.main import job_manager
+
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/jobs",
+                files={"pdf": ("outputs.pdf", f, "application/pdf")},
+                data={
+                    "label": "outputs-job",
+                    "config": json.dumps({"run_output_dir": os.path.join(test_dirs["output"], "outputs-job")}),
+                },
+                headers={"X-API-Key": api_key},
+            )
+        assert response.status_code == 200
+        job_id = response.json()["id"]
+        for _ in range(300):
+            if job_manager.get_job(job_id).status in ("completed", "failed"):
+                break
+            time.sleep(0.05)
+
+        output_dir = job_manager.get_output_dir(job_id)
+        (output_dir / "page.html").write_text("<p>inside</p>")
+        secret = tmp_path / "secret.txt"
+        secret.write_text("outside")
+        (output_dir / "escape.txt").symlink_to(secret)
+
+        inside = client.get(f"/jobs/{job_id}/outputs/page.html")
+        assert inside.status_code == 200
+        assert inside.text == "<p>inside</p>"
+
+        escaped = client.get(f"/jobs/{job_id}/outputs/escape.txt")
+        assert escaped.status_code == 400
+
+
+class TestAccessLevels:
+    """Tests for the per-route access levels applied by AuthRateLimitMiddleware."""
+
+    def test_list_jobs_is_public(self, client):
+        """GET /jobs should only be rate limited, not require a key."""
+        response = client.get("/jobs")
+        assert response.status_code == 200
+
+    def test_create_job_without_key(self, client, sample_pdf):
+        """POST /jobs without a key should be refused with a FastAPI-style body."""
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/jobs",
+                files={"pdf": ("test.pdf", f, "application/pdf")},
+                data={"label": "no-key", "config": "{}"},
+            )
+        assert response.status_code == 401
+        assert response.json() == {"detail": "API Key required for this endpoint (Header: X-API-Key)"}
+
+    def test_create_job_with_invalid_key(self, client, sample_pdf):
+        """POST /jobs with an unknown key should be refused."""
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/jobs",
+                files={"pdf": ("test.pdf", f, "application/pdf")},
+                data={"label": "bad-key", "config": "{}"},
+                headers={"X-API-Key": "adt_not-a-real-key"},
+            )
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid or inactive API Key"}
+
+    def test_create_job_without_quota(self, client, master_key, sample_pdf):
+        """POST /jobs needs a key with generations left."""
+        created = client.post(
+            "/admin/keys",
+            json={"owner": "no-quota", "max_generations": 0},
+            headers={"X-API-Key": master_key},
+        ).json()
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/jobs",
+                files={"pdf": ("test.pdf", f, "application/pdf")},
+                data={"label": "no-quota", "config": "{}"},
+                headers={"X-API-Key": created["api_key"]},
+            )
+        assert response.status_code == 429
+        assert response.json() == {"detail": "Usage quota exceeded for this API Key. Please contact support."}
+
+    def test_head_uses_get_level(self, client):
+        """HEAD requests should be rate limited like the GET route they map to."""
+        from adt_press_backend.main import rate_limiter
+
+        # Public like GET /jobs, so no key is needed
+        assert client.head("/jobs").status_code not in (401, 429)
+
+        # The key identifies the bucket; spend it all
+        key = "head-level-test"
+        while rate_limiter.is_allowed(key):
+            pass
+
+        limited = client.head("/jobs", headers={"X-API-Key": key})
+        assert limited.status_code == 429
+        assert client.get("/jobs", headers={"X-API-Key": key}).json() == {
+            "detail": "Rate limit exceeded. Please slow down."
+        }
+        # Unlisted paths aren't checked at all
+        assert client.head("/healthz", headers={"X-API-Key": key}).status_code != 429
+
+
 class TestRateLimiting:
     """Tests for rate limiting behavior."""
 
@@ -283,6 +495,46 @@ class TestRateLimiting:
             response = client.get("/healthz")
             assert response.status_code == 200
 
+    def test_bucket_empties_and_refills(self):
+        """A client should be refused once its bucket is empty, then refill over time."""
+        from adt_press_backend.middleware import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=3)
+        clock = [0]
+        limiter._now_ms = lambda: clock[0]
+
+        assert [limiter.is_allowed("client") for _ in range(4)] == [True, True, True, False]
+        # Other clients have their own buckets
+        assert limiter.is_allowed("other-client")
+
+        # Three per minute is one token every 20 seconds
+        clock[0] = 19_999
+        assert not limiter.is_allowed("client")
+        clock[0] = 20_000
+        assert limiter.is_allowed("client")
+        assert not limiter.is_allowed("client")
+
+    def test_cleanup_drops_full_buckets_behind_refilling_ones(self):
+        """cleanup should free a full bucket even if an older one is still refilling."""
+        from adt_press_backend.middleware import _SHARD_MASK, RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=60)
+        clock = [0]
+        limiter._now_ms = lambda: clock[0]
+
+        # Two identifiers in the same shard: the older one drained, the newer barely used
+        shard = hash("drained") & _SHARD_MASK
+        recent = next(f"recent-{i}" for i in range(10_000) if hash(f"recent-{i}") & _SHARD_MASK == shard)
+        for _ in range(60):
+            assert limiter.is_allowed("drained")
+        clock[0] = 1
+        assert limiter.is_allowed(recent)
+
+        # After two seconds the recent bucket is full again, the drained one is not
+        clock[0] = 2_000
+        limiter.cleanup()
+        assert list(limiter._shards[shard].buckets) == ["drained"]
+
 
 class TestCORS:
     """Tests for CORS configuration."""
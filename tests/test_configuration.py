@@ -0,0 +1,90 @@
+"""
+Tests for ADT Press Backend configuration merging and resolution.
+"""
+
+import pytest
+from omegaconf import OmegaConf
+
+from adt_press_backend import configuration
+from adt_press_backend.configuration import make_runtime_config, resolve_runtime_config
+
+DEFAULT_CONFIG = """\
+label: book
+output_dir: output
+run_output_dir: ${output_dir}/${label}
+cache_dir: ${run_output_dir}/cache
+model: gpt
+captions:
+  model: ${model}
+  size: 3
+page_range:
+  start: 0
+  end: 0
+"""
+
+_CACHED = (
+    configuration._load_default_config,
+    configuration._default_config_container,
+    configuration._struct_base_config,
+    configuration._default_key_dependencies,
+)
+
+
+@pytest.fixture
+def default_config(tmp_path, monkeypatch):
+    """Load defaults from a small config.yaml with chained interpolations."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(DEFAULT_CONFIG)
+    monkeypatch.setattr(configuration, "get_config_path", lambda: config_path)
+    for function in _CACHED:
+        function.cache_clear()
+    yield
+    for function in _CACHED:
+        function.cache_clear()
+
+
+def _assert_matches_full_resolve(overrides):
+    config = make_runtime_config(overrides)
+    expected = OmegaConf.to_container(config, resolve=True, enum_to_str=True)
+    assert resolve_runtime_config(config, overrides.keys()) == expected
+    return expected
+
+
+class TestResolveRuntimeConfig:
+    """resolve_runtime_config should match a full OmegaConf resolve."""
+
+    def test_override_interpolated_key(self, default_config):
+        """Overriding an interpolated key should reach the keys built on it."""
+        resolved = _assert_matches_full_resolve({"run_output_dir": "/runs/custom"})
+        assert resolved["cache_dir"] == "/runs/custom/cache"
+
+    def test_override_key_other_defaults_depend_on(self, default_config):
+        """Overriding a referenced key should re-resolve every key that depends on it."""
+        resolved = _assert_matches_full_resolve({"label": "atlas-1234", "model": "claude"})
+        assert resolved["run_output_dir"] == "output/atlas-1234"
+        assert resolved["cache_dir"] == "output/atlas-1234/cache"
+        assert resolved["captions"] == {"model": "claude", "size": 3}
+
+    def test_add_new_key(self, default_config):
+        """Dynamic keys absent from the defaults should be resolved too."""
+        resolved = _assert_matches_full_resolve({
+            "label": "atlas-1234",
+            "edit_sections": {"sec_p1_s0": "make it red"},
+            "regenerate_sections": ["sec_p2_s0"],
+        })
+        assert resolved["edit_sections"] == {"sec_p1_s0": "make it red"}
+        assert resolved["regenerate_sections"] == ["sec_p2_s0"]
+
+    def test_no_overrides(self, default_config):
+        """Without overrides the result should be the resolved defaults."""
+        _assert_matches_full_resolve({})
+
+
+class TestMakeRuntimeConfig:
+    """Tests for make_runtime_config."""
+
+    def test_does_not_modify_overrides(self, default_config):
+        """The caller's overrides should be left intact."""
+        overrides = {"label": "atlas", "edit_sections": {"sec_p1_s0": "bigger"}}
+        make_runtime_config(overrides)
+        assert overrides == {"label": "atlas", "edit_sections": {"sec_p1_s0": "bigger"}}
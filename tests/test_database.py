@@ -0,0 +1,111 @@
+"""
+Tests for ADT Press Backend job persistence and schema migrations.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+from adt_press_backend.database import SCHEMA_VERSION, JobDatabase
+
+# Schema of the first release, before PRAGMA user_version was set
+BASELINE_SCHEMA = """
+    CREATE TABLE jobs (
+        id TEXT PRIMARY KEY,
+        display_label TEXT NOT NULL,
+        effective_label TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        pdf_filename TEXT NOT NULL,
+        pdf_path TEXT NOT NULL,
+        submitted_overrides TEXT,
+        overrides TEXT,
+        resolved_config TEXT,
+        output_dir TEXT NOT NULL,
+        plate_path TEXT,
+        zip_path TEXT,
+        s3_key TEXT,
+        error TEXT,
+        events TEXT
+    );
+    CREATE INDEX idx_jobs_created_at ON jobs(created_at DESC);
+    CREATE INDEX idx_jobs_status ON jobs(status);
+"""
+
+CREATED = datetime(2025, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+UPDATED = datetime(2025, 3, 1, 12, 5, 0, tzinfo=timezone.utc)
+
+
+def _baseline_row(job_id, status, events):
+    return (
+        job_id,
+        f"Label {job_id}",
+        f"label-{job_id}",
+        status,
+        CREATED.isoformat(),
+        UPDATED.isoformat(),
+        f"{job_id}.pdf",
+        f"/uploads/{job_id}.pdf",
+        json.dumps({"page_range": {"start": 1, "end": 2}}),
+        json.dumps({"label": f"label-{job_id}"}),
+        json.dumps({"label": f"label-{job_id}", "model": "gpt"}),
+        f"/output/label-{job_id}",
+        None,
+        None,
+        None,
+        None,
+        json.dumps([
+            {"timestamp": CREATED.isoformat(), "message": message} for message in events
+        ]),
+    )
+
+
+class TestMigration:
+    """Opening a database from an older release should migrate it in place."""
+
+    def test_migrates_baseline_schema(self, tmp_path):
+        """Rows, events and configuration of a version 0 database should survive."""
+        db_path = tmp_path / "jobs.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.executemany(
+            "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                _baseline_row("a", "completed", ["Job registered.", "Pipeline finished."]),
+                _baseline_row("b", "failed", []),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        db = JobDatabase(db_path)
+        try:
+            job = db.get_job("a")
+            assert job["status"] == "completed"
+            assert job["created_at"] == CREATED
+            assert job["updated_at"] == UPDATED
+            assert job["pdf_path"] == "/uploads/a.pdf"
+            assert job["submitted_overrides"] == {"page_range": {"start": 1, "end": 2}}
+            assert job["resolved_config"] == {"label": "label-a", "model": "gpt"}
+            assert [event["message"] for event in job["events"]] == [
+                "Job registered.",
+                "Pipeline finished.",
+            ]
+            assert job["events"][0]["timestamp"] == CREATED
+
+            assert db.get_job("b")["events"] == []
+            assert [row["id"] for row in db.list_jobs_summary()] == ["a", "b"]
+
+            # New events append after the migrated ones
+            db.add_job_event("a", "Plate edited.")
+            assert db.get_job_events("a")[-1]["message"] == "Plate edited."
+        finally:
+            db.close()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        assert "events" not in columns
+        assert "resolved_config" not in columns
+        conn.close()
@@ -0,0 +1,173 @@
+"""
+Tests for ADT Press Backend job execution and plate storage.
+
+The pipeline itself is mocked (see conftest.py), so jobs complete as soon
+as they are archived.
+"""
+
+import time
+import zipfile
+
+import pytest
+
+from adt_press_backend import job_manager as job_manager_module
+from adt_press_backend.database import JobDatabase
+from adt_press_backend.job_manager import JobManager
+from adt_press_backend.models import JobStatus
+
+
+def _wait_for_job(manager, job_id, timeout=30.0):
+    """Poll a job until it finishes, returning its final detail."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        detail = manager.get_job(job_id)
+        if detail.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            return detail
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish within {timeout}s")
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    """Build JobManagers in a temporary directory, closing them afterwards."""
+    managers = []
+
+    def make(**kwargs):
+        manager = JobManager(
+            output_root=tmp_path / "output",
+            upload_root=tmp_path / "uploads",
+            db_path=tmp_path / "jobs.db",
+            **kwargs,
+        )
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def _submit(manager, tmp_path, label="test-job"):
+    pdf_path = tmp_path / f"{label}.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    summary = manager.create_job(
+        display_label=label,
+        pdf_filename=pdf_path.name,
+        pdf_path=pdf_path,
+        overrides={"run_output_dir": str(tmp_path / "output" / label)},
+    )
+    return summary.id
+
+
+class TestCreateJob:
+    """Tests for registering and starting jobs."""
+
+    def test_submit_after_close_leaves_no_job(self, make_manager, tmp_path):
+        """A job that can't be started should not stay registered as pending."""
+        manager = make_manager()
+        manager.close()
+
+        with pytest.raises(RuntimeError):
+            _submit(manager, tmp_path)
+        assert manager._jobs == {}
+        assert manager._pending.acquire(blocking=False)
+
+
+class TestWriteBehind:
+    """Tests for coalescing job field writes in the background flusher."""
+
+    def test_close_persists_coalesced_updates(self, make_manager, tmp_path):
+        """Changes still waiting for a flush should reach the database on close."""
+        # Long enough that only close() flushes
+        manager = make_manager(flush_interval=3600)
+        job_id = _wait_for_job(manager, _submit(manager, tmp_path)).id
+        manager._update_job(job_id, s3_key="jobs/first.zip", error="transient")
+        manager._update_job(job_id, s3_key="jobs/second.zip", error=None)
+        zip_path = manager._jobs[job_id].zip_path
+        manager.close()
+
+        db = JobDatabase(tmp_path / "jobs.db")
+        try:
+            row = db.get_job(job_id)
+        finally:
+            db.close()
+        assert row["status"] == JobStatus.COMPLETED
+        assert row["s3_key"] == "jobs/second.zip"
+        assert row["error"] is None
+        assert row["zip_path"] == str(zip_path)
+
+
+class TestArchive:
+    """Tests for the archive of a finished job."""
+
+    def test_archive_contains_configuration(self, make_manager, tmp_path):
+        """Configuration files are written before the run, so the archive always has them."""
+        manager = make_manager()
+        job_id = _wait_for_job(manager, _submit(manager, tmp_path)).id
+        record = manager._jobs[job_id]
+        assert record.status == JobStatus.COMPLETED, record.error
+
+        with zipfile.ZipFile(record.zip_path) as archive:
+            names = {name.rsplit("/", 1)[-1] for name in archive.namelist()}
+        assert {"config.yaml", "submitted_overrides.json", "effective_overrides.json"} <= names
+
+
+class TestPlateCache:
+    """Tests for serving plates from the in-memory cache."""
+
+    def test_saved_plate_is_served(self, make_manager, tmp_path):
+        """A saved plate should be served, from the cache, byte for byte."""
+        manager = make_manager()
+        job_id = _wait_for_job(manager, _submit(manager, tmp_path)).id
+
+        manager.save_plate(job_id, {"sections": [{"id": "sec_p1_s0"}]})
+        first = manager.load_plate_bytes(job_id)
+        assert manager.load_plate_bytes(job_id) is first
+        assert manager.load_plate(job_id) == {"sections": [{"id": "sec_p1_s0"}]}
+
+    def test_plate_changed_on_disk_is_reread(self, make_manager, tmp_path):
+        """Edits made to plate.json outside the API should not be masked by the cache."""
+        manager = make_manager()
+        job_id = _wait_for_job(manager, _submit(manager, tmp_path)).id
+        plate_path = manager.save_plate(job_id, {"sections": []})
+        manager.load_plate_bytes(job_id)
+
+        plate_path.write_bytes(b'{"sections": ["edited"]}')
+        assert manager.load_plate_bytes(job_id) == b'{"sections": ["edited"]}'
+        assert manager.load_plate(job_id) == {"sections": ["edited"]}
+
+
+class TestProcessExecution:
+    """Tests for running pipelines in worker processes."""
+
+    @pytest.fixture(autouse=True)
+    def stub_pipeline(self, monkeypatch):
+        # Worker processes start fresh and can't see the mocked adt_press
+        # modules, so they run a builtin that takes the config YAML instead
+        monkeypatch.setattr(job_manager_module, "_run_pipeline_from_yaml", len)
+
+    def test_job_completes(self, make_manager, tmp_path):
+        """Jobs should run to completion in the process pool."""
+        manager = make_manager(execution_mode="process")
+        detail = _wait_for_job(manager, _submit(manager, tmp_path))
+        assert detail.status == JobStatus.COMPLETED, detail.error
+
+    def test_broken_pool_fails_job_and_is_replaced(self, make_manager, tmp_path):
+        """A dead worker should fail only the job that finds it; later jobs still run."""
+        manager = make_manager(execution_mode="process")
+        first = _wait_for_job(manager, _submit(manager, tmp_path, "first"))
+        assert first.status == JobStatus.COMPLETED, first.error
+
+        pool = manager._process_pool
+        for process in list(pool._processes.values()):
+            process.kill()
+        deadline = time.monotonic() + 10
+        while not pool._broken and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        broken = _wait_for_job(manager, _submit(manager, tmp_path, "broken"))
+        assert broken.status == JobStatus.FAILED
+        assert manager._process_pool is not pool
+
+        recovered = _wait_for_job(manager, _submit(manager, tmp_path, "recovered"))
+        assert recovered.status == JobStatus.COMPLETED, recovered.error
@@ -0,0 +1,65 @@
+"""
+Tests for ADT Press Backend API key storage and validation.
+"""
+
+import hashlib
+import sqlite3
+
+import pytest
+
+from adt_press_backend.key_manager import KEY_PREFIX, KeyManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """A fresh key database file."""
+    return str(tmp_path / "keys.db")
+
+
+def _stored_hashes(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT key_hash FROM api_keys")}
+    finally:
+        conn.close()
+
+
+class TestBloomFilter:
+    """Tests for rejecting unknown keys through the bloom filter."""
+
+    def test_unknown_key_is_rejected(self, db_path):
+        """A well-formed key that was never issued should not validate."""
+        km = KeyManager(db_path)
+        km.create_key("bloom-user", max_generations=1)
+        assert km.validate_key(KEY_PREFIX + "x" * 43) is None
+
+    def test_key_created_by_another_instance(self, db_path):
+        """Keys stored by another process should validate once it has committed them."""
+        km = KeyManager(db_path)
+        # Populates this instance's filter (and its data_version) without the new key
+        assert km.validate_key(KEY_PREFIX + "x" * 43) is None
+
+        raw_key, record = KeyManager(db_path).create_key("other-worker", max_generations=1)
+        assert km.validate_key(raw_key).id == record["id"]
+
+
+class TestLegacyHashes:
+    """Tests for keys stored under their pre-BLAKE2b SHA-256 hash."""
+
+    def test_legacy_sha256_key_is_upgraded(self, db_path):
+        """A key stored under its SHA-256 hash should validate and be re-hashed."""
+        km = KeyManager(db_path)
+        raw_key, record = km.create_key("legacy-user", max_generations=1)
+        legacy_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE api_keys SET key_hash = ? WHERE id = ?", (legacy_hash, record["id"]))
+        conn.commit()
+        conn.close()
+
+        # A new instance builds its filter from the legacy hash only
+        upgraded = KeyManager(db_path)
+        assert upgraded.validate_key(raw_key).id == record["id"]
+        assert _stored_hashes(db_path) == {upgraded._hash_key(raw_key)}
+
+        # Later validations find the key under its new hash
+        assert KeyManager(db_path).validate_key(raw_key).id == record["id"]
@@ -0,0 +1,30 @@
+"""
+Tests for ADT Press Backend job archives.
+"""
+
+import zipfile
+
+from adt_press_backend.s3_service import zip_directory
+
+
+class TestZipDirectory:
+    """Tests for zip_directory."""
+
+    def test_precompressed_files_are_stored(self, tmp_path):
+        """Images are stored as-is while text is deflated."""
+        source = tmp_path / "job"
+        (source / "images").mkdir(parents=True)
+        (source / "images" / "page1.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 8)
+        (source / "images" / "cover.JPG").write_bytes(b"\xff\xd8" + bytes(range(256)) * 8)
+        (source / "page1.html").write_text("<p>text</p>" * 200)
+
+        zip_path = zip_directory(source, tmp_path / "job")
+        assert zip_path == tmp_path / "job.zip"
+
+        with zipfile.ZipFile(zip_path) as archive:
+            infos = {info.filename: info for info in archive.infolist()}
+            assert infos["job/images/page1.png"].compress_type == zipfile.ZIP_STORED
+            assert infos["job/images/cover.JPG"].compress_type == zipfile.ZIP_STORED
+            assert infos["job/page1.html"].compress_type == zipfile.ZIP_DEFLATED
+            assert archive.read("job/page1.html") == (source / "page1.html").read_bytes()
+            assert archive.read("job/images/page1.png") == (source / "images" / "page1.png").read_bytes()
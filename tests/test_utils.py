@@ -0,0 +1,69 @@
+"""
+Tests for ADT Press Backend file and naming helpers.
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from adt_press_backend.utils import split_extension, write_file
+
+
+class TestWriteFile:
+    """Tests for write_file."""
+
+    def test_concurrent_atomic_writes(self, tmp_path):
+        """Concurrent atomic writes to one path should all succeed and leave no temp files."""
+        path = tmp_path / "plate.json"
+        errors = []
+
+        def write(value: int) -> None:
+            try:
+                for _ in range(50):
+                    write_file(path, str(value).encode() * 64, atomic=True)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in tmp_path.iterdir()] == ["plate.json"]
+        assert len(set(path.read_bytes())) == 1
+
+
+class TestSplitExtension:
+    """Tests for split_extension."""
+
+    @pytest.mark.parametrize("filename", [
+        "document.pdf",
+        "/path/to/file.tar.gz",
+        "REPORT.PDF",
+        "no_extension",
+        "",
+        ".",
+        "..",
+        "..pdf",
+        ".pdf",
+        ".bashrc",
+        "file.",
+        "file..",
+        "a.b.",
+        "dir/",
+        "dir/file.pdf/",
+        "dir/.",
+        "dir/./",
+        "dir/..",
+        "/",
+        "//",
+        ". .pdf",
+        "back\\slash.pdf",
+    ])
+    def test_matches_path(self, filename):
+        """The split should be exactly Path's stem and suffix."""
+        path = Path(filename)
+        assert split_extension(filename) == (path.stem, path.suffix)
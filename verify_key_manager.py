@@ -1,62 +1,108 @@
 
+import argparse
 import sys
+import time
 from pathlib import Path
-# Add src to path
-sys.path.append('src')
 
-from adt_press_backend.key_manager import KeyManager
+try:
+    # Installed (pip install -e . / uv sync): imports use cached bytecode
+    from adt_press_backend.key_manager import KeyManager
+except ModuleNotFoundError:
+    # Fall back to this checkout's source tree, wherever the script runs from
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+    from adt_press_backend.key_manager import KeyManager
 
-def test_key_manager():
-    print("Initializing KeyManager...")
-    # Use a test DB file
-    km = KeyManager(db_path="data/test_adt_press.db")
+# Progress output; --quiet turns it off for repeated runs
+VERBOSE = True
+
+def say(message, *args):
+    # Formatting is deferred, so quiet runs never build the messages
+    if VERBOSE:
+        print(message % args if args else message)
+
+def _expect(condition, message):
+    # Unlike assert, this still checks under python -O; the message is only
+    # used on failure
+    if not condition:
+        raise AssertionError(message)
+
+def test_key_manager(db_path=":memory:"):
+    say("Initializing KeyManager...")
+    # In memory by default: no disk I/O and nothing to clean up afterwards
+    km = KeyManager(db_path=db_path)
     
     # 1. Create Key
-    print("\n1. Creating API Key for 'TestUser' with quota 3...")
+    say("\n1. Creating API Key for 'TestUser' with quota 3...")
     raw_key, record = km.create_key("TestUser", max_generations=3)
-    print(f"   Created Key: {raw_key}")
-    print(f"   Record: {record}")
+    say("   Created Key: %s", raw_key)
+    say("   Record: %s", record)
     
-    assert record['max_generations'] == 3
-    assert record['current_generations'] == 0
+    _expect(
+        (record['max_generations'], record['current_generations']) == (3, 0),
+        "new key should have a quota of 3 and no usage",
+    )
     
     # 2. Validate Key
-    print("\n2. Validating Key...")
+    say("\n2. Validating Key...")
     valid_record = km.validate_key(raw_key)
-    assert valid_record is not None
-    assert valid_record.id == record['id']
-    print("   Validation Successful!")
+    _expect(valid_record is not None, "new key should validate")
+    _expect(valid_record.id == record['id'], "validated record should be the new key's")
+    say("   Validation Successful!")
     
     # 3. Check Quota & Increment
-    print("\n3. Testing Quota Increment...")
+    say("\n3. Testing Quota Increment...")
     key_id = record['id']
     
-    # Gen 1
-    assert km.check_quota(key_id) is True
-    assert km.increment_usage(key_id) is True
-    print("   Gen 1: Allowed")
-    
-    # Gen 2
-    assert km.increment_usage(key_id) is True
-    print("   Gen 2: Allowed")
+    quota = record['max_generations']
+    for i in range(quota):
+        _expect(km.check_quota(key_id) is True, "key should have quota left")
+        _expect(km.increment_usage(key_id) is True, "a generation within the quota should be allowed")
+        say("   Gen %d: Allowed%s", i + 1, " (Limit Reached)" if i + 1 == quota else "")
     
-    # Gen 3
-    assert km.increment_usage(key_id) is True
-    print("   Gen 3: Allowed (Limit Reached)")
-    
-    # Gen 4 (Should Fail)
+    # One more (Should Fail)
     allowed = km.increment_usage(key_id)
-    print(f"   Gen 4: {allowed} (Expected False)")
-    assert allowed is False
+    say("   Gen %d: %s (Expected False)", quota + 1, allowed)
+    _expect(allowed is False, "a generation past the quota should be refused")
+    
+    # Several generations in one UPDATE ... RETURNING
+    say("\n   Testing bulk increment...")
+    _, bulk_record = km.create_key("BulkUser", max_generations=3)
+    _expect(km.bulk_increment(bulk_record['id'], 2) == 2, "bulk increment should return the new usage")
+    _expect(km.bulk_increment(bulk_record['id'], 2) is None, "a bulk increment past the quota should be refused")
+    _expect(km.bulk_increment(bulk_record['id']) == 3, "a refused bulk increment should not be recorded")
+    say("   Bulk increment respects the quota")
     
     # 4. Revocation
-    print("\n4. Testing Revocation...")
+    say("\n4. Testing Revocation...")
     km.revoke_key(key_id)
     valid_record = km.validate_key(raw_key)
-    assert valid_record is None
-    print("   Revocation Successful (Key no longer validates)")
+    _expect(valid_record is None, "revoked key should not validate")
+    say("   Revocation Successful (Key no longer validates)")
     
-    print("\n✅ All KeyManager tests passed!")
+    say("\n✅ All KeyManager tests passed!")
+
+def stress_create_keys(n, db_path=":memory:"):
+    say("\nCreating %d keys in one batch...", n)
+    km = KeyManager(db_path=db_path)
+    start = time.perf_counter()
+    created = km.create_keys([(f"StressUser{i}", 1) for i in range(n)])
+    elapsed = time.perf_counter() - start
+    say("   %d keys in %.3fs (%.0f keys/s)", n, elapsed, n / elapsed)
+
+    _expect(len({raw_key for raw_key, _ in created}) == n, "batch keys should be unique")
+    for raw_key, record in created[:: max(1, n // 100)]:
+        _expect(km.validate_key(raw_key).id == record["id"], "batch keys should validate")
+    say("   Sampled keys validate")
 
 if __name__ == "__main__":
-    test_key_manager()
+    parser = argparse.ArgumentParser()
+    # Runs against an in-memory database unless --db names a file, e.g. to
+    # check WAL mode and the read-only connections
+    parser.add_argument("--db", default=":memory:", help="database file to test against")
+    parser.add_argument("--n", type=int, default=0, help="also bulk-create N keys")
+    parser.add_argument("--quiet", action="store_true", help="only report failures")
+    args = parser.parse_args()
+    VERBOSE = not args.quiet
+    test_key_manager(db_path=args.db)
+    if args.n:
+        stress_create_keys(args.n, db_path=args.db)